@@ -9,6 +9,7 @@ from flask_jeroboam.models import InboundModel as InboundModel
 from flask_jeroboam.models import OutboundModel as OutboundModel
 from flask_jeroboam.view_arguments.functions import Body as Body
 from flask_jeroboam.view_arguments.functions import Cookie as Cookie
+from flask_jeroboam.view_arguments.functions import Depends as Depends
 from flask_jeroboam.view_arguments.functions import File as File
 from flask_jeroboam.view_arguments.functions import Form as Form
 from flask_jeroboam.view_arguments.functions import Header as Header
@@ -1,6 +1,16 @@
+import hashlib
+from collections.abc import Mapping
+from typing import Any
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from flask_jeroboam._constants import (
+    DEFAULT_BACKGROUND_QUEUE_SIZE,
+    DEFAULT_IDEMPOTENCY_TTL,
+    DEFAULT_UPLOAD_SPOOL_SIZE,
+    VALIDATION_ERRORS_MODES,
+)
 from flask_jeroboam.openapi.models.openapi import Server
 
 
@@ -20,8 +30,43 @@ class JeroboamConfig(BaseSettings):
     JEROBOAM_OPENAPI_URL: str | None = Field(default="/docs")
 
     JEROBOAM_REGISTER_ERROR_HANDLERS: bool | None = Field(default=True)
+    JEROBOAM_VALIDATION_ERRORS: str | None = Field(default="all")
+    JEROBOAM_MAX_VALIDATION_ERRORS: int | None = Field(default=None)
+    JEROBOAM_VALIDATION_ERRORS_CONTEXT: bool | None = Field(default=True)
+    JEROBOAM_MAX_BODY_SIZE: int | None = Field(default=None)
+    JEROBOAM_UPLOAD_SPOOL_SIZE: int | None = Field(default=DEFAULT_UPLOAD_SPOOL_SIZE)
+    JEROBOAM_MAX_UPLOAD_SIZE: int | None = Field(default=None)
+    JEROBOAM_UPLOAD_HASH: str | None = Field(default=None)
+    JEROBOAM_MAX_FORM_FIELDS: int | None = Field(default=None)
+    JEROBOAM_PERSISTENT_EVENT_LOOP: bool | None = Field(default=True)
+    JEROBOAM_ASGI_MAX_WORKERS: int | None = Field(default=None)
+    JEROBOAM_BACKGROUND_WORKERS: int | None = Field(default=None)
+    JEROBOAM_BACKGROUND_QUEUE_SIZE: int | None = Field(
+        default=DEFAULT_BACKGROUND_QUEUE_SIZE
+    )
+    JEROBOAM_RATE_LIMIT_STORAGE: str | None = Field(default=None)
+    JEROBOAM_IDEMPOTENCY_TTL: int | None = Field(default=DEFAULT_IDEMPOTENCY_TTL)
 
     @classmethod
     def load(cls) -> "JeroboamConfig":
         """Load config."""
         return cls.model_validate({})
+
+
+def validate_config(config: Mapping[str, Any]) -> None:
+    """Check the configuration values their type alone cannot validate."""
+    mode = config.get("JEROBOAM_VALIDATION_ERRORS")
+    if mode not in VALIDATION_ERRORS_MODES | {None}:
+        raise ValueError(
+            "JEROBOAM_VALIDATION_ERRORS must be one of "
+            f"{sorted(VALIDATION_ERRORS_MODES)}, not {mode!r}."
+        )
+    hash_name = config.get("JEROBOAM_UPLOAD_HASH")
+    if hash_name is not None:
+        try:
+            hashlib.new(hash_name)
+        except ValueError:
+            raise ValueError(
+                "JEROBOAM_UPLOAD_HASH must name a hashlib algorithm, "
+                f"not {hash_name!r}."
+            ) from None
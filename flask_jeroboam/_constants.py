@@ -1,4 +1,5 @@
 from enum import Enum
+from uuid import UUID
 
 
 class MethodEnum(str, Enum):
@@ -12,6 +13,11 @@ class MethodEnum(str, Enum):
 
 
 REF_PREFIX = "#/components/schemas/"
+VALIDATION_ERRORS_MODES = {"all", "first"}
+DEFAULT_UPLOAD_SPOOL_SIZE = 500 * 1024
+DEFAULT_BACKGROUND_QUEUE_SIZE = 1024
+DEFAULT_IDEMPOTENCY_TTL = 24 * 60 * 60
+DEFAULT_COALESCE_TIMEOUT = 30
 METHODS_WITH_BODY = {"POST", "PUT", "PATCH", "DELETE"}
 NO_BODY_STATUS_CODES = {"204", "205", "304"}
 
@@ -65,3 +71,21 @@ METHODS_DEFAULT_STATUS_CODE = {
 }
 
 NO_BODY_STATUS_CODES = {"204", "205", "304"}
+
+# Python type produced by each builtin werkzeug converter.
+PATH_CONVERTER_TYPES: dict[str, type] = {
+    "default": str,
+    "string": str,
+    "path": str,
+    "any": str,
+    "int": int,
+    "float": float,
+    "uuid": UUID,
+}
+
+# Converter given to untyped rule segments when deriving them from annotations.
+# float is left out on purpose: werkzeug's FloatConverter rejects "42".
+ANNOTATION_PATH_CONVERTERS: dict[type, str] = {
+    int: "int(signed=True)",
+    UUID: "uuid",
+}
@@ -0,0 +1,109 @@
+"""A long-lived event loop to run async views from sync request threads.
+
+Flask bridges each call to an async view with asgiref, which runs it on an
+event loop of its own. Running them all on a single persistent loop saves
+that setup, and lets loop-bound resources like connection pools outlive a
+request.
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from functools import partial, wraps
+from typing import Any
+
+
+def _copy_outcome(future: Future, task: asyncio.Task) -> None:
+    """Report the outcome of a task to the future a request thread waits on."""
+    if task.cancelled():
+        future.cancel()
+    elif (error := task.exception()) is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(task.result())
+
+
+class AsyncExecutor:
+    """An event loop running forever on a dedicated daemon thread.
+
+    The loop is started on first use, and again in forked worker processes,
+    which do not inherit its thread. Under an ASGI server, the executor is
+    attached to the server's loop instead.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._attached = False
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running event loop, started if needed."""
+        if self._loop is None or self._pid != os.getpid():
+            with self._lock:
+                if self._loop is None or self._pid != os.getpid():
+                    self._start()
+        assert self._loop is not None  # noqa: S101
+        return self._loop
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=loop.run_forever, name="jeroboam-event-loop", daemon=True
+        )
+        self._thread.start()
+        self._loop, self._pid = loop, os.getpid()
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Run coroutines on a loop running on the current thread.
+
+        The loop is not owned by the executor: closing it only detaches it.
+        """
+        if self._loop is loop:
+            return
+        with self._lock:
+            self.close()
+            self._loop, self._pid = loop, os.getpid()
+            self._thread, self._attached = threading.current_thread(), True
+
+    def submit(self, coroutine: Coroutine) -> Any:
+        """Run a coroutine on the loop and block until it returns.
+
+        It runs in a copy of the caller's context, so that Flask's request and
+        app contexts remain available to it.
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("Cannot block the event loop on its own thread.")
+        loop = self.loop
+        future: Future = Future()
+
+        def start() -> None:
+            task = loop.create_task(coroutine)
+            task.add_done_callback(partial(_copy_outcome, future))
+
+        loop.call_soon_threadsafe(start, context=contextvars.copy_context())
+        return future.result()
+
+    def wrap(self, func: Callable[..., Coroutine]) -> Callable[..., Any]:
+        """Make an async function callable from sync code, through the loop."""
+
+        @wraps(func)
+        def run(*args: Any, **kwargs: Any) -> Any:
+            return self.submit(func(*args, **kwargs))
+
+        return run
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread to finish."""
+        if self._loop is not None and self._thread is not None and not self._attached:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+        self._loop = self._thread = None
+        self._attached = False
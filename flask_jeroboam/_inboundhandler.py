@@ -1,15 +1,35 @@
 import inspect
 import re
 import typing as t
-from collections.abc import Callable
-from functools import wraps
+from collections.abc import Awaitable, Callable
+from functools import partial, wraps
 from typing import Any
 
+from flask import request
 from pydantic import BaseModel, create_model
-from pydantic_core import PydanticUndefined
+from pydantic_core import PydanticUndefined, to_json
 from typing_extensions import ParamSpec
+from werkzeug.exceptions import RequestEntityTooLarge, UnsupportedMediaType
 
-from flask_jeroboam._utils import _lenient_issubclass, get_typed_signature
+from flask_jeroboam._constants import (
+    ANNOTATION_PATH_CONVERTERS,
+    DEFAULT_COALESCE_TIMEOUT,
+    VALIDATION_ERRORS_MODES,
+)
+from flask_jeroboam._utils import (
+    _lenient_issubclass,
+    _unwrap_optional,
+    get_typed_signature,
+)
+from flask_jeroboam.background import BackgroundTasks
+from flask_jeroboam.caching import ResponseCache
+from flask_jeroboam.coalescing import Coalescer
+from flask_jeroboam.dependencies import (
+    Dependency,
+    DependencyGraph,
+    SolvedDependency,
+    check_acyclic,
+)
 from flask_jeroboam.exceptions import InvalidRequest
 from flask_jeroboam.typing import JeroboamResponseReturnValue, JeroboamRouteCallable
 from flask_jeroboam.view_arguments.arguments import (
@@ -19,7 +39,12 @@ from flask_jeroboam.view_arguments.arguments import (
     get_argument_class,
 )
 from flask_jeroboam.view_arguments.functions import Body, File, Form
-from flask_jeroboam.view_arguments.solved import SolvedArgument
+from flask_jeroboam.view_arguments.solved import (
+    SolvedArgument,
+    SolvedBodyArgument,
+    SolvedPathArgument,
+)
+from flask_jeroboam.wrapper import current_app
 
 F = t.TypeVar("F", bound=t.Callable[..., t.Any])
 R = t.TypeVar("R", bound=t.Any)
@@ -28,6 +53,7 @@ T = t.TypeVar("T", bound=t.Any)
 
 
 pattern = r"(.*)\[(.+)\]$"
+rule_variable_pattern = re.compile(r"<(?:(\w+)(?:\([^)]*\))?:)?(\w+)>")
 
 
 def _unpack_body_values(body_value: dict) -> dict:
@@ -55,15 +81,49 @@ class InboundHandler:
     # And Moving away from the decorator scheme which feels obstrusive sometimes.
     """
 
-    def __init__(self, view_func: Callable, main_http_verb: str, rule: str):
+    def __init__(
+        self,
+        view_func: Callable,
+        main_http_verb: str,
+        rule: str,
+        derive_path_converters: bool = False,
+        validation_errors: str | None = None,
+        max_body_size: int | None = None,
+        coalesce: bool = False,
+        coalesce_timeout: float = DEFAULT_COALESCE_TIMEOUT,
+        cache_ttl: float | None = None,
+        stale_while_revalidate: float = 0,
+    ):
+        if validation_errors not in VALIDATION_ERRORS_MODES | {None}:
+            raise ValueError(
+                f"validation_errors must be one of {sorted(VALIDATION_ERRORS_MODES)}"
+                f", not {validation_errors!r}."
+            )
+        if (coalesce or cache_ttl is not None) and main_http_verb != "GET":
+            raise ValueError(
+                "Only GET routes can be coalesced or cached, "
+                f"not {main_http_verb} ones."
+            )
+        self.coalescer = Coalescer(coalesce_timeout) if coalesce else None
+        self.response_cache = (
+            ResponseCache(cache_ttl, stale_while_revalidate)
+            if cache_ttl is not None
+            else None
+        )
+        self.validation_errors = validation_errors
+        self.max_body_size = max_body_size
         self.main_http_verb = main_http_verb
         self.default_param_location = self._solve_default_params_location(
             main_http_verb
         )
         self.rule = rule
-        self.path_param_names = set(re.findall(r"<(?:\w*:)?(\w*?)>", rule))
+        self.path_converters: dict[str, str] = {
+            name: converter or "default"
+            for converter, name in rule_variable_pattern.findall(rule)
+        }
+        self.path_param_names = set(self.path_converters)
         self.query_params: list[SolvedArgument] = []
-        self.path_params: list[SolvedArgument] = []
+        self.path_params: list[SolvedPathArgument] = []
         self.header_params: list[SolvedArgument] = []
         self.cookie_params: list[SolvedArgument] = []
         self.body_params: list[SolvedArgument] = []
@@ -71,7 +131,17 @@ class InboundHandler:
         self.file_params: list[SolvedArgument] = []
         self.other_params: list[SolvedArgument] = []
         self.locations_to_visit: set[ArgumentLocation] = set()
+        self.view_argument_names: list[str] = []
+        self.background_tasks_names: list[str] = []
+        self.dependencies: dict[str, SolvedDependency] = {}
+        self._solved_dependencies: dict[Callable, SolvedDependency] = {}
+        self._solving: list[Callable] = []
+        self._argument_names: set[str] = set()
         self._solve_params(view_func)
+        self.dependency_graph = DependencyGraph(self.dependencies)
+        if derive_path_converters:
+            self._derive_path_converters()
+        self._bind_path_converters()
         self._check_compliance()
         self._body_field: SolvedArgument | None = None
 
@@ -106,6 +176,22 @@ class InboundHandler:
         """Check if the InboundHandler has any Configured Parameters."""
         return len(self.locations_to_visit) > 0
 
+    @property
+    def has_dependencies(self) -> bool:
+        """Check if the view function has any dependencies."""
+        return len(self.dependencies) > 0
+
+    @property
+    def needs_handling(self) -> bool:
+        """Check if the view function needs the InboundHandler at all."""
+        return (
+            self.is_valid
+            or self.has_dependencies
+            or bool(self.background_tasks_names)
+            or self.coalescer is not None
+            or self.response_cache is not None
+        )
+
     @property
     def has_request_body(self) -> bool:
         """Check if the InboundHandler has any Configured Parameters."""
@@ -162,10 +248,7 @@ class InboundHandler:
         field_defs: dict[str, Any] = {}
         for argument in self.body_arguments:
             argument.embed = any_embed
-            if argument.required:
-                field_defs[argument.name] = (argument.annotation, ...)
-            else:
-                field_defs[argument.name] = (argument.annotation, argument.default)
+            field_defs[argument.name] = argument.field_definition
         BodyModel: type[BaseModel] = create_model(model_name, **field_defs)  # noqa: N806
         body_field_info = self._solve_body_field_info()
         return SolvedArgument.specialize(
@@ -182,13 +265,139 @@ class InboundHandler:
 
         @wraps(view_func)
         def wrapper(*args, **kwargs) -> JeroboamResponseReturnValue:
+            self.check_request_body()
             inbound_values, errors = self._parse_and_validate_inbound_data(**kwargs)
             if errors:
                 raise InvalidRequest(errors)
-            return view_func(*args, **inbound_values)
+            return self._respond(view_func, args, inbound_values)
 
         return wrapper
 
+    async def handle_async(
+        self,
+        view_func: Callable[..., Awaitable[JeroboamResponseReturnValue]],
+        view_args: dict,
+    ) -> JeroboamResponseReturnValue:
+        """Inject inbound data into an async view, awaiting it on the running loop.
+
+        Coalesced and cached routes are not handled here, as their view may be
+        called from another thread than the request's.
+        """
+        self.check_request_body()
+        inbound_values, errors = self._parse_and_validate_inbound_data(**view_args)
+        if errors:
+            raise InvalidRequest(errors)
+        tasks = self._add_background_tasks(inbound_values)
+        if self.has_dependencies:
+            values = self._view_values(inbound_values)
+            values.update(await self.dependency_graph.solve_async(inbound_values))
+            inbound_values = values
+        return self._attach(tasks, await view_func(**inbound_values))
+
+    def _respond(
+        self, view_func: JeroboamRouteCallable, args: tuple, inbound_values: dict
+    ) -> JeroboamResponseReturnValue:
+        """Call the view, unless its response is cached or already being computed.
+
+        Cached responses are refreshed through the coalescer, if any.
+        """
+        call: Callable[[], Any] = partial(
+            self._call_view, view_func, args, inbound_values
+        )
+        if self.coalescer is None and self.response_cache is None:
+            return call()
+        key = self._coalescing_key(inbound_values)
+        if self.coalescer is not None:
+            call = partial(self.coalescer.run, key, call)
+        if self.response_cache is not None:
+            return self.response_cache.serve(key, call)
+        return call()
+
+    def _call_view(
+        self, view_func: JeroboamRouteCallable, args: tuple, inbound_values: dict
+    ) -> JeroboamResponseReturnValue:
+        """Call the view with its validated arguments, and what it depends on."""
+        tasks = self._add_background_tasks(inbound_values)
+        if self.has_dependencies:
+            inbound_values = self._inject_dependencies(inbound_values)
+        # view_func is the outbound wrapper, which already awaits async views.
+        return self._attach(tasks, view_func(*args, **inbound_values))
+
+    @staticmethod
+    def _attach(
+        tasks: BackgroundTasks | None, response: Any
+    ) -> JeroboamResponseReturnValue:
+        """Run the background tasks, if any, once the response is sent."""
+        if tasks is None:
+            return response
+        return current_app.background_runner.attach(
+            tasks, current_app.make_response(response)
+        )
+
+    @staticmethod
+    def _coalescing_key(inbound_values: dict) -> bytes:
+        """Tell apart requests by their validated arguments and Accept header."""
+        return to_json(
+            [request.headers.get("Accept"), inbound_values], serialize_unknown=True
+        )
+
+    def _add_background_tasks(self, inbound_values: dict) -> BackgroundTasks | None:
+        """Give the request's BackgroundTasks to the arguments asking for it.
+
+        They only run if the view returns without raising.
+        """
+        if not self.background_tasks_names:
+            return None
+        tasks = BackgroundTasks()
+        inbound_values.update(dict.fromkeys(self.background_tasks_names, tasks))
+        return tasks
+
+    def _inject_dependencies(self, inbound_values: dict) -> dict:
+        """Keep the view's own arguments and add the results of its dependencies.
+
+        Dependencies only run once the whole request has been validated.
+        """
+        values = self._view_values(inbound_values)
+        values.update(self.dependency_graph.solve(inbound_values))
+        return values
+
+    def _view_values(self, inbound_values: dict) -> dict:
+        """The inbound values the view itself takes, leaving out dependencies'."""
+        return {name: inbound_values[name] for name in self.view_argument_names}
+
+    def check_request_body(self) -> None:
+        """Reject bodies the route cannot decode, or too large, before reading them."""
+        if self.has_request_body:
+            self._check_media_type()
+            self._limit_body_size()
+
+    def _limit_body_size(self) -> None:
+        """Reject request bodies larger than the route's limit with a 413.
+
+        The route option takes precedence over the JEROBOAM_MAX_BODY_SIZE
+        configuration. A declared Content-Length is checked before anything is
+        read. Bodies without one (chunked) are capped as they stream in: reading
+        past the limit, while parsing them, raises the 413. Nothing is read here,
+        so that multipart uploads still spool to disk.
+        """
+        limit = self.max_body_size
+        if limit is None:
+            limit = current_app.config.get("JEROBOAM_MAX_BODY_SIZE")
+        if limit is None:
+            return
+        if request.content_length is not None and request.content_length > limit:
+            raise RequestEntityTooLarge
+        # Werkzeug rejects bodies reaching the cap, not only those exceeding it.
+        request.max_content_length = limit + 1
+
+    def _check_media_type(self) -> None:
+        """Reject bodies the route has no decoder for with a 415, unread."""
+        body_field = self.body_field(self.rule)
+        if isinstance(body_field, SolvedBodyArgument) and not body_field.accepts(
+            request.mimetype
+        ):
+            raise UnsupportedMediaType
+
     def _check_compliance(self):
         """Will warn the user if their view function does something a bit off."""
         if len(self.form_params + self.file_params) > 0 and self.main_http_verb not in {
@@ -205,16 +414,106 @@ class InboundHandler:
                 UserWarning,
                 stacklevel=2,
             )
+        self._check_body_decoder()
+
+    def _check_body_decoder(self) -> None:
+        """Warn if the only body argument has no decoder for its media type."""
+        if len(self.body_arguments) != 1 or not self.body_params:
+            return
+        argument = self.body_params[0]
+        if isinstance(argument, SolvedBodyArgument) and not argument.accepts(
+            argument.media_type
+        ):
+            import warnings
+
+            warnings.warn(
+                f"No body decoder is registered for {argument.media_type!r}: "
+                "requests will be rejected with a 415. Register one with "
+                "flask_jeroboam.decoders.register_body_decoder.",
+                UserWarning,
+                stacklevel=2,
+            )
 
     def _solve_params(self, view_func: Callable):
         """Registering the Parameters of the View Function."""
         signature = get_typed_signature(view_func)
+        dependencies: dict[str, Dependency] = {}
         for parameter_name, parameter in signature.parameters.items():
+            if isinstance(parameter.default, Dependency):
+                dependencies[parameter_name] = parameter.default
+                continue
+            self.view_argument_names.append(parameter_name)
+            if _lenient_issubclass(parameter.annotation, BackgroundTasks):
+                self.background_tasks_names.append(parameter_name)
+                continue
             solved_param = self._solve_view_function_parameter(
                 param_name=parameter_name, param=parameter
             )
             # Check if Param is in Path (not needed for now)
             self._register_view_parameter(solved_param)
+        for parameter_name, dependency in dependencies.items():
+            self.dependencies[parameter_name] = self._solve_dependency(dependency)
+
+    def _solve_dependency(self, dependency: Dependency) -> SolvedDependency:
+        """Solve the arguments of a dependency, recursively.
+
+        Its arguments are registered alongside the view's, unless the view or
+        another dependency already declares an argument of the same name.
+        Cached dependencies are solved once and shared by all their dependents.
+        """
+        if dependency.use_cache and dependency.call in self._solved_dependencies:
+            return self._solved_dependencies[dependency.call]
+        check_acyclic(self._solving, dependency.call)
+        argument_names: list[str] = []
+        sub_dependencies: dict[str, SolvedDependency] = {}
+        signature = get_typed_signature(dependency.call)
+        for parameter_name, parameter in signature.parameters.items():
+            if isinstance(parameter.default, Dependency):
+                self._solving.append(dependency.call)
+                sub_dependencies[parameter_name] = self._solve_dependency(
+                    parameter.default
+                )
+                self._solving.pop()
+                continue
+            argument_names.append(parameter_name)
+            if _lenient_issubclass(parameter.annotation, BackgroundTasks):
+                self.background_tasks_names.append(parameter_name)
+            elif parameter_name not in self._argument_names:
+                self._register_view_parameter(
+                    self._solve_view_function_parameter(
+                        param_name=parameter_name, param=parameter
+                    )
+                )
+        solved = SolvedDependency(dependency.call, argument_names, sub_dependencies)
+        if dependency.use_cache:
+            self._solved_dependencies[dependency.call] = solved
+        return solved
+
+    def _derive_path_converters(self) -> None:
+        """Give untyped rule segments a converter derived from their annotation.
+
+        ``<item_id>`` annotated with ``int`` becomes ``<int(signed=True):item_id>``
+        so that malformed values are rejected by the router (404) before the
+        view is even dispatched.
+        """
+        for param in self.path_params:
+            converter = ANNOTATION_PATH_CONVERTERS.get(
+                _unwrap_optional(param.annotation)
+            )
+            segment = f"<{param.name}>"
+            if converter is None or segment not in self.rule:
+                continue
+            self.rule = self.rule.replace(segment, f"<{converter}:{param.name}>")
+            self.path_converters[param.name] = converter.split("(")[0]
+
+    def _bind_path_converters(self) -> None:
+        """Let path parameters know which converter feeds them."""
+        for param in self.path_params:
+            param.bind_converter(
+                self.path_converters.get(
+                    param.alias, self.path_converters.get(param.name)
+                )
+            )
 
     def _solve_view_function_parameter(
         self,
@@ -245,7 +544,10 @@ class InboundHandler:
 
         default_value = self._solve_default_value(param, ignore_default)
         # Solving Required
-        required: bool = default_value is PydanticUndefined
+        required: bool = (
+            default_value is PydanticUndefined
+            and getattr(view_param, "default_factory", None) is None
+        )
         annotation = param.annotation if param.annotation != param.empty else Any
 
         return SolvedArgument.specialize(
@@ -274,7 +576,9 @@ class InboundHandler:
     ) -> Any:
         default_value: Any = getattr(param.default, "default", param.default)
         if (
-            default_value in {param.empty, Ellipsis, PydanticUndefined}
+            default_value is param.empty
+            or default_value is Ellipsis
+            or default_value is PydanticUndefined
             or ignore_default
         ):
             default_value = PydanticUndefined
@@ -288,7 +592,8 @@ class InboundHandler:
         """
         assert solved_parameter.location is not None  # noqa: S101
         self.locations_to_visit.add(solved_parameter.location)
-        {
+        self._argument_names.add(solved_parameter.name)
+        location_lists: dict[ArgumentLocation, list] = {
             ArgumentLocation.query: self.query_params,
             ArgumentLocation.path: self.path_params,
             ArgumentLocation.header: self.header_params,
@@ -296,18 +601,42 @@ class InboundHandler:
             ArgumentLocation.form: self.form_params,
             ArgumentLocation.cookie: self.cookie_params,
             ArgumentLocation.file: self.file_params,
-        }.get(solved_parameter.location, self.other_params).append(solved_parameter)
+        }
+        location_lists.get(solved_parameter.location, self.other_params).append(
+            solved_parameter
+        )
+
+    @property
+    def fails_fast(self) -> bool:
+        """Whether validation stops at the first error.
+
+        The route option takes precedence over the JEROBOAM_VALIDATION_ERRORS
+        configuration. Needs an application context.
+        """
+        mode = self.validation_errors or current_app.config.get(
+            "JEROBOAM_VALIDATION_ERRORS", "all"
+        )
+        return mode == "first"
 
     def _parse_and_validate_inbound_data(self, **kwargs) -> tuple[dict, list[dict]]:
-        """Parse and Validate the request Inbound data."""
-        errors = []
-        values = {}
+        """Parse and Validate the request Inbound data.
+
+        When failing fast, the first error is returned as soon as it is found:
+        remaining parameters are not validated and the body is not even parsed.
+        """
+        fails_fast = self.fails_fast
+        errors: list[dict] = []
+        values: dict = {}
         for param in self.parameters:
             values_, errors_ = param.validate_request()
+            if errors_ and fails_fast:
+                return values, errors_[:1]
             errors.extend(errors_)
             values.update(values_)
         if body_field := self.body_field(self.rule):
             body_value, body_errors = body_field.validate_request()
+            if fails_fast:
+                body_errors = body_errors[:1]
             errors.extend(body_errors)
             if len(self.body_arguments) > 1:
                 values.update(_unpack_body_values(body_value))
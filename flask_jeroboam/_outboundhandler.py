@@ -1,16 +1,19 @@
 import dataclasses
-import traceback
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from functools import wraps
 from typing import Any, TypeVar
 
-from flask import Response
+from flask import Response, request
 from flask.globals import current_app
 from pydantic import BaseModel, RootModel, ValidationError
 from typing_extensions import ParamSpec
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.exceptions import NotAcceptable
+from werkzeug.http import parse_accept_header
 
 from flask_jeroboam._constants import METHODS_DEFAULT_STATUS_CODE, NO_BODY_STATUS_CODES
 from flask_jeroboam._utils import get_typed_return_annotation
+from flask_jeroboam.encoders import ResponseEncoder, get_response_encoder
 from flask_jeroboam.exceptions import ResponseValidationError
 from flask_jeroboam.responses import JSONResponse
 from flask_jeroboam.typing import (
@@ -29,6 +32,9 @@ from flask_jeroboam.typing import (
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Distinct Accept headers whose negotiation is memoized, per route.
+MAX_NEGOTIATED_ACCEPT_HEADERS = 256
+
 
 class OutboundHandler:
     """The OutboundHandler handles outbound data of a request.
@@ -59,6 +65,15 @@ class OutboundHandler:
         self.response_description = options.pop(
             "response_description", "Successful Response"
         )
+        self.produces, self._encoders = self._solve_produces(
+            options.pop("produces", None)
+        )
+        self._negotiated: dict[str, str] = {}
+        if self._encoders:
+            self._negotiated = {"": self.produces[0], "*/*": self.produces[0]}
+            self._negotiated.update(
+                {media_type: media_type for media_type in self.produces}
+            )
 
     @property
     def latent_status_code(self) -> int:
@@ -72,40 +87,56 @@ class OutboundHandler:
 
         @wraps(view_func)
         def outbound_handling(*args: Any, **kwargs: Any) -> JeroboamResponseReturnValue:
-            """Coordinating the outbound data handling.
-
-            It starts by executing the view_func with the given args and kwargs.
-            At this point, the inbound handling has already parsed, validated
-            and injected the incoming data in agrs and kwargs, provided it was
-            configured to do so.
-            If the initial response is already a well-formed Response object,
-            it is returned as is.
-            If not, it solve status code, serialize the content and finally
-            build a Response object with it.
-            It may raise a ValidationError if the outgoing data is not valid.
-
-            Credits: this algorithm and subalgorithms are inspired by FastAPI.
-            """
-            initial_return_value = current_app.ensure_sync(view_func)(*args, **kwargs)
-            if issubclass(initial_return_value.__class__, Response):
-                return initial_return_value
-            (
-                returned_body,
-                returned_status_code,
-                headers,
-            ) = self._unpack_view_function_return_value(initial_return_value)
-            solved_status_code = self._solve_status_code(returned_status_code)
-            if self._status_code_forbids_body(solved_status_code):
-                return self._build_response(
-                    status_code=solved_status_code, headers=headers
-                )
-            if self.response_model is None:
-                return returned_body, solved_status_code, headers
-            content = self._serialize_content(returned_body)
-            return self._build_response(content, solved_status_code, headers=headers)
+            return self.handle(current_app.ensure_sync(view_func)(*args, **kwargs))
+
+        return outbound_handling
+
+    def add_async_outbound_handling_to(
+        self, view_func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[JeroboamResponseReturnValue]]:
+        """Add outbound handling to an async view function, awaiting it."""
+
+        @wraps(view_func)
+        async def outbound_handling(
+            *args: Any, **kwargs: Any
+        ) -> JeroboamResponseReturnValue:
+            return self.handle(await view_func(*args, **kwargs))
 
         return outbound_handling
 
+    def handle(
+        self, initial_return_value: JeroboamResponseReturnValue
+    ) -> JeroboamResponseReturnValue:
+        """Coordinating the outbound data handling.
+
+        It starts from the return value of the view function. At this point,
+        the inbound handling has already parsed, validated and injected the
+        incoming data in args and kwargs, provided it was configured to do so.
+        If the initial response is already a well-formed Response object,
+        it is returned as is.
+        If not, it solve status code, serialize the content and finally
+        build a Response object with it.
+        It may raise a ValidationError if the outgoing data is not valid.
+
+        Credits: this algorithm and subalgorithms are inspired by FastAPI.
+        """
+        if issubclass(initial_return_value.__class__, Response):
+            return initial_return_value
+        (
+            returned_body,
+            returned_status_code,
+            headers,
+        ) = self._unpack_view_function_return_value(initial_return_value)
+        solved_status_code = self._solve_status_code(returned_status_code)
+        if self._status_code_forbids_body(solved_status_code):
+            return self._build_response(status_code=solved_status_code, headers=headers)
+        if self.response_model is None:
+            return returned_body, solved_status_code, headers
+        content, mimetype = self._encode(self._validate_content(returned_body))
+        return self._build_response(
+            content, solved_status_code, headers=headers, mimetype=mimetype
+        )
+
     def _unpack_view_function_return_value(
         self, initial_return_value: JeroboamResponseReturnValue
     ) -> tuple[JeroboamBodyType, int | None, HeadersValue | None]:
@@ -176,6 +207,55 @@ class OutboundHandler:
             )
         return response_model
 
+    def _solve_produces(
+        self, produces: list[str] | None
+    ) -> tuple[list[str], dict[str, ResponseEncoder]]:
+        """Bind the encoders of the media types the route produces.
+
+        Without ``produces``, the route keeps producing its response class'
+        mimetype, without negotiation.
+        """
+        if produces is None:
+            default_mimetype = getattr(self.response_class, "default_mimetype", None)
+            return ([default_mimetype] if default_mimetype else []), {}
+        if self.response_model is None:
+            raise ValueError("produces requires a response_model.")
+        if not produces:
+            raise ValueError("produces must list at least one media type.")
+        encoders = {
+            media_type: encoder
+            for media_type in produces
+            if (encoder := get_response_encoder(media_type)) is not None
+        }
+        unknown = [media_type for media_type in produces if media_type not in encoders]
+        if unknown:
+            raise ValueError(f"No response encoder is registered for {unknown}.")
+        return list(produces), encoders
+
+    def _negotiate(self, accept: str) -> str:
+        """Pick the produced media type best matching an Accept header.
+
+        The outcome is memoized per distinct header value, so that parsing and
+        matching only happen the first few times a route sees a given client.
+        """
+        media_type = self._negotiated.get(accept)
+        if media_type is None:
+            media_type = parse_accept_header(accept, MIMEAccept).best_match(
+                self.produces
+            )
+            if media_type is None:
+                raise NotAcceptable
+            if len(self._negotiated) < MAX_NEGOTIATED_ACCEPT_HEADERS:
+                self._negotiated[accept] = media_type
+        return media_type
+
+    def _encode(self, validated: BaseModel) -> tuple[str | bytes, str | None]:
+        """Encode the validated content, in the negotiated media type if any."""
+        if not self._encoders:
+            return validated.model_dump_json(by_alias=True), None
+        media_type = self._negotiate(request.headers.get("Accept", ""))
+        return self._encoders[media_type](validated), media_type
+
     def _solve_default_status_code_by_http_verb(
         self, http_verb: str, configured_status_code: int | None
     ) -> int | None:
@@ -221,8 +301,8 @@ class OutboundHandler:
         ]
         return candidates[0]
 
-    def _serialize_content(self, content: JeroboamBodyType) -> Any:
-        """Serialize the content of the response.
+    def _validate_content(self, content: JeroboamBodyType) -> BaseModel:
+        """Validate the content of the response against the response model.
 
         # TODO: Algo de Sérialisation du Content de la Réponse.
         # Called only when we have a response_model
@@ -247,10 +327,8 @@ class OutboundHandler:
         try:
             validated = self.response_model.model_validate(content_to_validate)
         except ValidationError as error:
-            raise ResponseValidationError(
-                "A validation", error, traceback.format_exc()
-            ) from error
-        return validated.model_dump_json(by_alias=True)
+            raise ResponseValidationError("A validation", error) from error
+        return validated
 
     def _adapt_datastructure_of(
         self, content: JeroboamBodyType
@@ -276,15 +354,21 @@ class OutboundHandler:
 
     def _build_response(
         self,
-        content: str | None = None,
+        content: str | bytes | None = None,
         status_code: int | None = None,
         headers: HeadersValue | None = None,
+        mimetype: str | None = None,
     ) -> Response:
         """Make a Response Object from content and status code, and passed_headers."""
         # Do we replace with a check on content is None ?
         if content is None:
             return self.response_class(status=status_code, headers=headers)
-        return self.response_class(content, status=status_code, headers=headers)
+        response = self.response_class(
+            content, status=status_code, headers=headers, mimetype=mimetype
+        )
+        if len(self._encoders) > 1:
+            response.vary.add("Accept")
+        return response
 
     def _status_code_forbids_body(self, status_code: int) -> bool:
         """Check if the status code allows a body.
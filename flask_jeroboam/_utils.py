@@ -4,12 +4,39 @@ Credits: this is essentially a fork of FastAPI's own utils.py
 Original Source Code at https://github.com/tiangolo/fastapi
 """
 
+import datetime
 import inspect
 import re
 import types
 import typing
 from collections.abc import Callable
+from copy import deepcopy
+from decimal import Decimal
+from enum import Enum
+from functools import partial
 from typing import Any, Union, get_args, get_origin
+from uuid import UUID
+
+from pydantic_core import PydanticUndefined
+
+BRACKET_KEY_PATTERN = re.compile(r"(.*)\[(.+)\]$")
+
+IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    frozenset,
+    Enum,
+    Decimal,
+    UUID,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
 
 
 def _lenient_issubclass(cls: Any, class_or_tuple: Any) -> bool:
@@ -66,6 +93,41 @@ def _unwrap_optional(annotation: Any) -> Any:
     return annotation
 
 
+def _is_immutable(value: Any) -> bool:
+    """Check if a value can be safely shared between requests."""
+    if isinstance(value, tuple):
+        return all(_is_immutable(item) for item in value)
+    return isinstance(value, IMMUTABLE_TYPES)
+
+
+def _solve_default_factory(
+    default: Any, default_factory: Callable[[], Any] | None = None
+) -> Callable[[], Any] | None:
+    """Classify a default once, so that filling a missing parameter is cheap.
+
+    Immutable defaults are shared, flat containers are shallow-copied and
+    anything else falls back to a deepcopy. A default_factory takes precedence.
+    Returns None when there is no default at all.
+    """
+    if default_factory is not None:
+        return default_factory
+    if default is PydanticUndefined:
+        return None
+    if _is_immutable(default):
+        return lambda: default
+    if isinstance(default, (list, set, dict)) and all(
+        _is_immutable(item)
+        for item in (default.values() if isinstance(default, dict) else default)
+    ):
+        return default.copy
+    return partial(deepcopy, default)
+
+
+def _is_sequence_annotation(annotation: Any) -> bool:
+    """Check if an annotation, once unwrapped from Optional, is a sequence."""
+    return get_origin(_unwrap_optional(annotation)) in (list, tuple, set, frozenset)
+
+
 def is_sequence_field(field) -> bool:
     """Check if a field is a sequence field."""
     from typing import get_origin
@@ -76,19 +138,23 @@ def is_sequence_field(field) -> bool:
     return get_origin(annotation) in (list, tuple, set, frozenset)
 
 
-def _rename_query_params_keys(self, inbound_dict: dict, pattern: str) -> dict:
-    """Rename keys in a dictionary."""
-    frozen_inbound_dict = inbound_dict.copy()
-    for old_key, value in frozen_inbound_dict.items():
-        match = re.match(pattern, old_key)
-        if match is not None:
-            new_key = f"{match[1]}[]"
-            new_value = {match[2]: value}
-            new_array = inbound_dict.get(new_key, [])
-            new_array.append(new_value)
-            inbound_dict[new_key] = new_array
-            del inbound_dict[old_key]
-    return inbound_dict
+def _rename_query_params_keys(
+    self, inbound_dict: dict, pattern: str | re.Pattern = BRACKET_KEY_PATTERN
+) -> dict:
+    """Group ``name[key]=value`` entries into a ``name[]`` list of one-item dicts.
+
+    Done in a single pass, with the pattern compiled once per call (re.compile
+    is a no-op on an already compiled pattern).
+    """
+    match_key = re.compile(pattern).match
+    renamed: dict = {}
+    for key, value in inbound_dict.items():
+        match = match_key(key)
+        if match is None:
+            renamed[key] = value
+        else:
+            renamed.setdefault(f"{match[1]}[]", []).append({match[2]: value})
+    return renamed
 
 
 def _throw_away_falthy_values(
@@ -0,0 +1,332 @@
+"""An ASGI entry point for Jeroboam apps.
+
+Serve an app with any ASGI server, e.g. ``uvicorn module:app.asgi_app``.
+Request bodies are read from the server asynchronously, and response bodies
+streamed back to it chunk by chunk. Flask's request pipeline being
+synchronous, it runs on a bounded thread pool. Async views are awaited on the
+server's own event loop, their thread going back to the pool meanwhile: only
+Flask's hooks, before and after them, run on the pool.
+"""
+
+import asyncio
+import contextvars
+import sys
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import IO, TYPE_CHECKING, Any
+
+from flask.ctx import RequestContext
+from flask.signals import request_started
+from werkzeug.exceptions import HTTPException
+from werkzeug.wsgi import get_content_length
+
+from flask_jeroboam.datastructures import SpooledUpload
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask_jeroboam.jeroboam import Jeroboam
+    from flask_jeroboam.view import JeroboamView
+
+Scope = dict[str, Any]
+Message = dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+def _headers_environ(headers: Iterable[tuple[bytes, bytes]]) -> dict[str, str]:
+    """Turn ASGI headers into CGI variables, joining repeated ones.
+
+    Names with an underscore are dropped, as WSGI servers do, since they could
+    not be told apart from the same names with a dash.
+    """
+    environ: dict[str, str] = {}
+    for name, value in headers:
+        if b"_" in name:
+            continue
+        key = name.decode("latin1").upper().replace("-", "_")
+        if key not in {"CONTENT_TYPE", "CONTENT_LENGTH"}:
+            key = f"HTTP_{key}"
+        decoded = value.decode("latin1")
+        if key in environ:
+            separator = "; " if key == "HTTP_COOKIE" else ","
+            decoded = f"{environ[key]}{separator}{decoded}"
+        environ[key] = decoded
+    return environ
+
+
+def _build_environ(scope: Scope) -> dict[str, Any]:
+    """Build the WSGI environ of an ASGI http scope, but for its input."""
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    return {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root_path.encode().decode("latin1"),
+        "PATH_INFO": path.encode().decode("latin1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input_terminated": True,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+        "asgi.scope": scope,
+        **_headers_environ(scope.get("headers", [])),
+    }
+
+
+def _start_response(start: Message) -> Callable[..., None]:
+    """A WSGI start_response, keeping the response start message it is given."""
+
+    def start_response(status: str, headers: list, exc_info: Any = None) -> None:
+        start.update(
+            type="http.response.start",
+            status=int(status.split(" ", 1)[0]),
+            headers=[
+                (name.lower().encode("latin1"), value.encode("latin1"))
+                for name, value in headers
+            ],
+        )
+
+    return start_response
+
+
+class ASGIApp:
+    """Serve a Jeroboam app under an ASGI server.
+
+    The size of the thread pool running the request pipeline is read from
+    JEROBOAM_ASGI_MAX_WORKERS when the first request comes in.
+    """
+
+    def __init__(self, app: "Jeroboam") -> None:
+        self.app = app
+        self._pool: ThreadPoolExecutor | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+        else:
+            raise RuntimeError(f"Unsupported ASGI scope type: {scope['type']}.")
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """The thread pool running the request pipeline."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.app.config.get("JEROBOAM_ASGI_MAX_WORKERS"),
+                thread_name_prefix="jeroboam-asgi",
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Release the thread pool and detach the server's event loop."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        self.app.async_executor.close()
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        await receive()  # lifespan.startup
+        self.app.async_executor.attach(asyncio.get_running_loop())
+        await send({"type": "lifespan.startup.complete"})
+        await receive()  # lifespan.shutdown
+        self.close()
+        await send({"type": "lifespan.shutdown.complete"})
+
+    def _view_function(self, environ: dict[str, Any]) -> Callable[..., Any] | None:
+        """The view function a request is routed to, if any."""
+        try:
+            endpoint, _ = self.app.url_map.bind_to_environ(
+                environ, server_name=self.app.config["SERVER_NAME"]
+            ).match()
+        except HTTPException:
+            return None
+        return self.app.view_functions.get(endpoint)
+
+    def _body_limit(self, view_func: Callable[..., Any] | None) -> int | None:
+        """The body size limit of the route a request is for, if it takes a body.
+
+        As for the route itself, its ``max_body_size`` option takes precedence
+        over the JEROBOAM_MAX_BODY_SIZE configuration, which also caps what is
+        read of requests no route will take.
+        """
+        limit = self.app.config.get("JEROBOAM_MAX_BODY_SIZE")
+        if view_func is None:
+            return limit
+        view = getattr(view_func, "__jeroboam_view__", None)
+        if view is None or not view.has_request_body:
+            return None
+        route_limit = view.inbound_handler.max_body_size
+        return limit if route_limit is None else route_limit
+
+    async def _read_body(
+        self, receive: Receive, environ: dict[str, Any], limit: int | None
+    ) -> IO[bytes] | None:
+        """Spool the request body, or return None if the client went away.
+
+        Bodies over the limit of their route are not read past it: the bytes
+        read so far are enough for the route to reject them with a ``413``.
+        """
+        body: IO[bytes] = SpooledUpload(  # noqa: SIM115
+            max_size=self.app.config.get("JEROBOAM_UPLOAD_SPOOL_SIZE")
+        )
+        content_length = get_content_length(environ)
+        more_body = limit is None or content_length is None or content_length <= limit
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                body.close()
+                return None
+            body.write(message.get("body", b""))
+            more_body = message.get("more_body", False) and (
+                limit is None or body.tell() <= limit
+            )
+        body.seek(0)
+        return body
+
+    def _call_wsgi(self, environ: dict[str, Any]) -> tuple[Message, Iterable[bytes]]:
+        """Run the request pipeline, on a thread of the pool."""
+        start: Message = {}
+        # Flask never uses the write callable start_response should return.
+        chunks = self.app.wsgi_app(environ, _start_response(start))  # type: ignore[arg-type]
+        return start, chunks
+
+    async def _call_awaiting(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        environ: dict[str, Any],
+        view: "JeroboamView",
+    ) -> tuple[Message, Iterable[bytes]]:
+        """Run the request pipeline around an async view awaited on the loop.
+
+        It goes as Flask's ``wsgi_app`` would, all of it within the request's
+        own context, but for the view which runs on no thread of the pool.
+        """
+        context = contextvars.copy_context()
+        ctx = self.app.request_context(environ)
+
+        def on_pool(func: Callable[..., Any], *args: Any) -> Awaitable[Any]:
+            return loop.run_in_executor(self.pool, partial(context.run, func, *args))
+
+        rv: Any = None
+        error: Exception | None = None
+        try:
+            rv = await on_pool(self._before_view, ctx)
+        except Exception as e:
+            error = e
+        if rv is None and error is None:
+            try:
+                rv = await context.run(
+                    asyncio.ensure_future,
+                    view.dispatch(**(ctx.request.view_args or {})),
+                )
+            except Exception as e:
+                error = e
+            except BaseException as e:
+                # The server gave up on the request: still tear it down.
+                await on_pool(ctx.pop, e)
+                raise
+        start: Message = {}
+        chunks = await on_pool(
+            self._after_view, ctx, environ, _start_response(start), rv, error
+        )
+        return start, chunks
+
+    def _before_view(self, ctx: RequestContext) -> Any:
+        """Push the request context, and run the hooks coming before the view.
+
+        Return what they responded with, if anything, else None.
+        """
+        ctx.push()
+        self.app._got_first_request = True
+        request_started.send(self.app, _async_wrapper=self.app.ensure_sync)
+        rv = self.app.preprocess_request()
+        rule = ctx.request.url_rule
+        automatic_options = getattr(rule, "provide_automatic_options", False)
+        if rv is None and automatic_options and ctx.request.method == "OPTIONS":
+            rv = self.app.make_default_options_response()
+        return rv
+
+    def _after_view(
+        self,
+        ctx: RequestContext,
+        environ: dict[str, Any],
+        start_response: Callable[..., None],
+        rv: Any,
+        error: Exception | None,
+    ) -> Iterable[bytes]:
+        """Turn what the view returned, or raised, into a response and pop the context.
+
+        As in Flask, errors are handled with the app's error handlers, and
+        those they do not handle end in a ``500``.
+        """
+        try:
+            try:
+                if error is not None:
+                    # Flask re-raises the errors it has no handler for with a
+                    # bare raise, which needs them to be handled on this thread.
+                    try:
+                        raise error
+                    except Exception as e:
+                        rv = self.app.handle_user_exception(e)
+                    error = None
+                response = self.app.finalize_request(rv)
+            except Exception as e:
+                error = e
+                response = self.app.handle_exception(e)
+            # Flask never uses the write callable start_response should return.
+            return response(environ, start_response)  # type: ignore[arg-type]
+        finally:
+            if error is not None and self.app.should_ignore_error(error):
+                error = None
+            ctx.pop(error)
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        loop = asyncio.get_running_loop()
+        self.app.async_executor.attach(loop)
+        environ = _build_environ(scope)
+        view_func = self._view_function(environ)
+        body = await self._read_body(receive, environ, self._body_limit(view_func))
+        if body is None:
+            return
+        with body:
+            environ["wsgi.input"] = body
+            view = getattr(view_func, "__jeroboam_view__", None)
+            if view is not None and view.is_awaitable:
+                start, chunks = await self._call_awaiting(loop, environ, view)
+            else:
+                start, chunks = await loop.run_in_executor(
+                    self.pool, self._call_wsgi, environ
+                )
+            await send(start)
+            await self._stream(loop, chunks, send)
+
+    async def _stream(
+        self, loop: asyncio.AbstractEventLoop, chunks: Iterable[bytes], send: Send
+    ) -> None:
+        """Send the response body as it is produced, then close it."""
+        iterator = iter(chunks)
+        try:
+            while (
+                chunk := await loop.run_in_executor(self.pool, next, iterator, None)
+            ) is not None:
+                if chunk:
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            if hasattr(chunks, "close"):
+                await loop.run_in_executor(self.pool, chunks.close)
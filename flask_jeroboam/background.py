@@ -0,0 +1,125 @@
+"""Background tasks run once the response has been sent.
+
+Views, and their dependencies, get a ``BackgroundTasks`` by annotating an
+argument with it. The tasks they add run when the WSGI server closes the
+response, after its body has been sent, within an app context. They run on
+the request thread, or on a bounded pool of worker threads when
+JEROBOAM_BACKGROUND_WORKERS is set.
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from flask import Response
+
+from flask_jeroboam._constants import DEFAULT_BACKGROUND_QUEUE_SIZE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask_jeroboam.jeroboam import Jeroboam
+
+
+class BackgroundTasks:
+    """The tasks a view adds to run after its response has been sent."""
+
+    def __init__(self) -> None:
+        self.tasks: list[Callable[[], Any]] = []
+
+    def add_task(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Add a call to run after the response has been sent."""
+        self.tasks.append(partial(func, *args, **kwargs))
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+
+class BackgroundRunner:
+    """Run the background tasks of an app's requests, and count them.
+
+    With JEROBOAM_BACKGROUND_WORKERS set, tasks are handed to a pool of that
+    many threads, with at most JEROBOAM_BACKGROUND_QUEUE_SIZE requests' tasks
+    waiting. Past that, they run on the request thread, which pushes back on
+    the server rather than queueing without bounds.
+    """
+
+    def __init__(self, app: "Jeroboam") -> None:
+        self.app = app
+        self._pool: ThreadPoolExecutor | None = None
+        self._slots: threading.BoundedSemaphore | None = None
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(
+            ("scheduled", "completed", "failed", "overflowed"), 0
+        )
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        """Counts of tasks scheduled, completed and failed so far.
+
+        ``pending`` tasks are scheduled but not finished yet, ``overflowed``
+        ones ran on the request thread because the queue was full.
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        counts["pending"] = counts["scheduled"] - counts["completed"] - counts["failed"]
+        return counts
+
+    def attach(self, tasks: BackgroundTasks, response: Response) -> Response:
+        """Run the tasks once the response is closed by the WSGI server."""
+        if tasks:
+            self._count("scheduled", len(tasks))
+            response.call_on_close(partial(self._dispatch, tasks))
+        return response
+
+    def close(self) -> None:
+        """Wait for queued tasks to finish and release the pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = self._slots = None
+
+    def _count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += value
+
+    def _dispatch(self, tasks: BackgroundTasks) -> None:
+        workers = self.app.config.get("JEROBOAM_BACKGROUND_WORKERS")
+        if not workers:
+            self._run(tasks)
+            return
+        pool, slots = self._get_pool(workers)
+        if not slots.acquire(blocking=False):
+            self._count("overflowed", len(tasks))
+            self._run(tasks)
+            return
+        pool.submit(self._run, tasks).add_done_callback(lambda _: slots.release())
+
+    def _get_pool(
+        self, workers: int
+    ) -> tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+        with self._lock:
+            if self._pool is None or self._slots is None:
+                self._slots = threading.BoundedSemaphore(
+                    self.app.config.get("JEROBOAM_BACKGROUND_QUEUE_SIZE")
+                    or DEFAULT_BACKGROUND_QUEUE_SIZE
+                )
+                self._pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="jeroboam-background"
+                )
+            return self._pool, self._slots
+
+    def _run(self, tasks: BackgroundTasks) -> None:
+        """Run the tasks in order, within an app context."""
+        with self.app.app_context():
+            for task in tasks.tasks:
+                self._run_task(task)
+
+    def _run_task(self, task: Callable[[], Any]) -> None:
+        """Run a task, logging its failure rather than stopping the next ones."""
+        try:
+            task()
+        except Exception:
+            self.app.logger.exception("Background task %r failed.", task)
+            self._count("failed")
+        else:
+            self._count("completed")
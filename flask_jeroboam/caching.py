@@ -0,0 +1,123 @@
+"""Stale-while-revalidate caching of responses.
+
+Routes registered with a ``cache_ttl`` keep their responses for that many
+seconds, keyed like coalesced requests by their validated arguments and
+``Accept`` header. For ``stale_while_revalidate`` more seconds, the stale
+response is still served at once, while a background worker calls the view
+again with the same arguments to refresh it.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from flask import Response, copy_current_request_context
+
+from flask_jeroboam.coalescing import (
+    Snapshot,
+    replay_response,
+    shareable,
+    snapshot_response,
+)
+from flask_jeroboam.wrapper import current_app
+
+# Distinct argument sets whose response is cached, per route.
+MAX_CACHED_RESPONSES = 1024
+
+
+@dataclass
+class _Entry:
+    snapshot: Snapshot
+    stored_at: float
+
+
+class ResponseCache:
+    """The cached responses of a route, refreshed in the background when stale.
+
+    Only responses with a status code below 400, that can be shared with other
+    clients, are cached: not those setting cookies or marked private or
+    no-store. The least recently served ones are evicted past
+    MAX_CACHED_RESPONSES.
+    """
+
+    def __init__(self, ttl: float, stale_while_revalidate: float = 0):
+        if ttl <= 0:
+            raise ValueError(f"cache_ttl must be positive, not {ttl!r}.")
+        if stale_while_revalidate < 0:
+            raise ValueError(
+                "stale_while_revalidate must be positive or zero, "
+                f"not {stale_while_revalidate!r}."
+            )
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._refreshing: set[Hashable] = set()
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def serve(self, key: Hashable, call: Callable[[], Any]) -> Response:
+        """Serve the cached response, refreshing it if stale, or call the view."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None or (
+            (age := monotonic() - entry.stored_at)
+            >= self.ttl + self.stale_while_revalidate
+        ):
+            return self._store(key, call())
+        if age >= self.ttl:
+            self._revalidate(key, call)
+        response = replay_response(entry.snapshot)
+        response.headers["Age"] = str(int(age))
+        return response
+
+    def clear(self) -> None:
+        """Forget all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Wait for ongoing refreshes to finish and release the worker."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _store(self, key: Hashable, return_value: Any) -> Response:
+        response = current_app.make_response(return_value)
+        if response.status_code < 400 and shareable(response):
+            entry = _Entry(snapshot_response(response), monotonic())
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                if len(self._entries) > MAX_CACHED_RESPONSES:
+                    self._entries.popitem(last=False)
+        return response
+
+    def _revalidate(self, key: Hashable, call: Callable[[], Any]) -> None:
+        """Have the worker refresh a stale response, unless it already does."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="jeroboam-cache"
+                )
+            pool = self._pool
+        pool.submit(copy_current_request_context(self._refresh), key, call)
+
+    def _refresh(self, key: Hashable, call: Callable[[], Any]) -> None:
+        try:
+            # Nobody else closes the refreshed response, which runs its view's
+            # background tasks.
+            self._store(key, call()).close()
+        except Exception:
+            current_app.logger.exception("Refreshing a cached response failed.")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -0,0 +1,109 @@
+"""Coalescing of identical concurrent requests.
+
+Routes registered with ``coalesce=True`` run their view once for all the
+concurrent requests sharing the same validated arguments: the first one
+runs it, the others wait for its response and get a copy of it. Only the
+validated arguments, and the ``Accept`` header, tell requests apart: views
+reading anything else from the request must not be coalesced.
+
+Waiting requests run the view themselves when the response cannot be shared,
+as when it sets a cookie, or when it takes longer than ``coalesce_timeout``
+seconds, or the time left before the route's deadline.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from flask import Response
+
+from flask_jeroboam._constants import DEFAULT_COALESCE_TIMEOUT
+from flask_jeroboam.timeouts import check_deadline, current_deadline
+from flask_jeroboam.wrapper import current_app
+
+Snapshot = tuple[bytes, int, list[tuple[str, str]]]
+
+
+def shareable(response: Response) -> bool:
+    """Whether a response can be sent to other clients than its own.
+
+    Responses setting cookies, or marked private or no-store, cannot.
+    """
+    cache_control = response.cache_control
+    return not (
+        "Set-Cookie" in response.headers
+        or cache_control.private
+        or cache_control.no_store
+    )
+
+
+def snapshot_response(response: Response) -> Snapshot:
+    """Buffer a response into what it takes to send a copy of it."""
+    return response.get_data(), response.status_code, list(response.headers.items())
+
+
+def replay_response(snapshot: Snapshot) -> Response:
+    """Build a copy of a buffered response."""
+    body, status, headers = snapshot
+    return current_app.response_class(body, status=status, headers=headers)
+
+
+class _Flight:
+    """The execution of a view that identical requests wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.snapshot: Snapshot | None = None
+        self.error: BaseException | None = None
+
+
+class Coalescer:
+    """Share the response of a view among identical concurrent requests."""
+
+    def __init__(self, timeout: float = DEFAULT_COALESCE_TIMEOUT) -> None:
+        if timeout <= 0:
+            raise ValueError(f"coalesce_timeout must be positive, not {timeout!r}.")
+        self.timeout = timeout
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: Hashable, call: Callable[[], Any]) -> Response:
+        """Call the view, or wait for the identical request already calling it.
+
+        Errors raised by the view are raised in every waiting request.
+        """
+        with self._lock:
+            leads = key not in self._flights
+            flight = self._flights.setdefault(key, _Flight())
+        if leads:
+            return self._lead(key, flight, call)
+        if not flight.done.wait(self._wait_timeout()):
+            check_deadline()
+            return current_app.make_response(call())
+        if flight.error is not None:
+            raise flight.error
+        if flight.snapshot is None:
+            return current_app.make_response(call())
+        return replay_response(flight.snapshot)
+
+    def _wait_timeout(self) -> float:
+        deadline = current_deadline()
+        if deadline is None:
+            return self.timeout
+        return min(self.timeout, deadline.remaining)
+
+    def _lead(
+        self, key: Hashable, flight: _Flight, call: Callable[[], Any]
+    ) -> Response:
+        try:
+            response = current_app.make_response(call())
+            if shareable(response):
+                flight.snapshot = snapshot_response(response)
+            return response
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
@@ -3,11 +3,116 @@
 Credits: this module is essentially a for of FastAPI's datastructures.py module.
 """
 
+import hashlib
+import mmap
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from tempfile import SpooledTemporaryFile
 from typing import Any
 
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from flask_jeroboam._constants import DEFAULT_UPLOAD_SPOOL_SIZE
+
+
+class SpooledUpload(SpooledTemporaryFile[bytes]):
+    """A SpooledTemporaryFile receiving an uploaded file as it is streamed in.
+
+    It is kept in memory up to max_size bytes, DEFAULT_UPLOAD_SPOOL_SIZE when
+    None, and rolled over to disk beyond: always, when max_size is 0. Writes
+    are counted, capped at max_file_size bytes and hashed on the fly when a
+    hashlib algorithm name is given.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        max_file_size: int | None = None,
+        hash_name: str | None = None,
+    ):
+        if max_size is None:
+            max_size = DEFAULT_UPLOAD_SPOOL_SIZE
+        super().__init__(max_size=max_size, mode="rb+")
+        if max_size == 0:
+            self.rollover()
+        self.max_file_size = max_file_size
+        self.size = 0
+        self.hash = hashlib.new(hash_name) if hash_name else None
+
+    def write(self, s: bytes) -> int:  # type: ignore[override]
+        """Count, cap and hash the chunk before spooling it."""
+        self.size += len(s)
+        if self.max_file_size is not None and self.size > self.max_file_size:
+            raise RequestEntityTooLarge
+        if self.hash is not None:
+            self.hash.update(s)
+        return super().write(s)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _buffered_copy(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    return os.write(dst_fd, os.read(src_fd, min(count, 1024 * 1024)))
+
+
+# Kernel-side copies, in order of preference, among those the platform offers.
+_ZERO_COPIERS: tuple[Callable[[int, int, int, int], int], ...] = tuple(
+    copier
+    for name, copier in (
+        ("copy_file_range", _copy_file_range),
+        ("sendfile", _sendfile),
+    )
+    if hasattr(os, name)
+)
+
+
+def _copy_with(
+    copier: Callable[[int, int, int, int], int],
+    src_fd: int,
+    dst_fd: int,
+    offset: int,
+    count: int,
+) -> int:
+    """Copy from offset until count bytes are copied, or the copier stops.
+
+    Returns the offset reached.
+    """
+    while offset < count:
+        copied = copier(src_fd, dst_fd, offset, count - offset)
+        if not copied:
+            break
+        offset += copied
+    return offset
+
+
+def _copy_fd(src_fd: int, dst_fd: int, count: int) -> int:
+    """Copy count bytes from src_fd to dst_fd, in the kernel when possible.
+
+    Each copier writes at explicit offsets, so one failing or stopping midway
+    (e.g. copy_file_range across filesystems or from special files, sendfile
+    to a file on macOS) is simply taken over by the next one from where it
+    stopped, down to a buffered copy. Returns the number of bytes copied.
+    """
+    offset = 0
+    for copier in _ZERO_COPIERS:
+        with suppress(OSError):
+            offset = _copy_with(copier, src_fd, dst_fd, offset, count)
+        if offset >= count:
+            return offset
+    return _copy_with(_buffered_copy, src_fd, dst_fd, offset, count)
 
 
 class UploadFile(FileStorage):
@@ -16,12 +121,70 @@ class UploadFile(FileStorage):
     Credits: Adaptation of FastAPI's UploadFile.
     """
 
+    @property
+    def size(self) -> int | None:
+        """Size in bytes of the upload, counted while it was streamed in."""
+        return getattr(self.stream, "size", None)
+
+    @property
+    def hexdigest(self) -> str | None:
+        """Hex digest of the upload, computed while it was streamed in.
+
+        Only available when JEROBOAM_UPLOAD_HASH names a hashlib algorithm.
+        """
+        hash_ = getattr(self.stream, "hash", None)
+        return hash_.hexdigest() if hash_ is not None else None
+
+    @property
+    def _raw_stream(self) -> Any:
+        # A SpooledTemporaryFile holds either a BytesIO or a temporary file.
+        return getattr(self.stream, "_file", self.stream)
+
+    @contextmanager
+    def mapped(self) -> Iterator[memoryview]:
+        """Give a read-only view of the content of the upload, without copying it.
+
+        In-memory uploads expose their buffer, uploads spooled to disk are
+        memory-mapped. The view, and any slice of it, must not outlive the
+        context.
+        """
+        raw = self._raw_stream
+        if hasattr(raw, "getbuffer"):
+            with raw.getbuffer() as buffer, buffer.toreadonly() as view:
+                yield view
+            return
+        raw.flush()
+        if os.fstat(raw.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+        mapping = mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ)
+        with mapping, memoryview(mapping) as view:
+            yield view
+
+    def save_to(self, dst: str | os.PathLike) -> int:
+        """Write the upload to dst, without user-space copies when possible.
+
+        In-memory uploads are written straight from their buffer. Uploads
+        spooled to disk are copied by the kernel, with copy_file_range or
+        sendfile. Returns the number of bytes written.
+        """
+        raw = self._raw_stream
+        with open(dst, "wb") as destination:
+            if hasattr(raw, "getbuffer"):
+                with raw.getbuffer() as buffer:
+                    return destination.write(buffer)
+            raw.flush()
+            count = os.fstat(raw.fileno()).st_size
+            return _copy_fd(raw.fileno(), destination.fileno(), count)
+
     @classmethod
-    def validate(cls: type["FileStorage"], v: Any) -> Any:
+    def validate(cls, v: Any) -> Any:
         """Validate the value."""
         if not isinstance(v, FileStorage):
             raise ValueError(f"Expected FileStorage, received: {type(v)}")
-        return v
+        if isinstance(v, cls):
+            return v
+        return cls(stream=v.stream, filename=v.filename, name=v.name, headers=v.headers)
 
     @classmethod
     def __get_pydantic_core_schema__(
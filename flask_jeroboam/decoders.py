@@ -0,0 +1,73 @@
+"""Body decoders for Flask-Jeroboam.
+
+A body decoder turns the body of a request into python data, ready to be
+validated. Decoders are registered by media type and bound to Body arguments
+at registration, from their ``media_type``.
+"""
+
+import csv
+import io
+from collections.abc import Callable
+from typing import Any
+
+from flask import Request
+
+from flask_jeroboam.wrapper import current_app
+
+BodyDecoder = Callable[[Request], Any]
+
+
+def decode_json(request: Request) -> Any:
+    """Decode a JSON body with the app's JSON provider."""
+    return request.get_json()
+
+
+def decode_ndjson(request: Request) -> list[Any]:
+    """Decode a newline-delimited JSON body into a list, one item per line."""
+    return [
+        current_app.json.loads(line)
+        for line in request.get_data(cache=True).splitlines()
+        if line.strip()
+    ]
+
+
+def decode_form(request: Request) -> dict[str, Any]:
+    """Decode an urlencoded body, keeping a list for repeated keys."""
+    return {
+        key: values if len(values) > 1 else values[0]
+        for key, values in request.form.lists()
+    }
+
+
+def decode_csv(request: Request) -> list[dict[str, str]]:
+    """Decode a CSV body into a list of rows keyed by the header row."""
+    return list(csv.DictReader(io.StringIO(request.get_data(as_text=True))))
+
+
+body_decoders: dict[str, BodyDecoder] = {
+    "application/json": decode_json,
+    "application/x-ndjson": decode_ndjson,
+    "application/x-www-form-urlencoded": decode_form,
+    "text/csv": decode_csv,
+}
+
+
+def register_body_decoder(media_type: str, decoder: BodyDecoder) -> None:
+    """Register the decoder of a media type, e.g. MessagePack or CBOR.
+
+    Decoders are bound when routes are registered: register yours before
+    declaring the routes that use it.
+    """
+    body_decoders[media_type] = decoder
+
+
+def get_body_decoder(media_type: str) -> BodyDecoder | None:
+    """Return the decoder of a media type.
+
+    Like Flask, any ``+json`` structured syntax suffix falls back on JSON.
+    """
+    if media_type in body_decoders:
+        return body_decoders[media_type]
+    if media_type.endswith("+json"):
+        return body_decoders["application/json"]
+    return None
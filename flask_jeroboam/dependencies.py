@@ -0,0 +1,146 @@
+"""Dependencies of view functions.
+
+A dependency is a callable whose result is injected into the view, declared
+with ``Depends``. Its own arguments are solved like those of the view: they
+are either parsed from the request or other dependencies. The resulting
+graph is solved at registration. Each dependency then runs at most once per
+request, however many others depend on it, and independent async
+dependencies are awaited concurrently.
+"""
+
+import asyncio
+import inspect
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from flask_jeroboam.wrapper import current_app
+
+
+class Dependency:
+    """A dependency declared as the default value of a view argument."""
+
+    def __init__(self, call: Callable[..., Any], use_cache: bool = True):
+        self.call = call
+        self.use_cache = use_cache
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({getattr(self.call, '__name__', self.call)})"
+
+
+class SolvedDependency:
+    """A dependency with its arguments solved at registration.
+
+    ``argument_names`` are parsed from the request, ``sub_dependencies`` are
+    the dependencies of the dependency, keyed by argument name.
+    """
+
+    def __init__(
+        self,
+        call: Callable[..., Any],
+        argument_names: list[str],
+        sub_dependencies: dict[str, "SolvedDependency"],
+    ):
+        self.call = call
+        self.argument_names = argument_names
+        self.sub_dependencies = sub_dependencies
+        self.is_async = inspect.iscoroutinefunction(call)
+
+    def kwargs(self, values: dict[str, Any], results: dict) -> dict[str, Any]:
+        """The arguments of the call, from request values and solved results."""
+        kwargs = {name: values[name] for name in self.argument_names}
+        for name, sub_dependency in self.sub_dependencies.items():
+            kwargs[name] = results[sub_dependency]
+        return kwargs
+
+
+def _name(call: Callable[..., Any]) -> str:
+    return getattr(call, "__name__", repr(call))
+
+
+def check_acyclic(chain: list[Callable[..., Any]], call: Callable[..., Any]) -> None:
+    """Raise a ValueError if call is already in the chain of its dependents."""
+    if call in chain:
+        cycle = [*chain[chain.index(call) :], call]
+        raise ValueError(
+            f"Circular dependency: {' -> '.join(_name(call) for call in cycle)}."
+        )
+
+
+def _topological_order(roots: Iterable[SolvedDependency]) -> list[SolvedDependency]:
+    """Order dependencies so that each one comes after its sub-dependencies."""
+    order: list[SolvedDependency] = []
+    visiting: list[Callable[..., Any]] = []
+
+    def visit(dependency: SolvedDependency) -> None:
+        if dependency in order:
+            return
+        check_acyclic(visiting, dependency.call)
+        visiting.append(dependency.call)
+        for sub_dependency in dependency.sub_dependencies.values():
+            visit(sub_dependency)
+        visiting.pop()
+        order.append(dependency)
+
+    for root in roots:
+        visit(root)
+    return order
+
+
+class DependencyGraph:
+    """The dependencies of a view, ordered at registration."""
+
+    def __init__(self, dependencies: dict[str, SolvedDependency]):
+        self.dependencies = dependencies
+        self.order = _topological_order(dependencies.values())
+        self.is_async = any(dependency.is_async for dependency in self.order)
+
+    def solve(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Run each dependency once and return those the view asked for.
+
+        When any of them is async, the whole graph is solved on the app's event
+        loop so that independent branches run concurrently, sync dependencies
+        running on threads, within the context of the request.
+        """
+        if self.is_async:
+            results = current_app.ensure_sync(self._solve_async)(values)
+        else:
+            results = {}
+            for dependency in self.order:
+                results[dependency] = dependency.call(
+                    **dependency.kwargs(values, results)
+                )
+        return {name: results[dep] for name, dep in self.dependencies.items()}
+
+    async def solve_async(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Solve the graph on the running event loop, rather than the app's."""
+        results = await self._solve_async(values)
+        return {name: results[dep] for name, dep in self.dependencies.items()}
+
+    async def _solve_async(self, values: dict[str, Any]) -> dict:
+        tasks: dict[SolvedDependency, asyncio.Future] = {}
+        for dependency in self.order:
+            tasks[dependency] = asyncio.ensure_future(
+                self._run(dependency, values, tasks)
+            )
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return dict(zip(tasks, outcomes, strict=True))
+
+    @staticmethod
+    async def _run(
+        dependency: SolvedDependency,
+        values: dict[str, Any],
+        tasks: dict[SolvedDependency, asyncio.Future],
+    ) -> Any:
+        """Wait for the sub-dependencies of a dependency, then run it."""
+        sub_dependencies = dependency.sub_dependencies.values()
+        await asyncio.gather(*(tasks[sub] for sub in sub_dependencies))
+        results = {sub: tasks[sub].result() for sub in sub_dependencies}
+        kwargs = dependency.kwargs(values, results)
+        if dependency.is_async:
+            return await dependency.call(**kwargs)
+        # Sync dependencies may block: keep them off the event loop, which
+        # is the server's own under ASGI.
+        return await asyncio.to_thread(dependency.call, **kwargs)
@@ -0,0 +1,73 @@
+"""Response encoders for Flask-Jeroboam.
+
+A response encoder turns the validated response model into the body of the
+response, for a given media type. Routes declaring ``produces=[...]`` pick one
+of them from the request's ``Accept`` header.
+"""
+
+import csv
+import io
+from collections.abc import Callable
+
+from pydantic import BaseModel, RootModel
+from pydantic_core import to_json, to_jsonable_python
+
+ResponseEncoder = Callable[[BaseModel], str | bytes]
+
+
+def _rows(validated: BaseModel) -> list:
+    """The items of a list response, or the response itself as a single item."""
+    if isinstance(validated, RootModel) and isinstance(validated.root, list):
+        return validated.root
+    return [validated]
+
+
+def encode_json(validated: BaseModel) -> str:
+    """Encode the response as JSON."""
+    return validated.model_dump_json(by_alias=True)
+
+
+def encode_ndjson(validated: BaseModel) -> bytes:
+    """Encode the response as newline-delimited JSON, one line per item."""
+    return b"".join(to_json(row, by_alias=True) + b"\n" for row in _rows(validated))
+
+
+def encode_csv(validated: BaseModel) -> str:
+    """Encode the response as CSV, one row per item under a header row.
+
+    The header row lists the fields of all items, in order of appearance,
+    leaving the cells of fields an item lacks empty. Items that are not
+    mappings, like numbers or strings, go in a ``value`` column.
+    """
+    rows = [
+        row if isinstance(row, dict) else {"value": row}
+        for row in to_jsonable_python(_rows(validated), by_alias=True)
+    ]
+    fieldnames = list(dict.fromkeys(field for row in rows for field in row))
+    buffer = io.StringIO()
+    if fieldnames:
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    return buffer.getvalue()
+
+
+response_encoders: dict[str, ResponseEncoder] = {
+    "application/json": encode_json,
+    "application/x-ndjson": encode_ndjson,
+    "text/csv": encode_csv,
+}
+
+
+def register_response_encoder(media_type: str, encoder: ResponseEncoder) -> None:
+    """Register the encoder of a media type, e.g. MessagePack or CBOR.
+
+    Encoders are bound when routes are registered: register yours before
+    declaring the routes that produce it.
+    """
+    response_encoders[media_type] = encoder
+
+
+def get_response_encoder(media_type: str) -> ResponseEncoder | None:
+    """Return the encoder of a media type."""
+    return response_encoders.get(media_type)
@@ -4,14 +4,39 @@ They are small wrappers around werkzeug HTTP exceptions that customize
 how the message is colllected and formatted.
 """
 
+import traceback
 from typing import TYPE_CHECKING, Any
 
+from flask import current_app
+from pydantic import TypeAdapter, ValidationError
+from typing_extensions import NotRequired, TypedDict
 from werkzeug.exceptions import BadRequest, InternalServerError, NotFound
 
+from flask_jeroboam.responses import JSONResponse
+
 if TYPE_CHECKING:  # pragma: no cover
     from flask_jeroboam.jeroboam import Jeroboam
 
 
+class ValidationErrorDetail(TypedDict):
+    """A single validation error, see VALIDATION_ERROR_DEFINITION."""
+
+    loc: list[str | int]
+    msg: str
+    type: str
+    ctx: NotRequired[dict[str, Any]]
+
+
+class HTTPValidationError(TypedDict):
+    """The payload of a 400 response, see VALIDATION_ERROR_RESPONSE_DEFINITION."""
+
+    detail: list[ValidationErrorDetail]
+
+
+# Built once: serializing error payloads is a hot path under malformed traffic.
+http_validation_error_serializer = TypeAdapter(HTTPValidationError)
+
+
 class RessourceNotFound(NotFound):
     """A slightly modified version of Werkzeug's RessourceNotFound Exception."""
 
@@ -49,23 +74,59 @@ class InvalidRequest(BadRequest):
         self.body = body
         self.response = None
 
-    def handle(self) -> tuple[dict, int]:
-        """Handle the exception and return a message to the user."""
-        return {"detail": self.error_details}, 400
+    def handle(self) -> JSONResponse:
+        """Handle the exception and return a message to the user.
+
+        The payload is serialized by a precompiled pydantic serializer. The
+        number of reported errors can be capped with
+        JEROBOAM_MAX_VALIDATION_ERRORS and their context omitted with
+        JEROBOAM_VALIDATION_ERRORS_CONTEXT.
+        """
+        details = self.error_details
+        max_errors = current_app.config.get("JEROBOAM_MAX_VALIDATION_ERRORS")
+        if max_errors is not None:
+            details = details[:max_errors]
+        exclude = None
+        if not current_app.config.get("JEROBOAM_VALIDATION_ERRORS_CONTEXT", True):
+            exclude = {"detail": {"__all__": {"ctx"}}}
+        payload = http_validation_error_serializer.dump_json(
+            {"detail": details},  # type: ignore[typeddict-item]
+            exclude=exclude,
+        )
+        return JSONResponse(payload, status=400)
 
 
 class ServerError(InternalServerError):
     """A slightly modifiedversion of Werkzeug's InternalServerError Exception."""
 
     def __init__(
-        self, msg: str, error: Exception, trace: str, context: str | None = None
+        self,
+        msg: str,
+        error: Exception,
+        trace: str | None = None,
+        context: str | None = None,
     ):
         self.msg = msg
         self.error = error
-        self.trace = trace
+        self._trace = trace
         self.context = context
         self.response = None
 
+    @property
+    def trace(self) -> str:
+        """The formatted traceback of the error.
+
+        When not given explicitly, it is only formatted from the error's
+        traceback the first time it is read.
+        """
+        if self._trace is None:
+            self._trace = "".join(
+                traceback.format_exception(
+                    type(self.error), self.error, self.error.__traceback__
+                )
+            )
+        return self._trace
+
     def __str__(self) -> str:
         return f"InternalServerError: {self.msg}"
 
@@ -80,6 +141,22 @@ class ResponseValidationError(ServerError):
     def __str__(self) -> str:
         return f"InternalServerError: {self.msg}"
 
+    @property
+    def summary(self) -> dict[str, Any]:
+        """A structured summary of the validation errors, e.g. for metrics."""
+        errors = (
+            self.error.errors(include_url=False)
+            if isinstance(self.error, ValidationError)
+            else []
+        )
+        return {
+            "model": getattr(self.error, "title", None),
+            "error_count": len(errors),
+            "errors": [
+                {"loc": list(error["loc"]), "type": error["type"]} for error in errors
+            ],
+        }
+
 
 class JeroboamError(Exception):
     """Base Exception for Flask-Jeroboam."""
@@ -90,6 +167,51 @@ def handle_404(e):
     return {"message": "Not Found"}, 404
 
 
+def handle_413(e):
+    """Simple Hanlder for 413 errors."""
+    return {"message": "Request Entity Too Large"}, 413
+
+
+def handle_415(e):
+    """Simple Hanlder for 415 errors."""
+    return {"message": "Unsupported Media Type"}, 415
+
+
+def handle_406(e):
+    """Simple Hanlder for 406 errors."""
+    return {"message": "Not Acceptable"}, 406
+
+
+def handle_409(e):
+    """Simple Hanlder for 409 errors."""
+    return {"message": "Conflict"}, 409
+
+
+def handle_422(e):
+    """Simple Hanlder for 422 errors."""
+    return {"message": "Unprocessable Entity"}, 422
+
+
+def _retry_after(e) -> dict[str, str]:
+    """The Retry-After header of an HTTP exception, if set."""
+    return {key: value for key, value in e.get_headers() if key == "Retry-After"}
+
+
+def handle_429(e):
+    """Simple Hanlder for 429 errors, keeping their Retry-After header."""
+    return {"message": "Too Many Requests"}, 429, _retry_after(e)
+
+
+def handle_503(e):
+    """Simple Hanlder for 503 errors, keeping their Retry-After header."""
+    return {"message": "Service Unavailable"}, 503, _retry_after(e)
+
+
+def handle_504(e):
+    """Simple Hanlder for 504 errors."""
+    return {"message": "Gateway Timeout"}, 504
+
+
 def handle_500(e):
     """Simple Hanlder for 500 errors."""
     return {"message": "Internal Error"}, 500
@@ -102,4 +224,12 @@ def register_error_handlers(app: "Jeroboam"):
     app.register_error_handler(ServerError, ServerError.handle)
     app.register_error_handler(ResponseValidationError, ResponseValidationError.handle)
     app.register_error_handler(404, handle_404)
+    app.register_error_handler(406, handle_406)
+    app.register_error_handler(409, handle_409)
+    app.register_error_handler(413, handle_413)
+    app.register_error_handler(415, handle_415)
+    app.register_error_handler(422, handle_422)
+    app.register_error_handler(429, handle_429)
     app.register_error_handler(500, handle_500)
+    app.register_error_handler(503, handle_503)
+    app.register_error_handler(504, handle_504)
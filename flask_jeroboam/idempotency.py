@@ -0,0 +1,195 @@
+"""Idempotent routes, replaying their response to requests sent again.
+
+Routes registered with ``idempotent=True`` keep the response to each request
+carrying an ``Idempotency-Key`` header, for JEROBOAM_IDEMPOTENCY_TTL seconds.
+Keys are scoped to the client, told apart by its IP address unless an
+``idempotency_scope`` callable reads something else from the request, and to
+the method, path and query string of the request. They remember a hash of
+its body. Requests sent again with the same key and body
+get a copy of the response, marked with an ``Idempotent-Replayed`` header,
+instead of running the view again. Requests reusing a key with another body
+are rejected with a ``422``, and those sent again while the first one is
+still running with a ``409``. Requests without the header run as usual.
+
+Idempotent routes read their body whole to hash it, within their body size
+limit, before parsing it.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from time import monotonic
+from typing import Any, NamedTuple
+
+from flask import Response, request
+from werkzeug.exceptions import Conflict, UnprocessableEntity
+
+from flask_jeroboam._constants import METHODS_WITH_BODY
+from flask_jeroboam.coalescing import Snapshot, replay_response, snapshot_response
+from flask_jeroboam.limits import _remote_address
+from flask_jeroboam.wrapper import current_app
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Keys the in-memory store remembers, across routes.
+MAX_IDEMPOTENCY_KEYS = 100_000
+
+
+class IdempotencyRecord(NamedTuple):
+    """What is kept for a key: the hash of its request's body, and its response.
+
+    The response is None while the request is running.
+    """
+
+    fingerprint: str
+    snapshot: Snapshot | None
+
+
+class IdempotencyStore:
+    """Where the responses of idempotent routes are kept, shared by an app.
+
+    Subclass it to keep them elsewhere, like a database shared by worker
+    processes, then set an instance as the ``idempotency_store`` of the app.
+    """
+
+    def claim(self, key: str, fingerprint: str) -> bool:
+        """Mark a key as in progress, unless it is already known."""
+        raise NotImplementedError
+
+    def get(self, key: str) -> IdempotencyRecord | None:
+        """What is kept for a key, if anything."""
+        raise NotImplementedError
+
+    def save(self, key: str, snapshot: Snapshot) -> None:
+        """Keep the response to the request that claimed a key."""
+        raise NotImplementedError
+
+    def release(self, key: str) -> None:
+        """Forget a key whose request failed, so that it can be retried."""
+        raise NotImplementedError
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Responses kept in the memory of the current process.
+
+    Keys are forgotten after ``ttl`` seconds, or past MAX_IDEMPOTENCY_KEYS,
+    oldest first.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, IdempotencyRecord]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def claim(self, key: str, fingerprint: str) -> bool:
+        """Mark a key as in progress, unless it is already known."""
+        now = monotonic()
+        with self._lock:
+            while self._entries and next(iter(self._entries.values()))[0] <= now:
+                self._entries.popitem(last=False)
+            if key in self._entries:
+                return False
+            self._entries[key] = (now + self.ttl, IdempotencyRecord(fingerprint, None))
+            if len(self._entries) > MAX_IDEMPOTENCY_KEYS:
+                self._entries.popitem(last=False)
+            return True
+
+    def get(self, key: str) -> IdempotencyRecord | None:
+        """What is kept for a key, if anything."""
+        with self._lock:
+            _, record = self._entries.get(key, (0, None))
+        return record
+
+    def save(self, key: str, snapshot: Snapshot) -> None:
+        """Keep the response to the request that claimed a key."""
+        with self._lock:
+            _, record = self._entries.pop(key)
+            self._entries[key] = (
+                monotonic() + self.ttl,
+                record._replace(snapshot=snapshot),
+            )
+
+    def release(self, key: str) -> None:
+        """Forget a key whose request failed, so that it can be retried."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class Idempotency:
+    """Replay the response of a route to requests sent again with the same key.
+
+    Responses are kept once the view returns, unless their status code is 500
+    or above. Requests raising an exception, like a validation error, are not
+    kept either: sending them again runs the view again.
+    """
+
+    def __init__(
+        self,
+        main_http_verb: str,
+        check_body: Callable[[], None],
+        scope: Callable[[], Any] | None = None,
+    ):
+        if main_http_verb not in METHODS_WITH_BODY:
+            raise ValueError(
+                "Only POST, PUT, PATCH and DELETE routes can be idempotent, "
+                f"not {main_http_verb} ones."
+            )
+        self.check_body = check_body
+        self.scope = scope or _remote_address
+
+    def replay_duplicates(self, view_func: Callable[..., Any]) -> Callable[..., Any]:
+        """Run the view once per idempotency key, replaying its response after."""
+
+        @wraps(view_func)
+        def idempotent(*args: Any, **kwargs: Any) -> Any:
+            idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+            if idempotency_key is None:
+                return view_func(*args, **kwargs)
+            key = (
+                f"{self.scope()} {request.method} {request.full_path} {idempotency_key}"
+            )
+            fingerprint = self._fingerprint()
+            store = current_app.idempotency_store
+            while not store.claim(key, fingerprint):
+                # The key may expire between both calls: claim it again then.
+                record = store.get(key)
+                if record is not None:
+                    return self._replay(record, fingerprint)
+            return self._run(key, view_func, args, kwargs)
+
+        return idempotent
+
+    def _fingerprint(self) -> str:
+        """Hash the body of the request, once checked against the route's limits."""
+        self.check_body()
+        return hashlib.sha256(request.get_data(cache=True)).hexdigest()
+
+    @staticmethod
+    def _run(
+        key: str, view_func: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> Response:
+        store = current_app.idempotency_store
+        try:
+            response = current_app.make_response(view_func(*args, **kwargs))
+        except BaseException:
+            store.release(key)
+            raise
+        if response.status_code < 500:
+            store.save(key, snapshot_response(response))
+        else:
+            store.release(key)
+        return response
+
+    @staticmethod
+    def _replay(record: IdempotencyRecord, fingerprint: str) -> Response:
+        if record.fingerprint != fingerprint:
+            raise UnprocessableEntity(
+                f"The {IDEMPOTENCY_HEADER} was used with another request body."
+            )
+        if record.snapshot is None:
+            raise Conflict(f"A request with the same {IDEMPOTENCY_HEADER} is running.")
+        response = replay_response(record.snapshot)
+        response.headers["Idempotent-Replayed"] = "true"
+        return response
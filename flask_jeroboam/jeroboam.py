@@ -7,17 +7,28 @@ TODO: A probably better way to override it is to override the url_rule_class
 with a custom JeroboamRule Object
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
+from functools import cached_property
 from typing import Any, Optional
 
 from flask import Flask
 from typing_extensions import TypeVar
 
-from flask_jeroboam._config import JeroboamConfig
+from flask_jeroboam._config import JeroboamConfig, validate_config
+from flask_jeroboam._executor import AsyncExecutor
+from flask_jeroboam.asgi import ASGIApp
+from flask_jeroboam.background import BackgroundRunner
 from flask_jeroboam.exceptions import register_error_handlers
+from flask_jeroboam.idempotency import IdempotencyStore, MemoryIdempotencyStore
+from flask_jeroboam.limits import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    SQLiteRateLimitBackend,
+)
 from flask_jeroboam.openapi.blueprint import register_open_api_blueprint
 from flask_jeroboam.openapi.builder import build_openapi
 from flask_jeroboam.openapi.models.openapi import OpenAPI
+from flask_jeroboam.requests import JeroboamRequest
 from flask_jeroboam.responses import JSONResponse
 from flask_jeroboam.rule import JeroboamRule
 from flask_jeroboam.scaffold import JeroboamScaffoldOverRide
@@ -32,6 +43,8 @@ class Jeroboam(JeroboamScaffoldOverRide, Flask):  # type:ignore
     route decorator.
     """
 
+    request_class = JeroboamRequest
+
     response_class = JSONResponse
 
     url_rule_class = JeroboamRule
@@ -43,14 +56,71 @@ class Jeroboam(JeroboamScaffoldOverRide, Flask):  # type:ignore
         super().__init__(*args, **kwargs)
         self.config.update(JeroboamConfig.load().model_dump())
         self._openapi: OpenAPI | None = None
+        self.async_executor = AsyncExecutor()
+        self.background_runner = BackgroundRunner(self)
 
     def init_app(self, app: Optional["Jeroboam"] = None) -> None:
         """Setup is performed after app has received all its configuration."""
+        validate_config(self.config)
         if self.config["JEROBOAM_REGISTER_ERROR_HANDLERS"]:
             register_error_handlers(self)  # type: ignore
         if self.config["JEROBOAM_REGISTER_OPENAPI"]:
             register_open_api_blueprint(self)  # type: ignore
 
+    def async_to_sync(
+        self, func: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Any]:
+        """Run async views on the app's persistent event loop.
+
+        Turn JEROBOAM_PERSISTENT_EVENT_LOOP off to fall back on Flask's
+        asgiref bridge.
+        """
+        if not self.config.get("JEROBOAM_PERSISTENT_EVENT_LOOP", True):
+            return super().async_to_sync(func)
+        return self.async_executor.wrap(func)
+
+    @cached_property
+    def asgi_app(self) -> ASGIApp:
+        """The ASGI application serving this app, e.g. ``app.asgi_app``."""
+        return ASGIApp(self)
+
+    @cached_property
+    def rate_limit_backend(self) -> RateLimitBackend:
+        """Where the token buckets of rate limited routes are kept.
+
+        In memory, unless JEROBOAM_RATE_LIMIT_STORAGE sets the path of a SQLite
+        file shared by the worker processes of the host.
+        """
+        path = self.config.get("JEROBOAM_RATE_LIMIT_STORAGE")
+        if path is None:
+            return MemoryRateLimitBackend()
+        return SQLiteRateLimitBackend(path)
+
+    @cached_property
+    def idempotency_store(self) -> IdempotencyStore:
+        """Where the responses of idempotent routes are kept, in memory."""
+        return MemoryIdempotencyStore(self.config["JEROBOAM_IDEMPOTENCY_TTL"])
+
+    @property
+    def concurrency_gauges(self) -> dict[str, dict[str, int]]:
+        """In-flight and queued requests of the routes with a max_concurrency."""
+        gauges = {}
+        for endpoint, view_func in self.view_functions.items():
+            view = getattr(view_func, "__jeroboam_view__", None)
+            if getattr(view, "concurrency_limiter", None) is not None:
+                gauges[endpoint] = view.concurrency_limiter.gauges  # type: ignore
+        return gauges
+
+    @property
+    def timed_out_requests(self) -> dict[str, int]:
+        """Requests that missed their deadline, per route with a timeout."""
+        counts = {}
+        for endpoint, view_func in self.view_functions.items():
+            view = getattr(view_func, "__jeroboam_view__", None)
+            if getattr(view, "execution_timeout", None) is not None:
+                counts[endpoint] = view.execution_timeout.timed_out  # type: ignore
+        return counts
+
     @property
     def openapi(self) -> OpenAPI:
         """Get the OpenApi object."""
@@ -6,6 +6,11 @@ from typing import Any
 from flask import Flask
 from typing_extensions import TypeVar
 
+from flask_jeroboam._executor import AsyncExecutor
+from flask_jeroboam.asgi import ASGIApp
+from flask_jeroboam.background import BackgroundRunner
+from flask_jeroboam.idempotency import IdempotencyStore
+from flask_jeroboam.limits import RateLimitBackend
 from flask_jeroboam.openapi.models.openapi import OpenAPI
 from flask_jeroboam.rule import JeroboamRule
 from flask_jeroboam.scaffold import JeroboamScaffoldOverRide
@@ -17,5 +22,12 @@ current_app: Jeroboam
 class Jeroboam(JeroboamScaffoldOverRide, Flask):  # type:ignore
     query_string_key_transformer: Callable
     openapi: OpenAPI
+    async_executor: AsyncExecutor
+    asgi_app: ASGIApp
+    background_runner: BackgroundRunner
+    rate_limit_backend: RateLimitBackend
+    idempotency_store: IdempotencyStore
+    concurrency_gauges: dict[str, dict[str, int]]
+    timed_out_requests: dict[str, int]
     def rules(self) -> list[JeroboamRule]: ...
     def init_app(self, app: Jeroboam | None = None) -> None: ...
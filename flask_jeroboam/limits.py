@@ -0,0 +1,229 @@
+"""Limits on how routes are used, set with route options.
+
+``max_concurrency`` caps the number of requests a route serves at once.
+Requests over the cap wait for a slot up to ``queue_timeout`` seconds, then
+are shed with a ``503`` and a ``Retry-After`` header, so that a slow route
+cannot monopolize the server's threads.
+
+``rate_limit`` caps the rate at which each client calls a route, with a
+token bucket per client. Clients are told apart by their IP address, or by
+the value a ``rate_limit_key`` callable reads from the request. Requests
+over the rate are rejected with a ``429`` and a ``Retry-After`` header,
+before their arguments are parsed and validated.
+"""
+
+import math
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from time import monotonic, time
+from typing import Any
+
+from flask import request
+from werkzeug.exceptions import ServiceUnavailable, TooManyRequests
+
+from flask_jeroboam.wrapper import current_app
+
+# Clients whose bucket the in-memory backend keeps, across routes.
+MAX_RATE_LIMITED_CLIENTS = 10_000
+
+_RATE_PATTERN = re.compile(r"([1-9]\d*)/([1-9]\d*)?(s|second|m|minute|h|hour|d|day)")
+_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+class ConcurrencyLimiter:
+    """Cap the concurrent requests of a route, queueing the ones over it.
+
+    Without a ``queue_timeout``, queued requests wait as long as needed.
+    """
+
+    def __init__(self, max_concurrency: int, queue_timeout: float | None = None):
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, not {max_concurrency!r}."
+            )
+        if queue_timeout is not None and queue_timeout < 0:
+            raise ValueError(
+                f"queue_timeout must be positive or None, not {queue_timeout!r}."
+            )
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self.retry_after = max(1, math.ceil(queue_timeout or 0))
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queued = 0
+
+    @property
+    def gauges(self) -> dict[str, int]:
+        """The number of requests being served and waiting for a slot."""
+        with self._lock:
+            return {"in_flight": self._in_flight, "queued": self._queued}
+
+    def limit(self, view_func: Callable[..., Any]) -> Callable[..., Any]:
+        """Run the view in a slot, shedding requests that cannot get one."""
+
+        @wraps(view_func)
+        def limited(*args: Any, **kwargs: Any) -> Any:
+            if not (self._slots.acquire(blocking=False) or self._wait_for_slot()):
+                raise ServiceUnavailable(retry_after=self.retry_after)
+            with self._lock:
+                self._in_flight += 1
+            try:
+                return view_func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                self._slots.release()
+
+        return limited
+
+    def _wait_for_slot(self) -> bool:
+        with self._lock:
+            self._queued += 1
+        try:
+            return self._slots.acquire(timeout=self.queue_timeout)
+        finally:
+            with self._lock:
+                self._queued -= 1
+
+
+def _take_token(
+    tokens: float, updated_at: float, now: float, capacity: int, refill_rate: float
+) -> tuple[float, float]:
+    """Refill a bucket, then take a token from it.
+
+    Return the tokens left, and the seconds to wait for one when there is none.
+    """
+    tokens = min(capacity, tokens + max(0.0, now - updated_at) * refill_rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / refill_rate
+
+
+class RateLimitBackend:
+    """Where token buckets are kept, shared by the routes of an app.
+
+    Subclass it to keep buckets elsewhere, then set an instance as the
+    ``rate_limit_backend`` of the app.
+    """
+
+    def take(self, key: str, capacity: int, refill_rate: float) -> float:
+        """Take a token from a bucket, or tell how many seconds to wait for one."""
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Buckets kept in the memory of the current process.
+
+    The least recently used ones are forgotten past MAX_RATE_LIMITED_CLIENTS.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: int, refill_rate: float) -> float:
+        """Take a token from a bucket, or tell how many seconds to wait for one."""
+        now = monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (capacity, now))
+            tokens, wait = _take_token(tokens, updated_at, now, capacity, refill_rate)
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > MAX_RATE_LIMITED_CLIENTS:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Buckets kept in a SQLite file, shared by the worker processes of a host.
+
+    Buckets are deleted once full again, as they then hold nothing to remember.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+
+    def take(self, key: str, capacity: int, refill_rate: float) -> float:
+        """Take a token from a bucket, or tell how many seconds to wait for one."""
+        connection = self._connection()
+        now = time()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT tokens, updated_at FROM jeroboam_rate_limits WHERE key = ?",
+                (key,),
+            ).fetchone()
+            tokens, updated_at = row or (capacity, now)
+            tokens, wait = _take_token(tokens, updated_at, now, capacity, refill_rate)
+            connection.execute(
+                "INSERT OR REPLACE INTO jeroboam_rate_limits VALUES (?, ?, ?, ?)",
+                (key, tokens, now, now + (capacity - tokens) / refill_rate),
+            )
+            connection.execute(
+                "DELETE FROM jeroboam_rate_limits WHERE full_at < ?", (now,)
+            )
+        return wait
+
+    def _connection(self) -> sqlite3.Connection:
+        """The connection of the current thread, opened on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS jeroboam_rate_limits ("
+                "key TEXT PRIMARY KEY, tokens REAL, updated_at REAL, full_at REAL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS jeroboam_rate_limits_full_at "
+                "ON jeroboam_rate_limits (full_at)"
+            )
+            self._local.connection = connection
+        return connection
+
+
+def _remote_address() -> str | None:
+    return request.remote_addr
+
+
+class RateLimiter:
+    """Cap the rate at which each client calls a route, like ``100/s``.
+
+    Rates are a number of requests per ``s``, ``m``, ``h`` or ``d`` (or
+    ``second``, ``minute``, ``hour`` and ``day``), optionally preceded by a
+    number of them, like ``5/10m``. Clients can spend the whole number at once.
+    """
+
+    def __init__(self, rate: str, key: Callable[[], Any] | None = None):
+        match = _RATE_PATTERN.fullmatch(rate.replace(" ", ""))
+        if match is None:
+            raise ValueError(
+                f"rate_limit must look like '100/s' or '5/10minute', not {rate!r}."
+            )
+        count, periods, unit = match.groups()
+        self.capacity = int(count)
+        self.period = int(periods or 1) * _PERIODS[unit[0]]
+        self.refill_rate = self.capacity / self.period
+        self.key = key or _remote_address
+
+    def limit(self, view_func: Callable[..., Any]) -> Callable[..., Any]:
+        """Reject the requests of clients calling the view too often."""
+
+        @wraps(view_func)
+        def rate_limited(*args: Any, **kwargs: Any) -> Any:
+            self.check()
+            return view_func(*args, **kwargs)
+
+        return rate_limited
+
+    def check(self) -> None:
+        """Take a token from the client's bucket, or reject the request."""
+        wait = current_app.rate_limit_backend.take(
+            f"{request.endpoint}:{self.key()}", self.capacity, self.refill_rate
+        )
+        if wait:
+            raise TooManyRequests(retry_after=max(1, math.ceil(wait)))
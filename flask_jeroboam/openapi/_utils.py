@@ -54,6 +54,15 @@ def _get_param_schema(param: "SolvedArgument") -> dict[str, Any]:
     return schema
 
 
+def _get_param_serialization(field_info: Any) -> dict[str, Any]:
+    """Document query parameters not serialized with the default form style."""
+    style = getattr(field_info, "style", "form")
+    explode = getattr(field_info, "explode", True)
+    if style == "form" and explode:
+        return {}
+    return {"style": style, "explode": explode}
+
+
 def _get_openapi_operation_parameters(
     *,
     all_route_params: "Sequence[SolvedArgument]",
@@ -75,6 +84,7 @@ def _get_openapi_operation_parameters(
             },
             keep={"name", "in", "required"},
         )
+        parameter.update(_get_param_serialization(field_info))
         parameters.append(parameter)
     return parameters
 
@@ -149,8 +159,7 @@ def _add_responses(
 ):
     definitions: dict[str, Any] = {}
     status_code = str(jeroboam_view.outbound_handler.latent_status_code)
-    current_response_class = jeroboam_view.outbound_handler.response_class
-    route_response_media_type: str | None = current_response_class.default_mimetype
+    route_response_media_types: list[str] = jeroboam_view.outbound_handler.produces
 
     _set_nested_defaults(
         original_dict=operation,
@@ -159,15 +168,16 @@ def _add_responses(
         new_value=jeroboam_view.outbound_handler.response_description,
     )
 
-    if route_response_media_type and status_code not in NO_BODY_STATUS_CODES:
-        _set_nested_defaults(
-            original_dict=operation,
-            keys=["responses", status_code, "content", route_response_media_type],
-            last_key="schema",
-            new_value=_get_response_schema(
-                jeroboam_view.outbound_handler.response_model,
-            ),
-        )
+    if status_code not in NO_BODY_STATUS_CODES:
+        for route_response_media_type in route_response_media_types:
+            _set_nested_defaults(
+                original_dict=operation,
+                keys=["responses", status_code, "content", route_response_media_type],
+                last_key="schema",
+                new_value=_get_response_schema(
+                    jeroboam_view.outbound_handler.response_model,
+                ),
+            )
 
     # TODO: possibilité de configurer le status code
     if jeroboam_view.inbound_handler.is_valid and all(
@@ -0,0 +1,81 @@
+"""Custom requests for Flask-Jeroboam."""
+
+from typing import IO, cast
+
+from flask import Request
+from werkzeug.utils import cached_property
+from werkzeug.wsgi import LimitedStream
+
+from flask_jeroboam.datastructures import SpooledUpload
+from flask_jeroboam.view_arguments._utils import _limit_form_fields
+from flask_jeroboam.wrapper import current_app
+
+
+class CappedStream(LimitedStream):
+    """A stream of unknown length raising RequestEntityTooLarge past its limit.
+
+    Werkzeug's streams only raise when read again once at their limit, which
+    reading them whole never does: the body would be silently truncated.
+    """
+
+    def readall(self) -> bytes:
+        """Read the whole stream, raising once read past the limit."""
+        out = bytearray()
+        while data := self.read(64 * 1024):
+            out.extend(data)
+        return bytes(out)
+
+
+class JeroboamRequest(Request):
+    """Subclassing Flask Request to spool uploaded files as they stream in."""
+
+    @cached_property
+    def stream(self) -> IO[bytes]:
+        """The input stream, capped by max_content_length even when read whole."""
+        if (
+            self.content_length is None
+            and self.max_content_length is not None
+            and self.environ.get("wsgi.input_terminated")
+        ):
+            return cast(
+                "IO[bytes]",
+                CappedStream(
+                    self.environ["wsgi.input"], self.max_content_length, is_max=True
+                ),
+            )
+        return super().stream
+
+    def _load_form_data(self) -> None:
+        """Parse the form, once urlencoded bodies are checked against their limit.
+
+        JEROBOAM_MAX_FORM_FIELDS is then enforced wherever the form is read,
+        not only by the single-pass parser of Form arguments.
+        """
+        max_fields = current_app.config.get("JEROBOAM_MAX_FORM_FIELDS")
+        if (
+            max_fields is not None
+            and "form" not in self.__dict__
+            and self.mimetype == "application/x-www-form-urlencoded"
+        ):
+            _limit_form_fields(self.get_data(cache=True), max_fields)
+        super()._load_form_data()
+
+    def _get_file_stream(
+        self,
+        total_content_length: int | None,
+        content_type: str | None,
+        filename: str | None = None,
+        content_length: int | None = None,
+    ) -> IO[bytes]:
+        """Give each uploaded file its own SpooledUpload.
+
+        Its in-memory threshold, size cap and hash algorithm are read from the
+        JEROBOAM_UPLOAD_SPOOL_SIZE, JEROBOAM_MAX_UPLOAD_SIZE and
+        JEROBOAM_UPLOAD_HASH configuration.
+        """
+        config = current_app.config
+        return SpooledUpload(
+            max_size=config.get("JEROBOAM_UPLOAD_SPOOL_SIZE"),
+            max_file_size=config.get("JEROBOAM_MAX_UPLOAD_SIZE"),
+            hash_name=config.get("JEROBOAM_UPLOAD_HASH"),
+        )
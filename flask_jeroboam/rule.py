@@ -5,7 +5,7 @@ from typing import Any
 
 from werkzeug.routing import Rule as FlaskRule
 
-pattern = re.compile(r"<(\w*):")
+pattern = re.compile(r"<\w*(?:\([^)]*\))?:")
 
 
 class JeroboamRule(FlaskRule):
@@ -60,7 +60,7 @@ class JeroboamScaffoldOverRide:
             if blueprint_option is not None:
                 options["include_in_openapi"] = blueprint_option
             self.add_url_rule(  # type: ignore
-                rule,
+                view.rule,
                 view.endpoint,
                 view.as_view,
                 **options,  # type: ignore
@@ -0,0 +1,121 @@
+"""Execution timeouts of routes, set with the ``timeout`` route option.
+
+Requests to a route with a ``timeout`` run under a deadline, ``timeout``
+seconds after the view is entered. Async views are cancelled by the event
+loop once it has passed. Sync views cannot be interrupted: the deadline is
+checked when they return, and cooperative code, like dependencies or
+database helpers, can check it sooner with ``check_deadline`` or read the
+time left from ``current_deadline``. Either way, the request ends with a
+``504``.
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import monotonic
+from typing import Any
+
+from werkzeug.exceptions import GatewayTimeout
+
+
+class DeadlineExceeded(GatewayTimeout):
+    """The deadline of the current request has passed."""
+
+
+class Deadline:
+    """The point in time by which a request must be done."""
+
+    def __init__(self, seconds: float):
+        self.expires_at = monotonic() + seconds
+
+    @property
+    def remaining(self) -> float:
+        """The seconds left before the deadline, zero once passed."""
+        return max(0.0, self.expires_at - monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return monotonic() >= self.expires_at
+
+
+_deadline: ContextVar[Deadline | None] = ContextVar("jeroboam_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """The deadline of the current request, if its route has a timeout."""
+    return _deadline.get()
+
+
+def check_deadline() -> None:
+    """Raise DeadlineExceeded if the deadline of the current request has passed."""
+    deadline = _deadline.get()
+    if deadline is not None and deadline.expired:
+        raise DeadlineExceeded
+
+
+class ExecutionTimeout:
+    """Run the requests of a route under a deadline, counting those missing it."""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError(f"timeout must be positive, not {seconds!r}.")
+        self.seconds = seconds
+        self._lock = threading.Lock()
+        self._timed_out = 0
+
+    @property
+    def timed_out(self) -> int:
+        """The number of requests that missed their deadline."""
+        with self._lock:
+            return self._timed_out
+
+    def limit(self, view_func: Callable[..., Any]) -> Callable[..., Any]:
+        """Run the view under a deadline, failing the request once it has passed."""
+
+        @wraps(view_func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self.deadline():
+                return view_func(*args, **kwargs)
+
+        return timed
+
+    @contextmanager
+    def deadline(self) -> Iterator[None]:
+        """Run a block under a deadline, failing the request once it has passed."""
+        token = _deadline.set(Deadline(self.seconds))
+        try:
+            yield
+            check_deadline()
+        except DeadlineExceeded:
+            with self._lock:
+                self._timed_out += 1
+            raise
+        finally:
+            _deadline.reset(token)
+
+    def cancel_after(
+        self, view_func: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """Cancel an async view when the deadline of its request passes.
+
+        Outside of a request deadline, as when cached responses are refreshed,
+        the view gets a deadline of its own.
+        """
+
+        @wraps(view_func)
+        async def cancellable(*args: Any, **kwargs: Any) -> Any:
+            deadline = _deadline.get() or Deadline(self.seconds)
+            task = asyncio.ensure_future(view_func(*args, **kwargs))
+            try:
+                done, _ = await asyncio.wait({task}, timeout=deadline.remaining)
+            finally:
+                task.cancel()
+            if not done:
+                raise DeadlineExceeded
+            return task.result()
+
+        return cancellable
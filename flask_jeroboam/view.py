@@ -1,13 +1,21 @@
 """The Route Class."""
 
-from typing import Any, TypeVar
+from collections.abc import Awaitable, Callable, Coroutine
+from contextlib import nullcontext
+from functools import cached_property
+from inspect import iscoroutinefunction
+from typing import Any, TypeVar, cast
 
 from typing_extensions import ParamSpec
 
+from flask_jeroboam._constants import DEFAULT_COALESCE_TIMEOUT
 from flask_jeroboam._inboundhandler import InboundHandler
 from flask_jeroboam._outboundhandler import OutboundHandler
+from flask_jeroboam.idempotency import Idempotency
+from flask_jeroboam.limits import ConcurrencyLimiter, RateLimiter
 from flask_jeroboam.responses import JSONResponse
-from flask_jeroboam.typing import JeroboamRouteCallable
+from flask_jeroboam.timeouts import ExecutionTimeout
+from flask_jeroboam.typing import JeroboamResponseReturnValue, JeroboamRouteCallable
 from flask_jeroboam.view_arguments.solved import SolvedArgument
 
 P = ParamSpec("P")
@@ -40,7 +48,16 @@ class JeroboamView:
         self.main_http_verb = self._solve_main_http_verb(options, original_view_func)
         configured_status_code: int | None = options.pop("status_code", None)
         self.inbound_handler = InboundHandler(
-            original_view_func, self.main_http_verb, rule
+            original_view_func,
+            self.main_http_verb,
+            rule,
+            derive_path_converters=options.pop("derive_path_converters", False),
+            validation_errors=options.pop("validation_errors", None),
+            max_body_size=options.pop("max_body_size", None),
+            coalesce=options.pop("coalesce", False),
+            coalesce_timeout=options.pop("coalesce_timeout", DEFAULT_COALESCE_TIMEOUT),
+            cache_ttl=options.pop("cache_ttl", None),
+            stale_while_revalidate=options.pop("stale_while_revalidate", 0),
         )
         self.outbound_handler = OutboundHandler(
             original_view_func,
@@ -51,8 +68,34 @@ class JeroboamView:
         )
         self.original_view_func = original_view_func
         self.include_in_openapi = options.pop("include_in_openapi", True)
+        max_concurrency = options.pop("max_concurrency", None)
+        queue_timeout = options.pop("queue_timeout", None)
+        self.concurrency_limiter = (
+            ConcurrencyLimiter(max_concurrency, queue_timeout)
+            if max_concurrency is not None
+            else None
+        )
+        rate_limit = options.pop("rate_limit", None)
+        rate_limit_key = options.pop("rate_limit_key", None)
+        self.rate_limiter = (
+            RateLimiter(rate_limit, rate_limit_key) if rate_limit is not None else None
+        )
+        idempotency_scope = options.pop("idempotency_scope", None)
+        self.idempotency = (
+            Idempotency(
+                self.main_http_verb,
+                self.inbound_handler.check_request_body,
+                idempotency_scope,
+            )
+            if options.pop("idempotent", False)
+            else None
+        )
+        timeout = options.pop("timeout", None)
+        self.execution_timeout = (
+            ExecutionTimeout(timeout) if timeout is not None else None
+        )
         self.has_request_body = self.inbound_handler.has_request_body
-        self.rule = rule
+        self.rule = self.inbound_handler.rule
 
     @property
     def as_view(self) -> JeroboamRouteCallable:
@@ -64,9 +107,19 @@ class JeroboamView:
         name = view_func.__name__
         doc = view_func.__doc__
 
-        if self.inbound_handler.is_valid:
-            view_func = self.inbound_handler.add_inbound_handling_to(view_func)
+        if self.execution_timeout is not None and iscoroutinefunction(view_func):
+            view_func = self.execution_timeout.cancel_after(view_func)
         view_func = self.outbound_handler.add_outbound_handling_to(view_func)
+        if self.inbound_handler.needs_handling:
+            view_func = self.inbound_handler.add_inbound_handling_to(view_func)
+        if self.execution_timeout is not None:
+            view_func = self.execution_timeout.limit(view_func)
+        if self.concurrency_limiter is not None:
+            view_func = self.concurrency_limiter.limit(view_func)
+        if self.idempotency is not None:
+            view_func = self.idempotency.replay_duplicates(view_func)
+        if self.rate_limiter is not None:
+            view_func = self.rate_limiter.limit(view_func)
 
         view_func.__name__ = name
         view_func.__doc__ = doc
@@ -74,6 +127,50 @@ class JeroboamView:
         view_func.__jeroboam_view__ = self  # type: ignore
         return view_func
 
+    @property
+    def is_awaitable(self) -> bool:
+        """Whether the view can be awaited with dispatch, off Flask's dispatch.
+
+        Idempotent, concurrency limited, coalesced and cached routes share
+        blocking locks between threads, so only their sync as_view serves them.
+        """
+        return (
+            iscoroutinefunction(self.original_view_func)
+            and self.idempotency is None
+            and self.concurrency_limiter is None
+            and self.inbound_handler.coalescer is None
+            and self.inbound_handler.response_cache is None
+        )
+
+    async def dispatch(self, **view_args: Any) -> JeroboamResponseReturnValue:
+        """Run the handlers of an awaitable view on the running event loop.
+
+        This is as_view for the ASGI entry point, which awaits the view rather
+        than blocking a thread until it returns.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.check()
+        with (
+            self.execution_timeout.deadline()
+            if self.execution_timeout is not None
+            else nullcontext()
+        ):
+            if self.inbound_handler.needs_handling:
+                return await self.inbound_handler.handle_async(
+                    self._awaited_view, view_args
+                )
+            return await self._awaited_view(**view_args)
+
+    @cached_property
+    def _awaited_view(self) -> Callable[..., Awaitable[JeroboamResponseReturnValue]]:
+        """The async view under its timeout and outbound handling."""
+        view_func = cast(
+            "Callable[..., Coroutine[Any, Any, Any]]", self.original_view_func
+        )
+        if self.execution_timeout is not None:
+            view_func = self.execution_timeout.cancel_after(view_func)
+        return self.outbound_handler.add_async_outbound_handling_to(view_func)
+
     @property
     def main_method(self) -> str:
         """Return the main HTTP verb of the Endpoint."""
@@ -1,8 +1,18 @@
 """Helper functions for extracting values from request locations."""
 
+from urllib.parse import unquote_plus
+
+from flask import request
+from pydantic import BaseModel
 from werkzeug.datastructures import Headers, MultiDict
+from werkzeug.exceptions import RequestEntityTooLarge
 
-from flask_jeroboam._utils import is_sequence_field
+from flask_jeroboam._utils import (
+    _is_sequence_annotation,
+    _lenient_issubclass,
+    _unwrap_optional,
+    is_sequence_field,
+)
 from flask_jeroboam.wrapper import current_app
 
 
@@ -17,6 +27,17 @@ def _extract_scalar(
     return source.get(alias, source.get(name))
 
 
+def _header_environ_key(header_name: str) -> str:
+    """Return the WSGI environ key under which a header is stored.
+
+    Per PEP 3333, Content-Type and Content-Length are not prefixed with HTTP_.
+    """
+    key = header_name.upper().replace("-", "_")
+    if key in {"CONTENT_TYPE", "CONTENT_LENGTH"}:
+        return key
+    return f"HTTP_{key}"
+
+
 def _extract_sequence(
     *, source: MultiDict, name: str | None, alias: str | None, **_kwargs
 ) -> list:
@@ -27,55 +48,159 @@ def _extract_sequence(
     return _values
 
 
+def _extract_delimited(
+    *, source: MultiDict, name: str, alias: str, **_kwargs
+) -> list | None:
+    """Extract a non-exploded (comma-separated) Sequence value from a source."""
+    value = _extract_scalar(source=source, name=name, alias=alias)
+    return None if value is None else value.split(",")
+
+
+def _compile_deep_object_plan(model: type[BaseModel], prefix: str) -> tuple:
+    """Compile the keys to read for a model serialized with the deepObject style.
+
+    Each entry is a ``(field_name, key, sequence_key, subplan)`` tuple, where
+    ``sequence_key`` is only set for sequence fields and ``subplan`` only for
+    nested models, so that no introspection is left for request time.
+    """
+    plan = []
+    for field_name, field in model.model_fields.items():
+        key = f"{prefix}[{field.alias or field_name}]"
+        inner = _unwrap_optional(field.annotation)
+        subplan = (
+            _compile_deep_object_plan(inner, key)
+            if _lenient_issubclass(inner, BaseModel)
+            else None
+        )
+        sequence_key = f"{key}[]" if _is_sequence_annotation(inner) else None
+        plan.append((field_name, key, sequence_key, subplan))
+    return tuple(plan)
+
+
+def _extract_deep_object(*, source: MultiDict, plan: tuple, **_kwargs) -> dict | None:
+    """Extract a model serialized with the deepObject style, following its plan.
+
+    Returns None when none of its keys are present.
+    """
+    result = {}
+    for field_name, key, sequence_key, subplan in plan:
+        value: dict | list | str | None
+        if subplan is not None:
+            value = _extract_deep_object(source=source, plan=subplan)
+        elif sequence_key is not None:
+            value = source.getlist(sequence_key) or source.getlist(key) or None
+        else:
+            value = source.get(key)
+        if value is not None:
+            result[field_name] = value
+    return result or None
+
+
+def _extract_deep_object_mapping(
+    *, source: MultiDict, alias: str, **_kwargs
+) -> dict | None:
+    """Extract a free-form mapping serialized with the deepObject style."""
+    prefix = f"{alias}["
+    result = {
+        key[len(prefix) : -1]: value
+        for key, value in source.items()
+        if key.startswith(prefix) and key.endswith("]")
+    }
+    return result or None
+
+
 def _extract_sequence_with_key_transformer(
     *, source: MultiDict, name: str, alias: str, **_kwargs
 ):
     """Apply the key transformer to the source."""
-    transformed_source = current_app.query_string_key_transformer(
-        current_app, source.to_dict()
+    return _extract_scalar(source=_transformed(source), name=name, alias=alias)
+
+
+def _transformed(source: MultiDict) -> dict:
+    """Apply the app's query_string_key_transformer at most once per request.
+
+    The result is memoized on the request object, keyed by source, and shared
+    by every argument reading from that source.
+    """
+    memo: dict | None = getattr(request, "_jeroboam_transformed_sources", None)
+    if memo is None:
+        memo = {}
+        request._jeroboam_transformed_sources = memo  # type: ignore[attr-defined]
+    if id(source) not in memo:
+        memo[id(source)] = current_app.query_string_key_transformer(
+            current_app, source.to_dict()
+        )
+    return memo[id(source)]
+
+
+def _compile_subfields_plan(fields: dict) -> tuple:
+    """Compile the extraction plan of a query or form model.
+
+    Each entry is a ``(field_name, keys, is_sequence)`` tuple, ``keys`` being
+    the alias then the field name, so that no type introspection is left for
+    request time.
+    """
+    return tuple(
+        (
+            field_name,
+            tuple(dict.fromkeys((field.alias or field_name, field_name))),
+            is_sequence_field(field),
+        )
+        for field_name, field in fields.items()
     )
-    return _extract_scalar(source=transformed_source, name=name, alias=alias)
 
 
-def _undirected_extraction(
-    *,
-    field,
-    source,
-    alias: str,
-    name: str,
-    has_key_transformer: bool,
-    **_kwargs,
-):
-    if is_sequence_field(field):
-        values = _extract_sequence(source=source, name=name, alias=alias)
-        if len(values) == 0 and has_key_transformer:
-            values = _extract_sequence_with_key_transformer(
-                source=source, name=name, alias=alias
-            )
-    else:
-        values = _extract_scalar(source=source, name=name, alias=alias)
-    return values
+def _limit_form_fields(body: bytes, max_fields: int | None) -> None:
+    """Reject urlencoded bodies with more than max_fields fields with a 413."""
+    if max_fields is not None and body and body.count(b"&") >= max_fields:
+        raise RequestEntityTooLarge
+
+
+def _parse_urlencoded_fields(
+    body: bytes, keys: frozenset, max_fields: int | None = None
+) -> MultiDict:
+    """Parse an urlencoded body in one pass, only keeping the given keys.
+
+    Values of other keys are never decoded. Bodies with more than max_fields
+    fields are rejected with a 413, like werkzeug does for multipart bodies.
+    """
+    _limit_form_fields(body, max_fields)
+    if not body:
+        return MultiDict()
+    items = []
+    for pair in body.split(b"&"):
+        raw_key, _, raw_value = pair.partition(b"=")
+        key = unquote_plus(raw_key.decode(errors="replace"))
+        if key in keys:
+            items.append((key, unquote_plus(raw_value.decode(errors="replace"))))
+    return MultiDict(items)
+
+
+def _extract_subfield_sequence(source: MultiDict, field_name: str, keys: tuple):
+    """Extract a sequence subfield, falling back on the app's key transformer."""
+    for key in keys:
+        if values := source.getlist(key):
+            return values
+    if getattr(current_app, "query_string_key_transformer", None) is not None:
+        return _extract_sequence_with_key_transformer(
+            source=source, name=field_name, alias=keys[0]
+        )
+    return []
 
 
 def _extract_subfields(
     *,
     source: MultiDict,
-    fields: dict,
+    plan: tuple,
     **_kwargs,
 ) -> dict:
-    """Extract a Sequence from subfields."""
-    has_key_transformer = (
-        getattr(current_app, "query_string_key_transformer", False) is not None
-    )
+    """Extract the subfields of a model, following its compiled plan."""
     result = {}
-    for field_name, subfield in fields.items():
-        value = _undirected_extraction(
-            field=subfield,
-            source=source,
-            name=field_name,
-            alias=subfield.alias,
-            has_key_transformer=has_key_transformer,
-        )
+    for field_name, keys, is_sequence in plan:
+        if is_sequence:
+            value = _extract_subfield_sequence(source, field_name, keys)
+        else:
+            value = next((source[key] for key in keys if key in source), None)
         if value is not None:
             result[field_name] = value
     return result
@@ -10,6 +10,8 @@ from typing import Any
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
 
+SUPPORTED_QUERY_STYLES = {("form", True), ("form", False), ("deepObject", True)}
+
 
 class ArgumentLocation(Enum):
     """Enum for the possible source location of a view_function parameter."""
@@ -77,10 +79,33 @@ class ParameterArgument(ViewArgument):  # type: ignore[misc]
 
 
 class QueryArgument(ParameterArgument):  # type: ignore[misc]
-    """A Parameter found in the Query String."""
+    """A Parameter found in the Query String.
+
+    ``style`` and ``explode`` follow OpenAPI's serialization rules. The default
+    ``form`` style with ``explode=True`` reads ``?id=1&id=2``, ``explode=False``
+    reads ``?id=1,2``, and the ``deepObject`` style reads nested structures such
+    as ``?filter[status]=open&filter[tag][]=a``.
+    """
 
     location = ArgumentLocation.query
 
+    def __init__(
+        self,
+        default: Any = PydanticUndefined,
+        **kwargs: Any,
+    ):
+        self.style = kwargs.pop("style", "form")
+        self.explode = kwargs.pop("explode", True)
+        if (self.style, self.explode) not in SUPPORTED_QUERY_STYLES:
+            raise ValueError(
+                f"Unsupported query parameter style {self.style!r} "
+                f"with explode={self.explode}."
+            )
+        super().__init__(
+            default,
+            **kwargs,
+        )
+
 
 class PathArgument(ParameterArgument):  # type: ignore[misc]
     """A Parameter found in Path."""
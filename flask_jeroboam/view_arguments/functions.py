@@ -11,8 +11,10 @@ Their signature are defined in adjacent file functions.pyi.
 Credits: This module is a fork of FlaskAPI params_function module.
 """
 
+from collections.abc import Callable
 from typing import Any
 
+from flask_jeroboam.dependencies import Dependency
 from flask_jeroboam.view_arguments.arguments import (
     BodyArgument,
     CookieArgument,
@@ -99,3 +101,12 @@ def File(  # noqa: N802
         *args,
         **kwargs,
     )
+
+
+def Depends(  # noqa: N802
+    dependency: Callable[..., Any],
+    *,
+    use_cache: bool = True,
+) -> Any:
+    """Declare A Dependency."""
+    return Dependency(dependency, use_cache=use_cache)
@@ -7,6 +7,7 @@ Documentation on stubfiles can be found here:
 https://mypy.readthedocs.io/en/stable/stubs.html
 """
 
+from collections.abc import Callable
 from typing import Any
 
 from pydantic_core import PydanticUndefined
@@ -47,6 +48,8 @@ def Query(
     examples: dict[str, Any] | None = None,
     deprecated: bool | None = None,
     include_in_schema: bool = True,
+    style: str = "form",
+    explode: bool = True,
     **extra: Any,
 ) -> Any: ...
 def Header(
@@ -154,3 +157,8 @@ def File(  # noqa: N802
     media_type: str = "multipart/form-data",
     **extra: Any,
 ) -> Any: ...
+def Depends(
+    dependency: Callable[..., Any],
+    *,
+    use_cache: bool = True,
+) -> Any: ...
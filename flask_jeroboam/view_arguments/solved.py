@@ -4,22 +4,39 @@ Params are solved at registration time. This way we reduce indirections when
 handling requests thus reducing overhead.
 """
 
+import csv
 import re
-from copy import deepcopy
+from collections.abc import Callable
 from typing import Annotated, Any
 
 from flask import request
-from pydantic import TypeAdapter, ValidationError
+from pydantic import Field, TypeAdapter, ValidationError
 from pydantic_core import ErrorDetails, PydanticUndefined
-from werkzeug.datastructures import FileStorage, Headers, MultiDict
-
-from flask_jeroboam._utils import _unwrap_optional
+from werkzeug.datastructures import FileStorage, MultiDict
+from werkzeug.exceptions import BadRequest
+from werkzeug.http import parse_list_header
+
+from flask_jeroboam._constants import PATH_CONVERTER_TYPES
+from flask_jeroboam._utils import (
+    _is_sequence_annotation,
+    _solve_default_factory,
+    _unwrap_optional,
+)
+from flask_jeroboam.decoders import get_body_decoder
 from flask_jeroboam.view_arguments._utils import (
+    _compile_deep_object_plan,
+    _compile_subfields_plan,
+    _extract_deep_object,
+    _extract_deep_object_mapping,
+    _extract_delimited,
     _extract_scalar,
     _extract_sequence,
     _extract_subfields,
+    _header_environ_key,
+    _parse_urlencoded_fields,
 )
 from flask_jeroboam.view_arguments.arguments import ArgumentLocation, ViewArgument
+from flask_jeroboam.wrapper import current_app
 
 
 class SolvedArgument:
@@ -36,6 +53,7 @@ class SolvedArgument:
         annotation: type,
         required: bool = False,
         default: Any = PydanticUndefined,
+        default_factory: Callable[[], Any] | None = None,
         location: ArgumentLocation = ArgumentLocation.unknown,
         alias: str | None = None,
         embed: bool = False,
@@ -46,6 +64,9 @@ class SolvedArgument:
         self.annotation = annotation
         self.required = required
         self.default = default
+        self.default_factory = default_factory
+        # Solved once so that missing optional parameters cost next to nothing.
+        self._make_default = _solve_default_factory(default, default_factory)
         self.location = location
         self.alias = alias or name
         self.embed = embed
@@ -91,6 +112,7 @@ class SolvedArgument:
             annotation=annotation,
             required=required,
             default=default,
+            default_factory=getattr(view_param, "default_factory", None),
             location=location,
             alias=getattr(view_param, "alias", None),
             embed=getattr(view_param, "embed", False),
@@ -116,8 +138,8 @@ class SolvedArgument:
             return values, errors
 
         if inbound_values is None:
-            if self.default is not PydanticUndefined:  # pragma: no branch
-                values[self.name] = deepcopy(self.default)
+            if self._make_default is not None:  # pragma: no branch
+                values[self.name] = self._make_default()
             return values, errors
 
         try:
@@ -129,6 +151,15 @@ class SolvedArgument:
 
         return values, errors
 
+    @property
+    def field_definition(self) -> tuple[Any, Any]:
+        """The (annotation, default) pair declaring this argument on a model."""
+        if self.required:
+            return (self.annotation, ...)
+        if self.default_factory is not None:
+            return (self.annotation, Field(default_factory=self.default_factory))
+        return (self.annotation, self.default)
+
     def _format_error(self, err: ErrorDetails) -> dict:
         """Format a pydantic ValidationError entry into the Jeroboam error shape."""
         loc = [self.location.value, self.alias] + [
@@ -150,7 +181,30 @@ class SolvedArgument:
 
 
 class SolvedPathArgument(SolvedArgument):
-    """Solved Path parameter."""
+    """Solved Path parameter.
+
+    Werkzeug converters (``<int:id>``, ``<uuid:id>``…) already type the values
+    found in ``request.view_args``. When the converter output is exactly the
+    annotated type and no constraint is attached, validation is a no-op and the
+    value is injected as is.
+    """
+
+    converted_by_router: bool = False
+
+    def bind_converter(self, converter: str | None) -> None:
+        """Solve whether the rule converter makes validation redundant."""
+        annotation = _unwrap_optional(self.annotation)
+        self.converted_by_router = (
+            converter is not None
+            and (annotation is Any or annotation is PATH_CONVERTER_TYPES.get(converter))
+            and not getattr(self.field_info, "metadata", None)
+        )
+
+    def validate_request(self) -> tuple[dict, list[dict]]:
+        """Inject the converted value directly when validation is redundant."""
+        if self.converted_by_router:
+            return {self.name: self._get_values()}, []
+        return super().validate_request()
 
     def _get_values(self) -> dict | str | None | list[Any]:
         source: dict = request.view_args or {}
@@ -158,19 +212,34 @@ class SolvedPathArgument(SolvedArgument):
 
 
 class SolvedHeaderArgument(SolvedArgument):
-    """Solved Header parameter."""
+    """Solved Header parameter.
+
+    The header is compiled to its WSGI environ key at registration time and read
+    straight from ``request.environ``, bypassing werkzeug's Headers lookups.
+    Repeated headers are joined with commas by the server: sequence annotations
+    get them back as a list, split on commas outside of quoted strings.
+    """
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # Compute the HTTP header name from the Python field name.
-        # e.g. content_type → Content-Type
-        self.alias = re.sub(
-            r"_(\w)", lambda x: f"-{x.group(1).upper()}", self.name.capitalize()
-        )
-
-    def _get_values(self) -> dict | str | None | list[Any]:
-        source: Headers | dict = request.headers or {}
-        return _extract_scalar(source=source, alias=self.alias, name=self.name)
+        # Compute the HTTP header name from the Python field name, unless an
+        # alias was given. e.g. content_type → Content-Type
+        if getattr(self.field_info, "alias", None) is None:
+            if getattr(self.field_info, "convert_underscores", True):
+                self.alias = re.sub(
+                    r"_(\w)", lambda x: f"-{x.group(1).upper()}", self.name.capitalize()
+                )
+            else:
+                # Only documented as is: WSGI maps it to the same environ key.
+                self.alias = self.name
+        self.environ_key = _header_environ_key(self.alias)
+        self._is_sequence = _is_sequence_annotation(self.annotation)
+
+    def _get_values(self) -> str | None | list[str]:
+        value = request.environ.get(self.environ_key)
+        if value is None or not self._is_sequence:
+            return value
+        return parse_list_header(value)
 
 
 class SolvedCookieArgument(SolvedArgument):
@@ -186,35 +255,65 @@ class SolvedQueryArgument(SolvedArgument):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        from typing import get_origin
-
         # Unwrap Optional[X] once at registration time; reuse on every request.
         self._inner = _unwrap_optional(self.annotation)
-        if hasattr(self._inner, "model_fields"):
-            self._fields = self._inner.model_fields
+        self._plan: tuple = ()
+        style = getattr(self.field_info, "style", "form")
+        if style == "deepObject":
+            self._solve_deep_object_extractor()
+        elif hasattr(self._inner, "model_fields"):
+            self._plan = _compile_subfields_plan(self._inner.model_fields)
             self.extractor = _extract_subfields
-        elif get_origin(self._inner) in (list, tuple, set, frozenset):
-            self._fields = {}
-            self.extractor = _extract_sequence
+        elif _is_sequence_annotation(self._inner):
+            explode = getattr(self.field_info, "explode", True)
+            self.extractor = _extract_sequence if explode else _extract_delimited
         else:
-            self._fields = {}
             self.extractor = _extract_scalar
 
+    def _solve_deep_object_extractor(self) -> None:
+        """Compile the parse plan of a deepObject-styled parameter."""
+        if hasattr(self._inner, "model_fields"):
+            self._plan = _compile_deep_object_plan(self._inner, self.alias)
+            self.extractor = _extract_deep_object
+        else:
+            self.extractor = _extract_deep_object_mapping
+
     def _get_values(self) -> dict | str | None | list[Any]:
         source: MultiDict = request.args
         return self.extractor(
             source=source,
             alias=self.alias,
             name=self.name,
-            fields=self._fields,
+            plan=self._plan,
         )
 
 
 class SolvedBodyArgument(SolvedArgument):
-    """Solved Body parameter."""
+    """Solved Body parameter.
+
+    Its body decoder is bound at registration from its media type.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.media_type: str = getattr(
+            self.field_info, "media_type", "application/json"
+        )
+        self._decoder = get_body_decoder(self.media_type)
+
+    def accepts(self, mimetype: str) -> bool:
+        """Whether a request body of that mimetype can be decoded."""
+        return self._decoder is not None and get_body_decoder(mimetype) is self._decoder
+
+    def _decode(self) -> Any:
+        assert self._decoder is not None  # noqa: S101
+        try:
+            return self._decoder(request)
+        except (ValueError, csv.Error) as error:
+            raise BadRequest(f"Failed to decode the {self.media_type} body.") from error
 
     def _get_values(self) -> dict | str | None | list[Any]:
-        source: dict | list = request.json or {}
+        source: dict | list = self._decode() or {}
         if isinstance(source, list):
             return source
         return source.get(self.alias or self.name) if self.embed else source
@@ -237,15 +336,37 @@ class SolvedFormArgument(SolvedArgument):
         super().__init__(**kwargs)
 
         self._inner = _unwrap_optional(self.annotation)
+        self._keys: frozenset | None
         if not self.embed and hasattr(self._inner, "model_fields"):
-            self._fields = self._inner.model_fields
+            self._plan = _compile_subfields_plan(self._inner.model_fields)
             self._extractor = _extract_subfields
+            self._keys = frozenset(key for _, keys, _ in self._plan for key in keys)
         else:
-            self._fields = {}
+            self._plan = ()
             self._extractor = None
+            self._keys = frozenset({self.alias or self.name}) if self.embed else None
+
+    def _get_source(self) -> MultiDict:
+        """Only decode the declared fields of urlencoded bodies.
+
+        Falls back on request.form for multipart bodies, once the form has
+        already been parsed, or when a key transformer may look for other keys.
+        """
+        if (
+            self._keys is None
+            or request.mimetype != "application/x-www-form-urlencoded"
+            or "form" in request.__dict__
+            or getattr(current_app, "query_string_key_transformer", None) is not None
+        ):
+            return request.form or MultiDict()
+        return _parse_urlencoded_fields(
+            request.get_data(cache=True),
+            self._keys,
+            current_app.config.get("JEROBOAM_MAX_FORM_FIELDS"),
+        )
 
     def _get_values(self) -> dict | str | None | list[Any]:
-        source: MultiDict = request.form or MultiDict()
+        source: MultiDict = self._get_source()
         if self.embed:
             return source.get(self.alias or self.name)
         if self._extractor is not None:
@@ -253,6 +374,6 @@ class SolvedFormArgument(SolvedArgument):
                 source=source,
                 alias=self.alias,
                 name=self.name,
-                fields=self._fields,
+                plan=self._plan,
             )
         return source  # pragma: no cover
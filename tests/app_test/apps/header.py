@@ -16,3 +16,30 @@ def get_header_as_plain_int(test_header: int = Header()):
 @router.get("/headers/str")
 def get_header_as_plain_str(test_header: str = Header()):
     return {"header": test_header}
+
+
+@router.get("/headers/list")
+def get_header_as_list(x_tag: list[str] = Header()):
+    return {"header": x_tag}
+
+
+@router.get("/headers/optional_list")
+def get_header_as_optional_list(x_tag: list[str] | None = Header(None)):
+    return {"header": x_tag}
+
+
+@router.get("/headers/content_type")
+def get_content_type_header(content_type: str = Header()):
+    return {"header": content_type}
+
+
+@router.get("/headers/alias")
+def get_aliased_header(tenant: str = Header(alias="X-Tenant-Id")):
+    return {"header": tenant}
+
+
+@router.get("/headers/no_convert")
+def get_header_without_underscore_conversion(
+    test_header: str = Header(convert_underscores=False),
+):
+    return {"header": test_header}
@@ -136,3 +136,22 @@ def configured_status_code_204_has_no_body():
 @router.post("/sensitive_data", response_model=UserOut)
 def reponse_model_filters_data(sensitive_data: UserIn = Body()):
     return sensitive_data
+
+
+@router.get(
+    "/produces/list",
+    response_model=list[UserOut],
+    produces=["application/json", "text/csv", "application/x-ndjson"],
+)
+def produces_a_list():
+    return [{"username": "alice"}, {"username": "bob"}]
+
+
+@router.get("/produces/single", response_model=UserOut, produces=["text/csv"])
+def produces_a_single_item():
+    return {"username": "alice"}
+
+
+@router.get("/produces/empty", response_model=list[UserOut], produces=["text/csv"])
+def produces_an_empty_list():
+    return []
@@ -3,6 +3,8 @@
 The corresponding test can be found in tests/test_inbound/test_path
 """
 
+from uuid import UUID
+
 from flask_jeroboam import Blueprint, Path
 
 router = Blueprint("path_params_router", __name__, tags=["Path"])
@@ -243,3 +245,23 @@ def get_with_preproc_path_param_lt_gt_int(item_id: int = Path(lt=3, gt=1)):
 @router.get("/path/with_converter/param-le-ge-int/<int:item_id>")
 def get_with_preproc_path_param_le_ge_int(item_id: int = Path(le=3, ge=1)):
     return {"item_id": item_id}
+
+
+@router.get("/path/derived/int/<item_id>", derive_path_converters=True)
+def get_derived_int_id(item_id: int):
+    return {"item_id": item_id}
+
+
+@router.get("/path/derived/uuid/<item_id>", derive_path_converters=True)
+def get_derived_uuid_id(item_id: UUID):
+    return {"item_id": str(item_id)}
+
+
+@router.get("/path/derived/str/<item_id>", derive_path_converters=True)
+def get_derived_str_id(item_id: str):
+    return {"item_id": item_id}
+
+
+@router.get("/path/derived/explicit/<string:item_id>", derive_path_converters=True)
+def get_derived_explicit_id(item_id: int):
+    return {"item_id": item_id}
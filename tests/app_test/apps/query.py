@@ -5,6 +5,7 @@ The corresponding test can be found in tests/test_inbound/test_query
 
 from flask_jeroboam import Blueprint, Query
 from tests.app_test.models.inbound import (
+    DeepFilterIn,
     ModelWithListIn,
     OptionalModelIn,
     QueryStringWithList,
@@ -89,3 +90,30 @@ def get_optional_param(payload: OptionalModelIn | None):
 @router.get("/query/special_pattern", response_model=ModelWithListOut)
 def read_items(payload: ModelWithListIn):
     return payload.model_dump_json()
+
+
+@router.get("/query/deep_object")
+def get_deep_object(filter: DeepFilterIn = Query(style="deepObject")):
+    return filter.model_dump_json()
+
+
+@router.get("/query/deep_object/optional")
+def get_optional_deep_object(
+    filter: DeepFilterIn | None = Query(None, style="deepObject"),
+):
+    return filter.model_dump_json() if filter else {}
+
+
+@router.get("/query/deep_object/mapping")
+def get_deep_object_mapping(sort: dict[str, str] = Query(style="deepObject")):
+    return {"sort": sort}
+
+
+@router.get("/query/not_exploded")
+def get_not_exploded_list(ids: list[int] = Query(explode=False)):
+    return {"ids": ids}
+
+
+@router.get("/query/list/alias")
+def get_aliased_list(ids: list[int] = Query(alias="id")):
+    return {"ids": ids}
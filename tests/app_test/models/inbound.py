@@ -1,6 +1,6 @@
 """Inbound Models for Testing."""
 
-from pydantic import Field, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from flask_jeroboam import InboundModel
 
@@ -40,3 +40,18 @@ class ModelWithListIn(InboundModel):
         if len(value) == 0:
             raise ValueError("Order must have at least 1 value")
         return value
+
+
+class PriceRangeIn(BaseModel):
+    """Nested model for deepObject query strings."""
+
+    min: int | None = None
+    max: int | None = None
+
+
+class DeepFilterIn(BaseModel):
+    """A filter sent as a deepObject query string."""
+
+    status: str
+    tags: list[str] = []
+    price: PriceRangeIn | None = None
@@ -0,0 +1,608 @@
+"""Testing the ASGI Entry Point."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from flask import Response, abort, request
+from pydantic import BaseModel
+
+from flask_jeroboam import Depends
+from flask_jeroboam.asgi import ASGIApp, Message
+from flask_jeroboam.background import BackgroundTasks
+from flask_jeroboam.jeroboam import Jeroboam
+from flask_jeroboam.view_arguments.functions import Body
+
+
+class Item(BaseModel):
+    """An Item sent as a request body."""
+
+    name: str
+    count: int
+
+
+def http_scope(method: str = "GET", path: str = "/", **kwargs) -> dict:
+    """An ASGI http scope."""
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "headers": [],
+        **kwargs,
+    }
+
+
+async def serve(app: ASGIApp, scope: dict, chunks: list[bytes] | None = None):
+    """Send a request to an ASGI app, returning the messages it sent back."""
+    chunks = chunks or [b""]
+    incoming = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    sent: list[dict] = []
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+def body_of(messages: list[dict]) -> bytes:
+    """The body of a response, from the messages sent back."""
+    return b"".join(m["body"] for m in messages if m["type"] == "http.response.body")
+
+
+def test_sync_views_run_on_the_thread_pool(one_shot_app: Jeroboam):
+    """GIVEN a sync view with a query parameter and a header
+    WHEN served through the ASGI app
+    THEN it runs on the thread pool and gets the request's data
+    """
+
+    @one_shot_app.get("/asgi/sync")
+    def sync_view(page: int):
+        return {
+            "page": page,
+            "thread": threading.current_thread().name,
+            "accept": request.headers["Accept"],
+        }
+
+    scope = http_scope(
+        path="/asgi/sync",
+        query_string=b"page=2",
+        headers=[(b"accept", b"application/json"), (b"accept", b"*/*")],
+    )
+    messages = asyncio.run(serve(one_shot_app.asgi_app, scope))
+
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[0]["status"] == 200
+    assert (b"content-type", b"application/json") in messages[0]["headers"]
+    payload = json.loads(body_of(messages))
+    assert payload["page"] == 2
+    assert payload["thread"].startswith("jeroboam-asgi")
+    assert payload["accept"] == "application/json,*/*"
+    one_shot_app.asgi_app.close()
+
+
+def test_async_views_run_on_the_server_loop(one_shot_app: Jeroboam):
+    """GIVEN an async view
+    WHEN served through the ASGI app
+    THEN it is awaited on the server's event loop
+    """
+
+    @one_shot_app.get("/asgi/async")
+    async def async_view():
+        return {"loop": id(asyncio.get_running_loop()), "path": request.path}
+
+    async def main():
+        scope = http_scope(path="/asgi/async")
+        first = await serve(one_shot_app.asgi_app, scope)
+        second = await serve(one_shot_app.asgi_app, scope)
+        return first, second, id(asyncio.get_running_loop())
+
+    first, second, server_loop = asyncio.run(main())
+
+    assert json.loads(body_of(first)) == {"loop": server_loop, "path": "/asgi/async"}
+    assert json.loads(body_of(second)) == json.loads(body_of(first))
+    one_shot_app.asgi_app.close()
+
+
+def test_async_views_hold_no_thread_of_the_pool(one_shot_app: Jeroboam):
+    """GIVEN a pool of a single thread, and an async view waiting for another request
+    WHEN both requests are served concurrently
+    THEN they both complete, the first one not holding the only thread
+    """
+    one_shot_app.config["JEROBOAM_ASGI_MAX_WORKERS"] = 1
+    released = asyncio.Event()
+
+    @one_shot_app.get("/asgi/wait/<int:step>")
+    async def wait(step: int):
+        if step == 1:
+            await released.wait()
+        else:
+            released.set()
+        return {"step": step}
+
+    async def main():
+        return await asyncio.wait_for(
+            asyncio.gather(
+                serve(one_shot_app.asgi_app, http_scope(path="/asgi/wait/1")),
+                serve(one_shot_app.asgi_app, http_scope(path="/asgi/wait/2")),
+            ),
+            timeout=5,
+        )
+
+    first, second = asyncio.run(main())
+
+    assert json.loads(body_of(first)) == {"step": 1}
+    assert json.loads(body_of(second)) == {"step": 2}
+    one_shot_app.asgi_app.close()
+
+
+def test_awaited_views_go_through_their_handlers(one_shot_app: Jeroboam):
+    """GIVEN an async view with a body, dependencies and background tasks
+    WHEN served through the ASGI app, with a valid then an invalid body
+    THEN it gets its validated arguments and runs its tasks, or gets a 400
+    """
+    ran: list[str] = []
+
+    def user() -> str:
+        return "alice"
+
+    async def greeting(name: str = Depends(user)) -> str:
+        return f"Hello {name}"
+
+    @one_shot_app.post("/asgi/items")
+    async def post_item(
+        tasks: BackgroundTasks,
+        item: Item = Body(),
+        text: str = Depends(greeting),
+    ):
+        tasks.add_task(ran.append, item.name)
+        return {"item": item.model_dump(), "text": text}
+
+    scope = http_scope(
+        method="POST",
+        path="/asgi/items",
+        headers=[(b"content-type", b"application/json")],
+    )
+    valid = asyncio.run(
+        serve(one_shot_app.asgi_app, scope, [b'{"name": "foo", "count": 3}'])
+    )
+    invalid = asyncio.run(serve(one_shot_app.asgi_app, scope, [b'{"name": "foo"}']))
+
+    assert valid[0]["status"] == 201
+    assert json.loads(body_of(valid)) == {
+        "item": {"name": "foo", "count": 3},
+        "text": "Hello alice",
+    }
+    assert ran == ["foo"]
+    assert invalid[0]["status"] == 400
+    one_shot_app.asgi_app.close()
+
+
+def test_awaited_views_are_rate_limited_and_timed_out(one_shot_app: Jeroboam):
+    """GIVEN async views with a rate limit, and a timeout
+    WHEN served through the ASGI app past their rate, or their deadline
+    THEN they are rejected with a 429, or a 504
+    """
+
+    @one_shot_app.get("/asgi/limited", rate_limit="1/h")
+    async def limited():
+        return {}
+
+    @one_shot_app.get("/asgi/slow", timeout=0.05)
+    async def slow():
+        await asyncio.sleep(1)
+
+    async def main():
+        return [
+            await serve(one_shot_app.asgi_app, http_scope(path=path))
+            for path in ["/asgi/limited", "/asgi/limited", "/asgi/slow"]
+        ]
+
+    statuses = [messages[0]["status"] for messages in asyncio.run(main())]
+
+    assert statuses == [200, 429, 504]
+    assert one_shot_app.timed_out_requests == {"slow": 1}
+    one_shot_app.asgi_app.close()
+
+
+@pytest.mark.parametrize(
+    "method,path,status",
+    [
+        ("GET", "/asgi/missing", 404),
+        ("GET", "/asgi/teapot", 418),
+        ("GET", "/asgi/broken", 500),
+        ("OPTIONS", "/asgi/missing", 200),
+    ],
+)
+def test_errors_of_awaited_views_are_handled_as_flask_does(
+    one_shot_app: Jeroboam, method: str, path: str, status: int
+):
+    """GIVEN async views raising errors, with a handler or not
+    WHEN served through the ASGI app
+    THEN their errors are handled, and OPTIONS answered, as Flask does
+    """
+    one_shot_app.config["TESTING"] = False
+
+    class Teapot(Exception):
+        """An error with a handler."""
+
+    @one_shot_app.errorhandler(Teapot)
+    def handle_teapot(e):
+        return {"message": "I'm a teapot"}, 418
+
+    @one_shot_app.get("/asgi/missing")
+    async def missing():
+        abort(404)
+
+    @one_shot_app.get("/asgi/teapot")
+    async def teapot():
+        raise Teapot
+
+    @one_shot_app.get("/asgi/broken")
+    async def broken():
+        raise RuntimeError("Broken")
+
+    messages = asyncio.run(
+        serve(one_shot_app.asgi_app, http_scope(method=method, path=path))
+    )
+
+    assert messages[0]["status"] == status
+    one_shot_app.asgi_app.close()
+
+
+@pytest.mark.parametrize(
+    "path,status",
+    [("/asgi/open", 200), ("/asgi/closed", 403), ("/asgi/gone", 410)],
+)
+def test_awaited_views_run_within_request_hooks(
+    one_shot_app: Jeroboam, path: str, status: int
+):
+    """GIVEN async views, and hooks running before, after and tearing down requests
+    WHEN served through the ASGI app
+    THEN the hooks run around them, those coming first responding in their stead
+    """
+    torn_down: list[str] = []
+
+    @one_shot_app.before_request
+    def close():
+        if request.path == "/asgi/closed":
+            abort(403)
+        if request.path == "/asgi/gone":
+            return {"message": "Gone"}, 410
+        return None
+
+    @one_shot_app.after_request
+    def tag(response):
+        response.headers["X-Hooked"] = "yes"
+        return response
+
+    @one_shot_app.teardown_request
+    def teardown(error):
+        torn_down.append(request.path)
+
+    @one_shot_app.get("/asgi/<name>")
+    async def hooked(name: str):
+        return {"name": name}
+
+    messages = asyncio.run(serve(one_shot_app.asgi_app, http_scope(path=path)))
+
+    assert messages[0]["status"] == status
+    assert (b"x-hooked", b"yes") in messages[0]["headers"]
+    assert torn_down == [path]
+    one_shot_app.asgi_app.close()
+
+
+def test_ignored_errors_of_awaited_views_are_not_torn_down_with(
+    one_shot_app: Jeroboam,
+):
+    """GIVEN an app ignoring the errors of its views when tearing requests down
+    WHEN an async view fails
+    THEN the request gets a 500, but is torn down as if it had not failed
+    """
+    one_shot_app.config["TESTING"] = False
+    torn_down: list[BaseException | None] = []
+    one_shot_app.should_ignore_error = lambda error: True  # type: ignore
+
+    @one_shot_app.teardown_request
+    def teardown(error):
+        torn_down.append(error)
+
+    @one_shot_app.get("/asgi/broken")
+    async def broken():
+        raise RuntimeError("Broken")
+
+    messages = asyncio.run(
+        serve(one_shot_app.asgi_app, http_scope(path="/asgi/broken"))
+    )
+
+    assert messages[0]["status"] == 500
+    assert torn_down == [None]
+    one_shot_app.asgi_app.close()
+
+
+def test_cancelled_awaited_views_are_torn_down(one_shot_app: Jeroboam):
+    """GIVEN an async view the server cancels while it is awaited
+    WHEN served through the ASGI app
+    THEN the request is still torn down
+    """
+    torn_down: list[BaseException | None] = []
+    entered = asyncio.Event()
+
+    @one_shot_app.teardown_request
+    def teardown(error):
+        torn_down.append(error)
+
+    @one_shot_app.get("/asgi/forever")
+    async def forever():
+        entered.set()
+        await asyncio.Event().wait()
+
+    async def main():
+        task = asyncio.ensure_future(
+            serve(one_shot_app.asgi_app, http_scope(path="/asgi/forever"))
+        )
+        await entered.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert len(torn_down) == 1
+    assert isinstance(torn_down[0], asyncio.CancelledError)
+    one_shot_app.asgi_app.close()
+
+
+def test_idempotent_async_views_go_through_flask_dispatch(one_shot_app: Jeroboam):
+    """GIVEN an idempotent async view
+    WHEN served through the ASGI app
+    THEN it is not awaited directly, its locks being shared with sync views
+    """
+
+    @one_shot_app.post("/asgi/orders", idempotent=True)
+    async def order():
+        return {"ordered": True}
+
+    scope = http_scope(
+        method="POST", path="/asgi/orders", headers=[(b"idempotency-key", b"a1")]
+    )
+    messages = asyncio.run(serve(one_shot_app.asgi_app, scope))
+
+    view = one_shot_app.view_functions["order"].__jeroboam_view__  # type: ignore
+    assert not view.is_awaitable
+    assert messages[0]["status"] == 201
+    assert json.loads(body_of(messages)) == {"ordered": True}
+    one_shot_app.asgi_app.close()
+
+
+def test_bodies_are_read_from_several_messages(one_shot_app: Jeroboam):
+    """GIVEN a view with a body argument and a root path
+    WHEN its body is received in several messages
+    THEN it is reassembled before validation
+    """
+
+    @one_shot_app.post("/asgi/body")
+    def post_item(item: Item = Body()):
+        return {"item": item.model_dump(), "root": request.script_root}
+
+    scope = http_scope(
+        method="POST",
+        path="/api/asgi/body",
+        root_path="/api",
+        headers=[(b"content-type", b"application/json")],
+    )
+    messages = asyncio.run(
+        serve(one_shot_app.asgi_app, scope, [b'{"name": "fo', b'o", "count": 3}'])
+    )
+
+    assert messages[0]["status"] == 201
+    assert json.loads(body_of(messages)) == {
+        "item": {"name": "foo", "count": 3},
+        "root": "/api",
+    }
+    one_shot_app.asgi_app.close()
+
+
+def test_cookies_are_joined_and_underscored_headers_dropped(one_shot_app: Jeroboam):
+    """GIVEN a request with two cookie headers, and a header with an underscore
+    WHEN served through the ASGI app
+    THEN cookies are joined as in a single header, and the other header dropped
+    """
+
+    @one_shot_app.get("/asgi/headers")
+    def headers():
+        return {"cookies": request.cookies, "token": request.headers.get("X-Token")}
+
+    scope = http_scope(
+        path="/asgi/headers",
+        headers=[(b"cookie", b"a=1"), (b"cookie", b"b=2"), (b"x_token", b"spoofed")],
+    )
+    messages = asyncio.run(serve(one_shot_app.asgi_app, scope))
+
+    assert json.loads(body_of(messages)) == {
+        "cookies": {"a": "1", "b": "2"},
+        "token": None,
+    }
+    one_shot_app.asgi_app.close()
+
+
+@pytest.mark.parametrize(
+    "headers,received",
+    [
+        ([(b"content-length", b"64")], 0),
+        ([], 2),
+    ],
+)
+def test_bodies_over_the_limit_are_not_read(
+    one_shot_app: Jeroboam, headers: list, received: int
+):
+    """GIVEN a route limiting its body size
+    WHEN a body over the limit is declared, or streamed without a length
+    THEN the request is rejected with a 413, without reading the body past the limit
+    """
+    one_shot_app.config["JEROBOAM_MAX_BODY_SIZE"] = 1024
+
+    @one_shot_app.post("/asgi/limited", max_body_size=8)
+    def limited(note: str = Body()):
+        return {}  # pragma: no cover
+
+    incoming = [
+        {"type": "http.request", "body": b'{"note"', "more_body": True},
+        {"type": "http.request", "body": b': "far too long"', "more_body": True},
+        {"type": "http.request", "body": b"}", "more_body": False},
+    ]
+    sent: list[dict] = []
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = http_scope(
+        method="POST",
+        path="/asgi/limited",
+        headers=[(b"content-type", b"application/json"), *headers],
+    )
+    asyncio.run(one_shot_app.asgi_app(scope, receive, send))
+
+    assert sent[0]["status"] == 413
+    assert json.loads(body_of(sent)) == {"message": "Request Entity Too Large"}
+    assert len(incoming) == 3 - received
+    one_shot_app.asgi_app.close()
+
+
+def test_unrouted_bodies_are_read_within_the_configured_limit(one_shot_app: Jeroboam):
+    """GIVEN a body size limit set in the configuration
+    WHEN a body over it is declared for an unknown route
+    THEN the request is not read, and gets a 404
+    """
+    one_shot_app.config["JEROBOAM_MAX_BODY_SIZE"] = 8
+    scope = http_scope(
+        method="POST", path="/asgi/unknown", headers=[(b"content-length", b"64")]
+    )
+    messages = asyncio.run(serve(one_shot_app.asgi_app, scope, [b"x" * 64]))
+
+    assert messages[0]["status"] == 404
+    one_shot_app.asgi_app.close()
+
+
+def test_bodies_of_routes_taking_none_are_not_limited(one_shot_app: Jeroboam):
+    """GIVEN a body size limit set in the configuration
+    WHEN a body over it is sent to a route declaring no body argument
+    THEN the whole body is read, for the view to use as it pleases
+    """
+    one_shot_app.config["JEROBOAM_MAX_BODY_SIZE"] = 8
+
+    @one_shot_app.post("/asgi/raw")
+    def raw():
+        return {"size": len(request.get_data())}
+
+    scope = http_scope(
+        method="POST", path="/asgi/raw", headers=[(b"content-length", b"64")]
+    )
+    messages = asyncio.run(serve(one_shot_app.asgi_app, scope, [b"x" * 64]))
+
+    assert json.loads(body_of(messages)) == {"size": 64}
+    one_shot_app.asgi_app.close()
+
+
+def test_responses_are_streamed_chunk_by_chunk(one_shot_app: Jeroboam):
+    """GIVEN a view streaming its response
+    WHEN served through the ASGI app
+    THEN each non-empty chunk is sent in its own message
+    """
+
+    @one_shot_app.get("/asgi/stream")
+    def stream():
+        return Response(
+            iter([b"a", b"", b"b"]), mimetype="text/plain", direct_passthrough=True
+        )
+
+    messages = asyncio.run(
+        serve(one_shot_app.asgi_app, http_scope(path="/asgi/stream"))
+    )
+
+    assert [m.get("body") for m in messages[1:]] == [b"a", b"b", b""]
+    assert [m.get("more_body", False) for m in messages[1:]] == [True, True, False]
+    one_shot_app.asgi_app.close()
+
+
+def test_disconnected_clients_get_no_response(one_shot_app: Jeroboam):
+    """GIVEN a client going away while sending its body
+    WHEN served through the ASGI app
+    THEN the request is dropped
+    """
+    incoming = [
+        {"type": "http.request", "body": b"{", "more_body": True},
+        {"type": "http.disconnect"},
+    ]
+    sent: list[dict] = []
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):  # pragma: no cover
+        sent.append(message)
+
+    asyncio.run(one_shot_app.asgi_app(http_scope(method="POST"), receive, send))
+
+    assert sent == []
+
+
+def test_lifespan_attaches_and_releases_the_server_loop(one_shot_app: Jeroboam):
+    """GIVEN an ASGI server going through the lifespan protocol
+    WHEN it starts up and shuts down
+    THEN the app's async executor is attached to its loop, then released
+    """
+    asgi_app = one_shot_app.asgi_app
+    incoming = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent: list[dict] = []
+    loops = []
+
+    async def receive():
+        if not incoming[0]["type"].endswith("startup"):
+            loops.append(one_shot_app.async_executor._loop)
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    async def main():
+        await asgi_app({"type": "lifespan"}, receive, send)
+        return asyncio.get_running_loop()
+
+    server_loop = asyncio.run(main())
+
+    assert sent == [
+        {"type": "lifespan.startup.complete"},
+        {"type": "lifespan.shutdown.complete"},
+    ]
+    assert loops == [server_loop]
+    assert one_shot_app.async_executor._loop is None
+    assert asgi_app._pool is None
+
+
+def test_unsupported_scopes_are_refused(one_shot_app: Jeroboam):
+    """GIVEN a websocket connection
+    WHEN handed to the ASGI app
+    THEN it is refused
+    """
+
+    async def receive() -> Message:  # pragma: no cover
+        return {}
+
+    async def send(message: Message) -> None:  # pragma: no cover
+        pass
+
+    with pytest.raises(RuntimeError, match="Unsupported ASGI scope type: websocket"):
+        asyncio.run(one_shot_app.asgi_app({"type": "websocket"}, receive, send))
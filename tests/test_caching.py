@@ -0,0 +1,278 @@
+"""Testing the Stale-While-Revalidate Response Cache."""
+
+import threading
+
+import pytest
+
+from flask_jeroboam import caching
+from flask_jeroboam.background import BackgroundTasks
+from flask_jeroboam.caching import ResponseCache
+from flask_jeroboam.jeroboam import Jeroboam
+from tests.test_limits import wait_until
+
+
+class Clock:
+    """A clock moved forward by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    """Replace the cache's clock."""
+    clock = Clock()
+    monkeypatch.setattr(caching, "monotonic", clock)
+    return clock
+
+
+def cache_of(app: Jeroboam, endpoint: str) -> ResponseCache:
+    """The response cache of a route."""
+    return app.view_functions[endpoint].__jeroboam_view__.inbound_handler.response_cache
+
+
+def test_fresh_responses_are_served_from_the_cache(one_shot_app: Jeroboam, clock):
+    """GIVEN a cached route
+    WHEN requested twice within its ttl, with the same arguments
+    THEN the view runs once and the second response tells its age
+    """
+    calls = []
+
+    @one_shot_app.get("/cached/report", cache_ttl=60)
+    def report(year: int):
+        calls.append(year)
+        return {"year": year}
+
+    client = one_shot_app.test_client()
+    first = client.get("/cached/report?year=2020")
+    clock.now += 30
+    second = client.get("/cached/report?year=2020")
+    client.get("/cached/report?year=2021")
+
+    assert calls == [2020, 2021]
+    assert second.json == first.json == {"year": 2020}
+    assert "Age" not in first.headers
+    assert second.headers["Age"] == "30"
+
+
+def test_stale_responses_are_served_while_refreshed(one_shot_app: Jeroboam, clock):
+    """GIVEN a cached route whose response went stale
+    WHEN requested twice while it is refreshed
+    THEN the stale response is served and refreshed once, in the background
+    """
+    refreshing, release = threading.Event(), threading.Event()
+    versions = []
+
+    @one_shot_app.get("/cached/dashboard", cache_ttl=10, stale_while_revalidate=60)
+    def dashboard():
+        versions.append(threading.current_thread().name)
+        if len(versions) > 1:
+            refreshing.set()
+            release.wait(timeout=1)
+        return {"version": len(versions)}
+
+    client = one_shot_app.test_client()
+    client.get("/cached/dashboard")
+    clock.now += 20
+    stale = [client.get("/cached/dashboard")]
+    refreshing.wait(timeout=1)
+    stale.append(client.get("/cached/dashboard"))
+    release.set()
+    cache_of(one_shot_app, "dashboard").close()
+    refreshed = client.get("/cached/dashboard")
+
+    assert [response.json for response in stale] == [{"version": 1}] * 2
+    assert refreshed.json == {"version": 2}
+    assert versions[1].startswith("jeroboam-cache")
+
+
+def test_refreshes_run_the_background_tasks_of_the_view(one_shot_app: Jeroboam, clock):
+    """GIVEN a cached route adding a background task
+    WHEN its stale response is refreshed
+    THEN the task added by the refresh runs too
+    """
+    calls: list[int] = []
+
+    @one_shot_app.get("/cached/audited", cache_ttl=10, stale_while_revalidate=60)
+    def audited(tasks: BackgroundTasks):
+        tasks.add_task(calls.append, len(calls))
+        return {}
+
+    client = one_shot_app.test_client()
+    client.get("/cached/audited").close()
+    clock.now += 20
+    client.get("/cached/audited").close()
+    cache_of(one_shot_app, "audited").close()
+
+    assert calls == [0, 1]
+
+
+def test_expired_responses_are_computed_again(one_shot_app: Jeroboam, clock):
+    """GIVEN a cached route whose response is older than its stale window
+    WHEN requested
+    THEN the view runs again before responding
+    """
+    calls: list[int] = []
+
+    @one_shot_app.get("/cached/expired", cache_ttl=10, stale_while_revalidate=5)
+    def expired():
+        calls.append(len(calls))
+        return {"call": len(calls)}
+
+    client = one_shot_app.test_client()
+    client.get("/cached/expired")
+    clock.now += 15
+    response = client.get("/cached/expired")
+
+    assert response.json == {"call": 2}
+
+
+def test_failed_refreshes_keep_the_stale_response(
+    one_shot_app: Jeroboam, clock, caplog
+):
+    """GIVEN a cached route failing to refresh its stale response
+    WHEN requested again
+    THEN the failure is logged, and the stale response served and refreshed again
+    """
+    calls: list[int] = []
+
+    @one_shot_app.get("/cached/flaky", cache_ttl=10, stale_while_revalidate=60)
+    def flaky():
+        calls.append(len(calls))
+        if len(calls) > 1:
+            raise RuntimeError("Database is down")
+        return {"call": 1}
+
+    client = one_shot_app.test_client()
+    client.get("/cached/flaky")
+    clock.now += 20
+    client.get("/cached/flaky")
+    cache = cache_of(one_shot_app, "flaky")
+    wait_until(lambda: len(calls) == 2 and not cache._refreshing)
+    response = client.get("/cached/flaky")
+    cache.close()
+    cache.close()
+
+    assert response.json == {"call": 1}
+    assert len(calls) == 3
+    assert "Refreshing a cached response failed." in caplog.text
+
+
+def test_error_responses_are_not_cached(one_shot_app: Jeroboam, clock):
+    """GIVEN a cached route returning an error status code
+    WHEN requested twice
+    THEN the view runs each time
+    """
+    calls: list[int] = []
+
+    @one_shot_app.get("/cached/missing", cache_ttl=10)
+    def missing():
+        calls.append(len(calls))
+        return {"message": "Not Found"}, 404
+
+    client = one_shot_app.test_client()
+    statuses = [client.get("/cached/missing").status_code for _ in range(2)]
+
+    assert statuses == [404, 404]
+    assert calls == [0, 1]
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Set-Cookie": "uid=user0"},
+        {"Cache-Control": "private, max-age=60"},
+        {"Cache-Control": "no-store"},
+    ],
+)
+def test_private_responses_are_not_cached(one_shot_app: Jeroboam, clock, headers):
+    """GIVEN a cached route whose response sets a cookie, or is private
+    WHEN requested by two clients
+    THEN the view runs for each of them, and its headers are not shared
+    """
+    calls: list[int] = []
+
+    @one_shot_app.get("/cached/profile", cache_ttl=60)
+    def profile():
+        calls.append(len(calls))
+        response = one_shot_app.response_class(b"{}", headers=headers)
+        response.headers["X-Call"] = str(len(calls))
+        return response
+
+    first = one_shot_app.test_client().get("/cached/profile")
+    second = one_shot_app.test_client().get("/cached/profile")
+
+    assert calls == [0, 1]
+    assert (first.headers["X-Call"], second.headers["X-Call"]) == ("1", "2")
+
+
+def test_least_recently_served_responses_are_evicted(
+    one_shot_app: Jeroboam, clock, monkeypatch
+):
+    """GIVEN a cache holding a single response
+    WHEN two argument sets are requested in turn, then the cache is cleared
+    THEN each request runs the view
+    """
+    monkeypatch.setattr(caching, "MAX_CACHED_RESPONSES", 1)
+    calls = []
+
+    @one_shot_app.get("/cached/years", cache_ttl=10)
+    def years(year: int):
+        calls.append(year)
+        return {"year": year}
+
+    client = one_shot_app.test_client()
+    for year in [1, 2, 1]:
+        client.get(f"/cached/years?year={year}")
+    cache_of(one_shot_app, "years").clear()
+    client.get("/cached/years?year=1")
+
+    assert calls == [1, 2, 1, 1]
+
+
+def test_cached_routes_can_be_coalesced(one_shot_app: Jeroboam, clock):
+    """GIVEN a cached and coalesced route
+    WHEN requested twice
+    THEN the view runs once
+    """
+    calls: list[int] = []
+
+    @one_shot_app.get("/cached/coalesced", cache_ttl=10, coalesce=True)
+    def coalesced():
+        calls.append(len(calls))
+        return {}
+
+    client = one_shot_app.test_client()
+    client.get("/cached/coalesced")
+    client.get("/cached/coalesced")
+
+    assert calls == [0]
+
+
+@pytest.mark.parametrize(
+    "rule_options,message",
+    [
+        ({"cache_ttl": 0}, "cache_ttl must be positive, not 0."),
+        (
+            {"cache_ttl": 1, "stale_while_revalidate": -1},
+            "stale_while_revalidate must be positive or zero, not -1.",
+        ),
+        (
+            {"cache_ttl": 1, "methods": ["POST"]},
+            "Only GET routes can be coalesced or cached, not POST ones.",
+        ),
+    ],
+)
+def test_invalid_cache_options(one_shot_app: Jeroboam, rule_options, message):
+    """GIVEN invalid cache options
+    WHEN registering a route
+    THEN a ValueError is raised
+    """
+    with pytest.raises(ValueError, match=message):
+
+        @one_shot_app.route("/cached/invalid", **rule_options)
+        def invalid():
+            return {}
@@ -0,0 +1,228 @@
+"""Testing the Coalescing of Identical Concurrent Requests."""
+
+import threading
+
+import pytest
+
+from flask_jeroboam import coalescing
+from flask_jeroboam.exceptions import RessourceNotFound
+from flask_jeroboam.jeroboam import Jeroboam
+from tests.test_limits import wait_until
+
+
+class CountedFlight(coalescing._Flight):
+    """A flight counting the requests waiting on it."""
+
+    waiting = 0
+
+    def __init__(self):
+        super().__init__()
+        wait = self.done.wait
+
+        def counted_wait(timeout=None):
+            CountedFlight.waiting += 1
+            return wait(timeout)
+
+        self.done.wait = counted_wait
+
+
+@pytest.fixture
+def counted_flights(monkeypatch):
+    """Count the requests waiting on a flight."""
+    CountedFlight.waiting = 0
+    monkeypatch.setattr(coalescing, "_Flight", CountedFlight)
+    return CountedFlight
+
+
+def request_concurrently(app: Jeroboam, urls: list[str], started, release):
+    """Send requests from several threads, releasing the view once the
+    followers wait for it."""
+    responses: dict[int, object] = {}
+
+    def request(index, url):
+        responses[index] = app.test_client().get(url)
+
+    leader = threading.Thread(target=request, args=(0, urls[0]))
+    leader.start()
+    started.wait(timeout=1)
+    followers = [
+        threading.Thread(target=request, args=(index, url))
+        for index, url in enumerate(urls[1:], start=1)
+    ]
+    for follower in followers:
+        follower.start()
+    wait_until(lambda: CountedFlight.waiting == len(followers))
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+    return [responses[index] for index in range(len(urls))]
+
+
+def test_identical_requests_share_a_single_execution(
+    one_shot_app: Jeroboam, counted_flights
+):
+    """GIVEN a coalesced route
+    WHEN identical requests come in while the first one is being served
+    THEN the view runs once and they all get its response
+    """
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    @one_shot_app.get("/coalesced/report", coalesce=True)
+    def report(year: int):
+        calls.append(year)
+        started.set()
+        release.wait(timeout=1)
+        return {"year": year}, 200, {"X-Computed": "once"}
+
+    responses = request_concurrently(
+        one_shot_app, ["/coalesced/report?year=2020"] * 3, started, release
+    )
+
+    assert calls == [2020]
+    assert [response.json for response in responses] == [{"year": 2020}] * 3
+    assert {response.headers["X-Computed"] for response in responses} == {"once"}
+
+
+def test_requests_with_other_arguments_are_not_coalesced(one_shot_app: Jeroboam):
+    """GIVEN a coalesced route
+    WHEN requested with different arguments, or one request after the other
+    THEN the view runs for each request
+    """
+    calls = []
+
+    @one_shot_app.get("/coalesced/years", coalesce=True)
+    def years(year: int):
+        calls.append(year)
+        return {"year": year}
+
+    client = one_shot_app.test_client()
+    for url in ["/coalesced/years?year=1", "/coalesced/years?year=2"] * 2:
+        client.get(url)
+
+    assert calls == [1, 2, 1, 2]
+
+
+def test_errors_are_raised_in_every_coalesced_request(
+    one_shot_app: Jeroboam, counted_flights
+):
+    """GIVEN a coalesced route without parameters, raising an exception
+    WHEN identical requests come in while the first one is being served
+    THEN they all get the error
+    """
+    started, release = threading.Event(), threading.Event()
+
+    @one_shot_app.get("/coalesced/missing", coalesce=True)
+    def missing():
+        started.set()
+        release.wait(timeout=1)
+        raise RessourceNotFound(msg="Not Found")
+
+    responses = request_concurrently(
+        one_shot_app, ["/coalesced/missing"] * 2, started, release
+    )
+
+    assert [response.status_code for response in responses] == [404, 404]
+
+
+def test_private_responses_are_not_shared(one_shot_app: Jeroboam, counted_flights):
+    """GIVEN a coalesced route whose response sets a cookie
+    WHEN identical requests come in while the first one is being served
+    THEN each of them runs the view and gets its own cookie
+    """
+    started, release = threading.Event(), threading.Event()
+    calls: list[int] = []
+
+    @one_shot_app.get("/coalesced/session", coalesce=True)
+    def session():
+        calls.append(len(calls))
+        started.set()
+        release.wait(timeout=1)
+        response = one_shot_app.response_class(b"{}")
+        response.set_cookie("uid", f"user{len(calls)}")
+        return response
+
+    responses = request_concurrently(
+        one_shot_app, ["/coalesced/session"] * 3, started, release
+    )
+
+    cookies = {response.headers["Set-Cookie"] for response in responses}
+    assert len(calls) == 3
+    assert len(cookies) == 3
+
+
+def test_waiting_requests_give_up_after_the_coalesce_timeout(one_shot_app: Jeroboam):
+    """GIVEN a coalesced route with a coalesce timeout
+    WHEN an identical request waits for longer than the timeout
+    THEN it runs the view itself
+    """
+    started, release = threading.Event(), threading.Event()
+    calls: list[int] = []
+
+    @one_shot_app.get("/coalesced/hanging", coalesce=True, coalesce_timeout=0.01)
+    def hanging():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            started.set()
+            release.wait(timeout=1)
+        return {"call": len(calls)}
+
+    leader = threading.Thread(
+        target=lambda: one_shot_app.test_client().get("/coalesced/hanging")
+    )
+    leader.start()
+    started.wait(timeout=1)
+    response = one_shot_app.test_client().get("/coalesced/hanging")
+    release.set()
+    leader.join()
+
+    assert response.json == {"call": 2}
+
+
+def test_waiting_requests_give_up_at_their_deadline(one_shot_app: Jeroboam):
+    """GIVEN a coalesced route with a timeout
+    WHEN an identical request waits past its deadline
+    THEN it fails with a 504
+    """
+    started, release = threading.Event(), threading.Event()
+
+    @one_shot_app.get("/coalesced/slow", coalesce=True, timeout=0.05)
+    def slow():
+        started.set()
+        release.wait(timeout=1)
+        return {}
+
+    leader = threading.Thread(
+        target=lambda: one_shot_app.test_client().get("/coalesced/slow")
+    )
+    leader.start()
+    started.wait(timeout=1)
+    response = one_shot_app.test_client().get("/coalesced/slow")
+    release.set()
+    leader.join()
+
+    assert response.status_code == 504
+
+
+def test_coalesce_timeouts_must_be_positive(one_shot_app: Jeroboam):
+    """GIVEN a coalesce timeout that is not positive
+    WHEN registering a coalesced route
+    THEN a ValueError is raised
+    """
+    with pytest.raises(ValueError, match="coalesce_timeout must be positive, not 0."):
+
+        @one_shot_app.get("/coalesced/invalid", coalesce=True, coalesce_timeout=0)
+        def invalid():
+            return {}
+
+
+def test_only_get_routes_can_be_coalesced(one_shot_app: Jeroboam):
+    """GIVEN a POST route
+    WHEN registered with coalesce=True
+    THEN a ValueError is raised
+    """
+    with pytest.raises(ValueError, match="Only GET routes can be coalesced"):
+
+        @one_shot_app.post("/coalesced/orders", coalesce=True)
+        def create_order():
+            return {}
@@ -1,7 +1,10 @@
 """Testing Error Handling."""
 
+import pytest
 from flask.testing import FlaskClient
 
+from flask_jeroboam import Body, Query
+from flask_jeroboam.exceptions import ResponseValidationError
 from flask_jeroboam.jeroboam import Jeroboam
 
 
@@ -80,3 +83,120 @@ def test_opt_out_registering():
     assert response.data.startswith(
         b"<!doctype html>\n<html lang=en>\n<title>400 Bad Request"
     )
+
+
+def test_validation_errors_first_on_route(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a route configured with validation_errors="first"
+    WHEN hit with several invalid parameters and a malformed body
+    THEN only the first error is reported and the body is never parsed
+    """
+
+    @one_shot_app.post("/fail_fast", validation_errors="first")
+    def fail_fast(page: int = Query(), per_page: int = Query(), payload: int = Body()):
+        return {}
+
+    response = one_shot_client.post(
+        "/fail_fast?page=a&per_page=b",
+        data="not json",
+        content_type="application/json",
+    )
+    assert response.status_code == 400
+    assert response.json == {
+        "detail": [
+            {
+                "loc": ["query", "page"],
+                "msg": "Input should be a valid integer, unable to parse string as an integer",
+                "type": "int_parsing",
+            }
+        ]
+    }
+
+
+def test_validation_errors_first_on_body(one_shot_app: Jeroboam):
+    """GIVEN an app configured to report only the first validation error
+    WHEN the body is the first invalid location
+    THEN only its first error is reported
+    """
+    one_shot_app.config["JEROBOAM_VALIDATION_ERRORS"] = "first"
+
+    @one_shot_app.post("/fail_fast/body")
+    def fail_fast_body(page: int = Query(1), qty: int = Body(), name: int = Body()):
+        return {}
+
+    response = one_shot_app.test_client().post(
+        "/fail_fast/body", json={"qty": "a", "name": "b"}
+    )
+    assert response.status_code == 400
+    assert [error["loc"][-1] for error in response.json["detail"]] == ["qty"]
+    valid = one_shot_app.test_client().post(
+        "/fail_fast/body", json={"qty": 1, "name": 2}
+    )
+    assert valid.status_code == 201
+
+
+def test_validation_errors_all_by_default(one_shot_client: FlaskClient, one_shot_app):
+    """Every error is reported unless configured otherwise."""
+
+    @one_shot_app.get("/report_all")
+    def report_all(page: int, per_page: int):
+        return {}
+
+    response = one_shot_client.get("/report_all?page=a&per_page=b")
+    assert len(response.json["detail"]) == 2
+
+
+def test_validation_errors_unknown_mode(one_shot_app: Jeroboam):
+    """An unknown validation_errors mode is rejected at registration."""
+    with pytest.raises(ValueError):
+
+        @one_shot_app.get("/unknown_mode", validation_errors="some")
+        def unknown_mode(page: int):
+            return {}
+
+
+def test_validation_errors_unknown_mode_in_config():
+    """An unknown JEROBOAM_VALIDATION_ERRORS mode is rejected by init_app."""
+    app = Jeroboam(__name__)
+    app.config["JEROBOAM_VALIDATION_ERRORS"] = "frist"
+
+    with pytest.raises(ValueError, match="JEROBOAM_VALIDATION_ERRORS must be one of"):
+        app.init_app()
+
+
+def test_validation_errors_cap_and_context(one_shot_app: Jeroboam):
+    """GIVEN an app capping reported errors and omitting their context
+    WHEN a request fails validation on several parameters
+    THEN the payload is trimmed accordingly
+    """
+    one_shot_app.config["JEROBOAM_MAX_VALIDATION_ERRORS"] = 1
+    one_shot_app.config["JEROBOAM_VALIDATION_ERRORS_CONTEXT"] = False
+
+    @one_shot_app.get("/capped")
+    def capped(page: int = Query(gt=0), per_page: int = Query(gt=0)):
+        return {}
+
+    response = one_shot_app.test_client().get("/capped?page=0&per_page=0")
+    assert response.status_code == 400
+    assert response.mimetype == "application/json"
+    assert response.json == {
+        "detail": [
+            {
+                "loc": ["query", "page"],
+                "msg": "Input should be greater than 0",
+                "type": "greater_than",
+            }
+        ]
+    }
+
+
+def test_response_validation_error_on_arbitrary_error():
+    """GIVEN a ResponseValidationError wrapping a non-pydantic error
+    WHEN reading its trace and summary
+    THEN the trace is formatted from the error and the summary is empty
+    """
+    error = ResponseValidationError("A validation", ValueError("Boom"))
+
+    assert error.trace == "ValueError: Boom\n"
+    assert error.summary == {"model": None, "error_count": 0, "errors": []}
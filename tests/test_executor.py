@@ -0,0 +1,138 @@
+"""Testing the Persistent Event Loop running Async Views."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+from flask import Flask, request
+from flask.testing import FlaskClient
+
+from flask_jeroboam._executor import AsyncExecutor
+from flask_jeroboam.exceptions import RessourceNotFound
+from flask_jeroboam.jeroboam import Jeroboam
+
+
+@pytest.fixture
+def executor():
+    """A fresh AsyncExecutor, closed after the test."""
+    executor = AsyncExecutor()
+    yield executor
+    executor.close()
+
+
+def test_async_views_run_on_a_persistent_loop(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an async view
+    WHEN hit several times
+    THEN it runs on the same loop, off the request thread, with the request context
+    """
+
+    @one_shot_app.get("/async")
+    async def async_view(page: int):
+        await asyncio.sleep(0)
+        return {
+            "page": page,
+            "path": request.path,
+            "thread": threading.current_thread().name,
+            "loop": id(asyncio.get_running_loop()),
+        }
+
+    first = one_shot_client.get("/async?page=1")
+    second = one_shot_client.get("/async?page=2")
+
+    assert first.status_code == 200
+    assert first.json["page"] == 1
+    assert first.json["path"] == "/async"
+    assert first.json["thread"] == "jeroboam-event-loop"
+    assert first.json["loop"] == second.json["loop"]
+    one_shot_app.async_executor.close()
+
+
+def test_async_view_errors_are_propagated(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an async view raising an exception
+    WHEN hit
+    THEN the exception is handled as if raised by a sync view
+    """
+
+    @one_shot_app.get("/async/not_found")
+    async def not_found():
+        raise RessourceNotFound(msg="Async Ressource Not Found")
+
+    response = one_shot_client.get("/async/not_found")
+
+    assert response.status_code == 404
+    one_shot_app.async_executor.close()
+
+
+def test_persistent_event_loop_opt_out(
+    one_shot_app: Jeroboam, monkeypatch: pytest.MonkeyPatch
+):
+    """GIVEN an app with JEROBOAM_PERSISTENT_EVENT_LOOP turned off
+    WHEN converting an async function
+    THEN Flask's own bridge is used
+    """
+    one_shot_app.config["JEROBOAM_PERSISTENT_EVENT_LOOP"] = False
+    monkeypatch.setattr(Flask, "async_to_sync", lambda self, func: "flask_bridge")
+
+    async def view():
+        return {}
+
+    assert one_shot_app.async_to_sync(view) == "flask_bridge"
+
+
+def test_cancelled_coroutines_are_reported(executor: AsyncExecutor):
+    """A coroutine cancelled on the loop is cancelled for its caller too."""
+
+    async def cancelled():
+        raise asyncio.CancelledError
+
+    with pytest.raises(CancelledError):
+        executor.submit(cancelled())
+
+
+def test_submitting_from_the_loop_thread_is_refused(executor: AsyncExecutor):
+    """Blocking the loop on its own thread would deadlock it."""
+
+    async def inner():
+        return "inner"
+
+    async def outer():
+        return executor.submit(inner())
+
+    with pytest.raises(RuntimeError, match="own thread"):
+        executor.submit(outer())
+
+
+def test_loop_is_restarted_in_forked_processes(executor: AsyncExecutor):
+    """A process not owning the loop's thread gets a loop of its own."""
+    parent_loop = executor.loop
+    executor._pid = -1
+
+    assert executor.loop is not parent_loop
+    parent_loop.call_soon_threadsafe(parent_loop.stop)
+
+
+def test_close_an_unstarted_executor():
+    """Closing an executor that never ran is a no-op."""
+    AsyncExecutor().close()
+
+
+def test_loop_is_started_once_under_contention(executor: AsyncExecutor):
+    """GIVEN a thread waiting for the loop while another one starts it
+    WHEN the loop is started
+    THEN the waiting thread uses it instead of starting its own
+    """
+    loops = []
+    with executor._lock:
+        waiter = threading.Thread(target=lambda: loops.append(executor.loop))
+        waiter.start()
+        time.sleep(0.05)
+        executor._start()
+    waiter.join()
+
+    assert loops == [executor._loop]
@@ -0,0 +1,331 @@
+"""Testing Idempotent Routes."""
+
+import threading
+from io import BytesIO
+
+import pytest
+from flask import request
+from flask.testing import FlaskClient
+
+from flask_jeroboam import Body, idempotency
+from flask_jeroboam.idempotency import IdempotencyStore, MemoryIdempotencyStore
+from flask_jeroboam.jeroboam import Jeroboam
+
+
+def test_requests_sent_again_are_replayed(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an idempotent route
+    WHEN a request is sent twice with the same Idempotency-Key
+    THEN the view runs once and its response is replayed
+    """
+    payments = []
+
+    @one_shot_app.post("/idempotency/payments", idempotent=True, status_code=201)
+    def pay(amount: int = Body()):
+        payments.append(amount)
+        return {"payment": len(payments)}
+
+    headers = {"Idempotency-Key": "a1"}
+    first = one_shot_client.post(
+        "/idempotency/payments", json={"amount": 100}, headers=headers
+    )
+    again = one_shot_client.post(
+        "/idempotency/payments", json={"amount": 100}, headers=headers
+    )
+
+    assert payments == [100]
+    assert (again.status_code, again.json) == (first.status_code, first.json)
+    assert again.json == {"payment": 1}
+    assert again.status_code == 201
+    assert again.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+
+
+def test_keys_are_scoped_to_the_path_of_the_request(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an idempotent route with a path argument
+    WHEN the same Idempotency-Key is sent for two different paths
+    THEN the view runs for each of them
+    """
+    paid = []
+
+    @one_shot_app.post("/idempotency/orders/<int:order_id>/pay", idempotent=True)
+    def pay_order(order_id: int):
+        paid.append(order_id)
+        return {"paid": order_id}
+
+    headers = {"Idempotency-Key": "k"}
+    first = one_shot_client.post("/idempotency/orders/1/pay", headers=headers)
+    second = one_shot_client.post("/idempotency/orders/2/pay", headers=headers)
+
+    assert paid == [1, 2]
+    assert second.json == {"paid": 2}
+    assert "Idempotent-Replayed" not in second.headers
+    assert first.json == {"paid": 1}
+
+
+def test_keys_are_scoped_to_the_client(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN idempotent routes, scoped by IP address or by an API key
+    WHEN two clients send the same Idempotency-Key
+    THEN the view runs for each of them, and their responses are not shared
+    """
+    paid: list[str | None] = []
+
+    @one_shot_app.post("/idempotency/by-address", idempotent=True)
+    def by_address():
+        paid.append(request.remote_addr)
+        return {"client": request.remote_addr}
+
+    @one_shot_app.post(
+        "/idempotency/by-api-key",
+        idempotent=True,
+        idempotency_scope=lambda: request.headers["X-Api-Key"],
+    )
+    def by_api_key():
+        paid.append(request.headers["X-Api-Key"])
+        return {"client": request.headers["X-Api-Key"]}
+
+    headers = {"Idempotency-Key": "k"}
+    for address in ["10.0.0.1", "10.0.0.2", "10.0.0.1"]:
+        one_shot_client.post(
+            "/idempotency/by-address",
+            headers=headers,
+            environ_overrides={"REMOTE_ADDR": address},
+        )
+    replies = [
+        one_shot_client.post(
+            "/idempotency/by-api-key", headers={**headers, "X-Api-Key": api_key}
+        ).json
+        for api_key in ["alice", "bob"]
+    ]
+
+    assert paid == ["10.0.0.1", "10.0.0.2", "alice", "bob"]
+    assert replies == [{"client": "alice"}, {"client": "bob"}]
+
+
+def test_keys_reused_with_another_body_are_rejected(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an idempotent route
+    WHEN an Idempotency-Key is sent again with another body
+    THEN the request is rejected with a 422, without running the view
+    """
+    payments = []
+
+    @one_shot_app.post("/idempotency/charges", idempotent=True)
+    def charge(amount: int = Body()):
+        payments.append(amount)
+        return {"amount": amount}
+
+    headers = {"Idempotency-Key": "a1"}
+    one_shot_client.post("/idempotency/charges", json={"amount": 100}, headers=headers)
+    response = one_shot_client.post(
+        "/idempotency/charges", json={"amount": 999}, headers=headers
+    )
+
+    assert response.status_code == 422
+    assert response.json == {"message": "Unprocessable Entity"}
+    assert payments == [100]
+
+
+def test_requests_without_a_key_always_run(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an idempotent route
+    WHEN requests are sent without an Idempotency-Key, or with different ones
+    THEN the view runs for each of them
+    """
+    calls: list[int] = []
+
+    @one_shot_app.post("/idempotency/events", idempotent=True)
+    def record():
+        calls.append(len(calls))
+        return {}
+
+    one_shot_client.post("/idempotency/events")
+    one_shot_client.post("/idempotency/events")
+    one_shot_client.post("/idempotency/events", headers={"Idempotency-Key": "a1"})
+    one_shot_client.post("/idempotency/events", headers={"Idempotency-Key": "b2"})
+
+    assert calls == [0, 1, 2, 3]
+
+
+def test_requests_sent_again_while_running_conflict(one_shot_app: Jeroboam):
+    """GIVEN an idempotent route
+    WHEN a request is sent again while the first one runs
+    THEN it is rejected with a 409, and replayed once the first one is done
+    """
+    started, release = threading.Event(), threading.Event()
+
+    @one_shot_app.post("/idempotency/transfers", idempotent=True)
+    def transfer():
+        started.set()
+        release.wait(timeout=1)
+        return {"status": "done"}
+
+    headers = {"Idempotency-Key": "a1"}
+    thread = threading.Thread(
+        target=lambda: one_shot_app.test_client().post(
+            "/idempotency/transfers", headers=headers
+        )
+    )
+    thread.start()
+    started.wait(timeout=1)
+    client = one_shot_app.test_client()
+    conflict = client.post("/idempotency/transfers", headers=headers)
+    release.set()
+    thread.join()
+    replayed = client.post("/idempotency/transfers", headers=headers)
+
+    assert conflict.status_code == 409
+    assert conflict.json == {"message": "Conflict"}
+    assert replayed.json == {"status": "done"}
+
+
+def test_failed_requests_can_be_retried(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an idempotent route
+    WHEN a request fails validation, then with a server error, then succeeds
+    THEN the view runs again on each retry
+    """
+    calls = []
+
+    @one_shot_app.post("/idempotency/refunds", idempotent=True)
+    def refund(amount: int = Body()):
+        calls.append(amount)
+        if len(calls) == 1:
+            return {"message": "Unavailable"}, 502
+        return {"refund": amount}
+
+    headers = {"Idempotency-Key": "a1"}
+    invalid = one_shot_client.post(
+        "/idempotency/refunds", json={"amount": "a"}, headers=headers
+    )
+    failed = one_shot_client.post(
+        "/idempotency/refunds", json={"amount": 10}, headers=headers
+    )
+    retried = one_shot_client.post(
+        "/idempotency/refunds", json={"amount": 10}, headers=headers
+    )
+
+    assert invalid.status_code == 400
+    assert failed.status_code == 502
+    assert retried.json == {"refund": 10}
+    assert calls == [10, 10]
+
+
+def test_keys_are_forgotten(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient, monkeypatch
+):
+    """GIVEN an idempotent route, with room for a single key kept for a minute
+    WHEN requests are sent again after another key, or after a minute
+    THEN the view runs again
+    """
+    now = [1000.0]
+    monkeypatch.setattr(idempotency, "monotonic", lambda: now[0])
+    monkeypatch.setattr(idempotency, "MAX_IDEMPOTENCY_KEYS", 1)
+    one_shot_app.config["JEROBOAM_IDEMPOTENCY_TTL"] = 60
+    calls: list[int] = []
+
+    @one_shot_app.post("/idempotency/orders", idempotent=True)
+    def order():
+        calls.append(len(calls))
+        return {}
+
+    def send(key: str):
+        one_shot_client.post("/idempotency/orders", headers={"Idempotency-Key": key})
+
+    send("a1")
+    send("a1")
+    send("b2")
+    send("a1")
+    now[0] += 60
+    send("a1")
+
+    assert calls == [0, 1, 2, 3]
+
+
+def test_keys_expiring_while_claimed_are_claimed_again(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a key expiring between a failed claim and reading its record
+    WHEN a request is sent with it
+    THEN the key is claimed again and the view runs, instead of a 409
+    """
+
+    class ExpiringStore(MemoryIdempotencyStore):
+        def claim(self, key: str, fingerprint: str) -> bool:
+            self.claims = getattr(self, "claims", 0) + 1
+            return self.claims > 1 and super().claim(key, fingerprint)
+
+    one_shot_app.idempotency_store = ExpiringStore(ttl=60)
+
+    @one_shot_app.post("/idempotency/expiring", idempotent=True)
+    def expiring():
+        return {"status": "done"}
+
+    response = one_shot_client.post(
+        "/idempotency/expiring", headers={"Idempotency-Key": "a1"}
+    )
+
+    assert response.json == {"status": "done"}
+
+
+def test_only_routes_with_a_body_can_be_idempotent(one_shot_app: Jeroboam):
+    """GIVEN an idempotent GET route
+    WHEN registering it
+    THEN a ValueError is raised
+    """
+    with pytest.raises(
+        ValueError, match="Only POST, PUT, PATCH and DELETE routes can be idempotent"
+    ):
+
+        @one_shot_app.get("/idempotency/invalid", idempotent=True)
+        def invalid():
+            return {}
+
+
+@pytest.mark.parametrize(
+    "method,args",
+    [
+        ("claim", ("key", "fingerprint")),
+        ("get", ("key",)),
+        ("save", ("key", None)),
+        ("release", ("key",)),
+    ],
+)
+def test_stores_must_implement_their_methods(method: str, args: tuple):
+    """GIVEN the base idempotency store
+    WHEN calling one of its methods
+    THEN NotImplementedError is raised
+    """
+    with pytest.raises(NotImplementedError):
+        getattr(IdempotencyStore(), method)(*args)
+
+
+def test_bodies_are_hashed_within_their_size_limit(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an idempotent route limiting its body size
+    WHEN a chunked body over the limit is sent with an Idempotency-Key
+    THEN it is rejected with a 413 before being hashed
+    """
+
+    @one_shot_app.post("/idempotency/limited", idempotent=True, max_body_size=8)
+    def limited(note: str = Body()):
+        return {}  # pragma: no cover
+
+    response = one_shot_client.post(
+        "/idempotency/limited",
+        input_stream=BytesIO(b'{"note": "far too long for the limit"}'),
+        content_type="application/json",
+        headers={"Idempotency-Key": "a1", "Transfer-Encoding": "chunked"},
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+
+    assert response.status_code == 413
@@ -0,0 +1,147 @@
+"""Testing BackgroundTasks injected into views and dependencies.
+
+Their tasks run once the WSGI server closes the response, either on the
+request thread or on a bounded pool of worker threads.
+"""
+
+import threading
+
+from flask import current_app
+from flask.testing import FlaskClient
+
+from flask_jeroboam import Depends, Jeroboam
+from flask_jeroboam.background import BackgroundTasks
+from flask_jeroboam.exceptions import RessourceNotFound
+
+
+def test_tasks_run_once_the_response_is_closed(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a view and its dependency adding background tasks
+    WHEN the view is requested
+    THEN the tasks run in order, within an app context, once the response closes
+    """
+    calls: list[str] = []
+
+    def audit(tasks: BackgroundTasks):
+        tasks.add_task(calls.append, "audit")
+
+    @one_shot_app.get("/background/audited")
+    def audited(page: int, tasks: BackgroundTasks, _=Depends(audit)):
+        tasks.add_task(lambda: calls.append(current_app.name))
+        return {"page": page}
+
+    response = one_shot_client.get("/background/audited?page=1")
+
+    assert response.json == {"page": 1}
+    assert calls == []
+    response.close()
+    assert calls == ["audit", one_shot_app.name]
+    assert one_shot_app.background_runner.metrics == {
+        "scheduled": 2,
+        "completed": 2,
+        "failed": 0,
+        "overflowed": 0,
+        "pending": 0,
+    }
+
+
+def test_tasks_are_dropped_when_the_view_raises(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a view raising after adding a background task
+    WHEN the view is requested
+    THEN the task never runs
+    """
+    calls: list[str] = []
+
+    @one_shot_app.get("/background/failing")
+    def failing(tasks: BackgroundTasks):
+        tasks.add_task(calls.append, "never")
+        raise RessourceNotFound(msg="Not Found")
+
+    response = one_shot_client.get("/background/failing", buffered=True)
+
+    assert response.status_code == 404
+    assert calls == []
+    assert one_shot_app.background_runner.metrics["scheduled"] == 0
+
+
+def test_failing_tasks_are_logged_and_counted(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient, caplog
+):
+    """GIVEN a failing background task followed by another one
+    WHEN the response is closed
+    THEN the failure is logged and counted, and the next task still runs
+    """
+    calls: list[str] = []
+
+    @one_shot_app.post("/background/flaky", status_code=202)
+    def flaky(tasks: BackgroundTasks):
+        tasks.add_task(lambda: 1 / 0)
+        tasks.add_task(calls.append, "next")
+        return {}
+
+    one_shot_client.post("/background/flaky", buffered=True)
+
+    assert calls == ["next"]
+    assert "Background task" in caplog.text
+    metrics = one_shot_app.background_runner.metrics
+    assert (metrics["completed"], metrics["failed"]) == (1, 1)
+
+
+def test_empty_background_tasks_are_not_scheduled(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a view not adding any task to its BackgroundTasks
+    WHEN the response is closed
+    THEN nothing is scheduled, and there is no pool to close
+    """
+
+    @one_shot_app.get("/background/idle")
+    def idle(tasks: BackgroundTasks):
+        return {}
+
+    one_shot_client.get("/background/idle", buffered=True)
+    one_shot_app.background_runner.close()
+
+    assert one_shot_app.background_runner.metrics["scheduled"] == 0
+
+
+def test_tasks_run_on_a_bounded_pool(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a background pool with a single slot
+    WHEN a second request comes in while the first one's tasks still run
+    THEN the first tasks run on the pool and the second ones on the request thread
+    """
+    one_shot_app.config.update(
+        JEROBOAM_BACKGROUND_WORKERS=1, JEROBOAM_BACKGROUND_QUEUE_SIZE=1
+    )
+    release = threading.Event()
+    threads = []
+
+    def task():
+        threads.append(threading.current_thread().name)
+        release.wait(timeout=1)
+
+    @one_shot_app.get("/background/pooled")
+    def pooled(tasks: BackgroundTasks):
+        tasks.add_task(task)
+        return {}
+
+    one_shot_client.get("/background/pooled", buffered=True)
+    release_after_overflow = threading.Timer(0.01, release.set)
+    release_after_overflow.start()
+    one_shot_client.get("/background/pooled", buffered=True)
+    one_shot_app.background_runner.close()
+
+    assert sorted(threads) == sorted(
+        ["jeroboam-background_0", threading.current_thread().name]
+    )
+    metrics = one_shot_app.background_runner.metrics
+    assert (metrics["overflowed"], metrics["completed"], metrics["pending"]) == (
+        1,
+        2,
+        0,
+    )
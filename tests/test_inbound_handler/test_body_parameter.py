@@ -1,7 +1,9 @@
+import io
+
 import pytest
 from flask.testing import FlaskClient
 
-from flask_jeroboam import Blueprint, Jeroboam
+from flask_jeroboam import Blueprint, Jeroboam, decoders
 from flask_jeroboam.models import InboundModel
 from flask_jeroboam.view_arguments.functions import Body
 
@@ -16,6 +18,16 @@ response_not_valid_int = {
 }
 
 
+class OrderLineIn(InboundModel):
+    sku: str
+    qty: int
+
+
+class OrderIn(InboundModel):
+    name: str
+    tags: list[str]
+
+
 def _valid(value) -> dict:
     """Valid function."""
     return {"payload": value}
@@ -109,3 +121,204 @@ def test_put_multi_body_with_empty_string_rule(
     response = one_shot_client.put("/spirits", json={"qty": 5, "name": "cognac"})
     assert response.status_code == 201
     assert response.json == {"qty": 5, "name": "cognac"}
+
+
+def test_post_multi_body_with_default_factory(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """A body argument with a default_factory is optional in the body model."""
+
+    @one_shot_app.post("/body/default_factory")
+    def post_with_default_factory(
+        name: str, tags: list[str] = Body(default_factory=list)
+    ):
+        return {"name": name, "tags": tags}
+
+    response = one_shot_client.post("/body/default_factory", json={"name": "cognac"})
+    assert response.status_code == 201
+    assert response.json == {"name": "cognac", "tags": []}
+
+
+@pytest.mark.parametrize(
+    "route_limit,config_limit,payload,expected_status",
+    [
+        (32, None, "short", 201),
+        (32, None, "far_too_long_for_the_limit", 413),
+        (None, 32, "far_too_long_for_the_limit", 413),
+        (1024, 32, "far_too_long_for_the_limit", 201),
+    ],
+)
+def test_max_body_size(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    route_limit,
+    config_limit,
+    payload: str,
+    expected_status: int,
+):
+    """GIVEN a route limiting its body size, by option or configuration
+    WHEN the declared Content-Length exceeds the limit
+    THEN the request is rejected with a 413 before the body is read
+    """
+    one_shot_app.config["JEROBOAM_MAX_BODY_SIZE"] = config_limit
+
+    @one_shot_app.post("/body/limited", max_body_size=route_limit)
+    def post_limited(payload: str):
+        return {"payload": payload}
+
+    response = one_shot_client.post("/body/limited", json={"payload": payload})
+    assert response.status_code == expected_status
+    if expected_status == 413:
+        assert response.json == {"message": "Request Entity Too Large"}
+
+
+@pytest.mark.parametrize(
+    "payload,expected_status",
+    [("short", 201), ("far_too_long_for_the_limit", 413)],
+)
+def test_max_body_size_while_streaming(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    payload: str,
+    expected_status: int,
+):
+    """GIVEN a route limiting its body size
+    WHEN a chunked body, without Content-Length, is streamed
+    THEN it is rejected with a 413 as soon as it exceeds the limit
+    """
+
+    @one_shot_app.post("/body/limited", max_body_size=32)
+    def post_limited(payload: str):
+        return {"payload": payload}
+
+    response = one_shot_client.post(
+        "/body/limited",
+        input_stream=io.BytesIO(f'{{"payload": "{payload}"}}'.encode()),
+        content_type="application/json",
+        headers={"Transfer-Encoding": "chunked"},
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+    assert response.status_code == expected_status
+
+
+def test_unsupported_media_types_are_rejected_before_the_size(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a route limiting its body size
+    WHEN a body too large, in a media type it does not accept, is sent
+    THEN it is rejected with a 415, unread
+    """
+
+    @one_shot_app.post("/body/limited", max_body_size=4)
+    def post_limited(payload: str):
+        return {"payload": payload}
+
+    response = one_shot_client.post(
+        "/body/limited", data="far_too_long", content_type="text/plain"
+    )
+
+    assert response.status_code == 415
+    assert response.json == {"message": "Unsupported Media Type"}
+
+
+@pytest.mark.parametrize(
+    "media_type,content_type,data,expected_status,expected_response",
+    [
+        (
+            "application/json",
+            "application/vnd.api+json",
+            b'[{"sku": "a", "qty": 1}]',
+            201,
+            [{"sku": "a", "qty": 1}],
+        ),
+        (
+            "application/x-ndjson",
+            "application/x-ndjson",
+            b'{"sku": "a", "qty": 1}\n\n{"sku": "b", "qty": 2}\n',
+            201,
+            [{"sku": "a", "qty": 1}, {"sku": "b", "qty": 2}],
+        ),
+        (
+            "text/csv",
+            "text/csv",
+            b"sku,qty\r\na,1\r\nb,2\r\n",
+            201,
+            [{"sku": "a", "qty": 1}, {"sku": "b", "qty": 2}],
+        ),
+        ("application/x-ndjson", "application/x-ndjson", b"{not json", 400, None),
+        ("application/x-ndjson", "application/json", b"[]", 415, None),
+        ("text/csv", "text/plain", b"sku,qty", 415, None),
+    ],
+)
+def test_body_decoders(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    media_type: str,
+    content_type: str,
+    data: bytes,
+    expected_status: int,
+    expected_response,
+):
+    """GIVEN a Body parameter declaring a media type
+    WHEN hit with a body of some content type
+    THEN it is decoded by the decoder of its media type, or rejected
+    """
+
+    @one_shot_app.post("/body/decoded")
+    def decoded(lines: list[OrderLineIn] = Body(media_type=media_type)):
+        return [line.model_dump() for line in lines]
+
+    response = one_shot_client.post(
+        "/body/decoded", data=data, content_type=content_type
+    )
+
+    assert response.status_code == expected_status
+    if expected_response is not None:
+        assert response.json == expected_response
+
+
+def test_body_form_decoder(one_shot_app: Jeroboam, one_shot_client: FlaskClient):
+    """GIVEN a Body parameter declaring an urlencoded media type
+    WHEN hit with an urlencoded body
+    THEN it is decoded as a dict, repeated keys as lists
+    """
+
+    @one_shot_app.post("/body/form")
+    def form(
+        payload: OrderIn = Body(media_type="application/x-www-form-urlencoded"),
+    ):
+        return payload.model_dump()
+
+    response = one_shot_client.post(
+        "/body/form", data={"name": "cognac", "tags": ["old", "fine"]}
+    )
+
+    assert response.status_code == 201
+    assert response.json == {"name": "cognac", "tags": ["old", "fine"]}
+
+
+def test_register_body_decoder(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """GIVEN a body decoder registered for a custom media type
+    WHEN a route declaring it is hit with that content type
+    THEN the body is decoded by the registered decoder
+    """
+    monkeypatch.setattr(decoders, "body_decoders", dict(decoders.body_decoders))
+    decoders.register_body_decoder(
+        "application/x-reversed",
+        lambda request: {"payload": request.get_data()[::-1].decode()},
+    )
+
+    @one_shot_app.post("/body/reversed")
+    def reversed_(payload: str = Body(media_type="application/x-reversed")):
+        return {"payload": payload}
+
+    response = one_shot_client.post(
+        "/body/reversed", data=b"kcanoc", content_type="application/x-reversed"
+    )
+
+    assert response.status_code == 201
+    assert response.json == {"payload": "conack"}
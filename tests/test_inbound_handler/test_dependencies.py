@@ -0,0 +1,279 @@
+"""Testing Dependencies injected with Depends.
+
+Dependencies are solved into a graph at registration. At request time, each
+one runs once, after the whole request has been validated, and independent
+async dependencies are awaited concurrently.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from flask import request
+from flask.testing import FlaskClient
+
+from flask_jeroboam import Depends, Header, Jeroboam
+from flask_jeroboam.dependencies import DependencyGraph, SolvedDependency
+from flask_jeroboam.exceptions import RessourceNotFound
+
+
+def test_dependencies_get_their_arguments_from_the_request(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a dependency with a header argument, shared with the view
+    WHEN the view is requested
+    THEN both get the validated header
+    """
+
+    def get_tenant(x_tenant: int = Header()):
+        return {"id": x_tenant}
+
+    @one_shot_app.get("/dependencies/tenant")
+    def read_tenant(page: int, x_tenant: int = Header(), tenant=Depends(get_tenant)):
+        return {"page": page, "header": x_tenant, "tenant": tenant}
+
+    response = one_shot_client.get(
+        "/dependencies/tenant?page=2", headers={"X-Tenant": "7"}
+    )
+
+    assert response.status_code == 200
+    assert response.json == {"page": 2, "header": 7, "tenant": {"id": 7}}
+
+
+def test_shared_dependencies_run_once_per_request(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN two dependencies depending on the same one
+    WHEN the view is requested twice
+    THEN the shared dependency runs once per request
+    """
+    calls = []
+
+    def get_session():
+        calls.append("session")
+        return len(calls)
+
+    def get_user(session=Depends(get_session)):
+        return {"user": session}
+
+    def get_permissions(session=Depends(get_session)):
+        return {"permissions": session}
+
+    @one_shot_app.get("/dependencies/shared")
+    def read_shared(user=Depends(get_user), permissions=Depends(get_permissions)):
+        return {**user, **permissions}
+
+    first = one_shot_client.get("/dependencies/shared")
+    second = one_shot_client.get("/dependencies/shared")
+
+    assert first.json == {"user": 1, "permissions": 1}
+    assert second.json == {"user": 2, "permissions": 2}
+    assert calls == ["session", "session"]
+
+
+def test_uncached_dependencies_run_for_each_dependent(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a dependency declared with use_cache=False by two dependents
+    WHEN the view is requested
+    THEN it runs once for each of them
+    """
+    calls = []
+
+    def new_id():
+        calls.append("id")
+        return len(calls)
+
+    @one_shot_app.get("/dependencies/uncached")
+    def read_ids(
+        first=Depends(new_id, use_cache=False), second=Depends(new_id, use_cache=False)
+    ):
+        return {"first": first, "second": second}
+
+    response = one_shot_client.get("/dependencies/uncached")
+
+    assert response.json == {"first": 1, "second": 2}
+
+
+def test_dependencies_run_after_validation(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a dependency with an invalid argument
+    WHEN the view is requested
+    THEN a 400 is returned and no dependency runs
+    """
+    calls = []
+
+    def get_tenant(x_tenant: int = Header()):
+        calls.append(x_tenant)
+
+    def get_clock():
+        calls.append("clock")
+
+    @one_shot_app.get("/dependencies/invalid")
+    def read_invalid(tenant=Depends(get_tenant), clock=Depends(get_clock)):
+        return {}
+
+    response = one_shot_client.get(
+        "/dependencies/invalid", headers={"X-Tenant": "not an int"}
+    )
+
+    assert response.status_code == 400
+    assert response.json["detail"][0]["loc"] == ["header", "X-Tenant"]
+    assert calls == []
+
+
+def test_independent_async_dependencies_run_concurrently(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN two async dependencies that each wait for the other
+    WHEN the view is requested
+    THEN they are awaited concurrently, with the results of their sync
+    sub-dependency
+    """
+
+    def rendezvous():
+        return {"left": asyncio.Event(), "right": asyncio.Event()}
+
+    async def left(events=Depends(rendezvous)):
+        events["left"].set()
+        await asyncio.wait_for(events["right"].wait(), timeout=1)
+        return "left"
+
+    async def right(events=Depends(rendezvous)):
+        events["right"].set()
+        await asyncio.wait_for(events["left"].wait(), timeout=1)
+        return "right"
+
+    @one_shot_app.get("/dependencies/concurrent")
+    def read_concurrent(left=Depends(left), right=Depends(right)):
+        return {"sides": [left, right]}
+
+    response = one_shot_client.get("/dependencies/concurrent")
+
+    assert response.status_code == 200
+    assert response.json == {"sides": ["left", "right"]}
+    one_shot_app.async_executor.close()
+
+
+def test_sync_dependencies_of_async_graphs_run_off_the_loop(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a blocking sync dependency, waiting for an async one
+    WHEN the view is requested
+    THEN the sync dependency runs on a thread, within the request context,
+    while the async one runs on the loop
+    """
+    signalled = threading.Event()
+
+    def blocking():
+        return {"signalled": signalled.wait(timeout=1), "path": request.path}
+
+    async def signal():
+        signalled.set()
+
+    @one_shot_app.get("/dependencies/blocking")
+    def read_blocking(blocked=Depends(blocking), _=Depends(signal)):
+        return blocked
+
+    response = one_shot_client.get("/dependencies/blocking")
+
+    assert response.json == {"signalled": True, "path": "/dependencies/blocking"}
+    one_shot_app.async_executor.close()
+
+
+def test_circular_dependencies_are_rejected(one_shot_app: Jeroboam):
+    """GIVEN dependencies depending on each other
+    WHEN registering a view depending on them
+    THEN a ValueError naming the cycle is raised
+    """
+    placeholder = Depends(lambda: None)
+
+    def first(value=placeholder):
+        return value  # pragma: no cover
+
+    def second(value=Depends(first)):
+        return value  # pragma: no cover
+
+    placeholder.call = second
+
+    with pytest.raises(
+        ValueError, match="Circular dependency: second -> first -> second."
+    ):
+
+        @one_shot_app.get("/dependencies/circular")
+        def read_circular(value=Depends(second)):
+            return value  # pragma: no cover
+
+
+def test_circular_graphs_are_rejected():
+    """GIVEN a solved dependency depending on itself
+    WHEN ordering its graph
+    THEN a ValueError naming the cycle is raised
+    """
+
+    def loop():
+        return None  # pragma: no cover
+
+    solved = SolvedDependency(loop, [], {})
+    solved.sub_dependencies["value"] = solved
+
+    with pytest.raises(ValueError, match="Circular dependency: loop -> loop."):
+        DependencyGraph({"value": solved})
+
+
+def test_dependency_errors_are_handled(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an async dependency raising an exception
+    WHEN the view is requested
+    THEN the exception is handled as if raised by the view
+    """
+
+    async def get_wine(wine_id: int):
+        raise RessourceNotFound(msg=f"Wine {wine_id} Not Found")
+
+    async def get_year():
+        return 2020
+
+    @one_shot_app.get("/dependencies/wines/<int:wine_id>")
+    def read_wine(wine=Depends(get_wine), year=Depends(get_year)):
+        return wine
+
+    response = one_shot_client.get("/dependencies/wines/1")
+
+    assert response.status_code == 404
+    one_shot_app.async_executor.close()
+
+
+def test_dependency_arguments_are_documented(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a dependency with a header argument
+    WHEN building the OpenAPI documentation
+    THEN the header is documented as a parameter of the view
+    """
+
+    def get_tenant(x_tenant: int = Header()):
+        return x_tenant
+
+    @one_shot_app.get("/dependencies/documented")
+    def read_documented(tenant=Depends(get_tenant)):
+        return {}
+
+    paths = one_shot_client.get("/openapi.json").json["paths"]
+    parameters = paths["/dependencies/documented"]["get"]["parameters"]
+
+    assert [parameter["name"] for parameter in parameters] == ["X-Tenant"]
+
+
+def test_dependency_repr():
+    """GIVEN a dependency
+    WHEN represented
+    THEN it shows the name of its callable
+    """
+
+    def get_session():
+        return None
+
+    assert repr(Depends(get_session)) == "Dependency(get_session)"
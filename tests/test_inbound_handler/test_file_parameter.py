@@ -3,9 +3,29 @@
 The corresponding endpoints are defined in the test_app.apps.file.py module.
 """
 
+import hashlib
 from io import BytesIO
+from tempfile import TemporaryFile
 
+import pytest
 from flask.testing import FlaskClient
+from werkzeug.datastructures import FileStorage
+from werkzeug.test import encode_multipart
+
+from flask_jeroboam import File, Jeroboam, datastructures
+from flask_jeroboam.datastructures import SpooledUpload, UploadFile, _sendfile
+from flask_jeroboam.requests import JeroboamRequest
+
+
+def _failing_copier(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    raise OSError("Not supported")
+
+
+def _stalling_copier(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copy the first 5 bytes, then nothing more, like copy_file_range may."""
+    if offset >= 5:
+        return 0
+    return datastructures._sendfile(src_fd, dst_fd, offset, min(count, 5 - offset))
 
 
 def test_valid_payload_in_files_is_injected(client: FlaskClient):
@@ -25,3 +45,204 @@ def test_valid_payload_in_files_is_injected(client: FlaskClient):
 
     assert response.json == {"file_content": "b'Hello World !!'"}
     assert response.status_code == 201
+
+
+@pytest.mark.parametrize(
+    "hash_name,expected_digest",
+    [
+        (None, None),
+        ("sha256", hashlib.sha256(b"Hello World !!").hexdigest()),
+    ],
+)
+def test_uploads_are_hashed_while_streamed(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    hash_name,
+    expected_digest,
+):
+    """GIVEN an app configured with an upload hash algorithm
+    WHEN a file is uploaded
+    THEN its size and digest are available on the injected UploadFile
+    """
+    one_shot_app.config["JEROBOAM_UPLOAD_HASH"] = hash_name
+
+    @one_shot_app.post("/file/hashed")
+    def hashed(file: UploadFile = File()):
+        return {"size": file.size, "digest": file.hexdigest}
+
+    response = one_shot_client.post(
+        "/file/hashed", data={"file": (BytesIO(b"Hello World !!"), "hello.txt")}
+    )
+
+    assert response.status_code == 201
+    assert response.json == {"size": 14, "digest": expected_digest}
+
+
+def test_unknown_upload_hash_is_rejected_when_configured():
+    """GIVEN an app configured with an unknown upload hash algorithm
+    WHEN it is set up
+    THEN a ValueError is raised, before any upload
+    """
+    app = Jeroboam(__name__)
+    app.config["JEROBOAM_UPLOAD_HASH"] = "sha-1000"
+
+    with pytest.raises(ValueError, match="must name a hashlib algorithm"):
+        app.init_app()
+
+
+@pytest.mark.parametrize("spool_size,rolled", [(None, False), (4, True), (0, True)])
+def test_uploads_roll_over_to_disk_past_the_spool_size(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    spool_size,
+    rolled: bool,
+):
+    """GIVEN an app configured with an upload spool size
+    WHEN a larger file is uploaded
+    THEN it is written to disk rather than kept in memory
+    """
+    one_shot_app.config["JEROBOAM_UPLOAD_SPOOL_SIZE"] = spool_size
+
+    @one_shot_app.post("/file/spooled")
+    def spooled(file: UploadFile = File()):
+        assert isinstance(file.stream, SpooledUpload)
+        return {"rolled": not isinstance(file.stream._file, BytesIO)}
+
+    response = one_shot_client.post(
+        "/file/spooled", data={"file": (BytesIO(b"Hello World !!"), "hello.txt")}
+    )
+
+    assert response.json == {"rolled": rolled}
+
+
+def test_uploads_over_the_size_cap_are_rejected(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an app capping the size of uploaded files
+    WHEN a larger file is uploaded
+    THEN the request is rejected with a 413 while it is streamed
+    """
+    one_shot_app.config["JEROBOAM_MAX_UPLOAD_SIZE"] = 4
+
+    @one_shot_app.post("/file/capped")
+    def capped(file: UploadFile = File()):
+        return {}
+
+    response = one_shot_client.post(
+        "/file/capped", data={"file": (BytesIO(b"Hello World !!"), "hello.txt")}
+    )
+
+    assert response.status_code == 413
+
+
+@pytest.mark.parametrize("overflow,expected_status", [(0, 201), (1, 413)])
+def test_chunked_uploads_are_capped_while_streamed(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    monkeypatch,
+    overflow: int,
+    expected_status: int,
+):
+    """GIVEN a route limiting its body size
+    WHEN a chunked multipart body is uploaded, up to or over the limit
+    THEN it is streamed to disk, never buffered whole, and rejected past the limit
+    """
+    one_shot_app.config["JEROBOAM_UPLOAD_SPOOL_SIZE"] = 1
+    monkeypatch.setattr(JeroboamRequest, "get_data", None)
+    boundary, body = encode_multipart(
+        {"file": FileStorage(BytesIO(b"Hello World !!"), "hello.txt")}
+    )
+
+    @one_shot_app.post("/file/chunked", max_body_size=len(body) - overflow)
+    def chunked(file: UploadFile = File()):
+        assert isinstance(file.stream, SpooledUpload)
+        return {"rolled": not isinstance(file.stream._file, BytesIO)}
+
+    response = one_shot_client.post(
+        "/file/chunked",
+        input_stream=BytesIO(body),
+        content_type=f"multipart/form-data; boundary={boundary}",
+        headers={"Transfer-Encoding": "chunked"},
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+
+    assert response.status_code == expected_status
+    if expected_status == 201:
+        assert response.json == {"rolled": True}
+
+
+def test_upload_file_validation_keeps_upload_files():
+    """GIVEN an UploadFile
+    WHEN validated as an UploadFile
+    THEN it is returned as is
+    """
+    upload = UploadFile(BytesIO(b"Hello World !!"), filename="hello.txt")
+
+    assert UploadFile.validate(upload) is upload
+
+
+@pytest.mark.parametrize("spool_size", [None, 4])
+def test_uploads_are_mapped_and_saved_without_copies(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    spool_size,
+    tmp_path,
+):
+    """GIVEN an upload kept in memory or spooled to disk
+    WHEN mapped or saved to a path
+    THEN its content is read and written in full
+    """
+    one_shot_app.config["JEROBOAM_UPLOAD_SPOOL_SIZE"] = spool_size
+
+    @one_shot_app.post("/file/mapped")
+    def mapped(file: UploadFile = File()):
+        with file.mapped() as view:
+            content = bytes(view[:5])
+        written = file.save_to(tmp_path / "hello.txt")
+        return {"head": content.decode(), "written": written}
+
+    response = one_shot_client.post(
+        "/file/mapped", data={"file": (BytesIO(b"Hello World !!"), "hello.txt")}
+    )
+
+    assert response.json == {"head": "Hello", "written": 14}
+    assert (tmp_path / "hello.txt").read_bytes() == b"Hello World !!"
+
+
+def test_empty_upload_on_disk_is_mapped():
+    """GIVEN an empty upload backed by a file
+    WHEN mapped
+    THEN the view is empty
+    """
+    with (
+        TemporaryFile() as stream,
+        UploadFile(stream, filename="empty.txt").mapped() as view,
+    ):
+        assert bytes(view) == b""
+
+
+@pytest.mark.parametrize(
+    "copiers,count",
+    [
+        ((_sendfile,), 20),
+        ((_failing_copier,), 20),
+        ((_stalling_copier,), 14),
+        ((_stalling_copier, _sendfile), 14),
+    ],
+)
+def test_copy_fd_falls_back_on_other_copiers(
+    copiers: tuple, count: int, monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    """GIVEN kernel-side copiers that may be unavailable, or stop midway
+    WHEN copying between file descriptors
+    THEN the content is copied in full by the next copiers, from where they stopped
+    """
+    monkeypatch.setattr(datastructures, "_ZERO_COPIERS", copiers)
+    source = tmp_path / "source.txt"
+    source.write_bytes(b"Hello World !!")
+
+    with open(source, "rb") as src, open(tmp_path / "dst.txt", "wb") as dst:
+        copied = datastructures._copy_fd(src.fileno(), dst.fileno(), count)
+
+    assert copied == 14
+    assert (tmp_path / "dst.txt").read_bytes() == b"Hello World !!"
@@ -1,5 +1,11 @@
+from io import BytesIO
+
+import pytest
+from flask import request
 from flask.testing import FlaskClient
 
+from flask_jeroboam import Form, Jeroboam
+
 
 def test_valid_payload_in_data_is_injected(
     client: FlaskClient,
@@ -66,3 +72,67 @@ def test_multiple_primitive_form_params_use_defaults(
 
     assert response.status_code == 201
     assert response.json == {"name": "John", "age": 34}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"name": "Alice", "age": 25, "legacy": "ignored"},
+        {"name": "Alice", "age": 25, "file": (BytesIO(b"Ignored"), "legacy.txt")},
+    ],
+)
+def test_declared_form_fields_are_extracted_from_large_forms(
+    client: FlaskClient, data: dict
+):
+    """GIVEN a POST endpoint with Form params
+    WHEN hit with an urlencoded or multipart form carrying undeclared fields
+    THEN only the declared fields are injected
+    """
+    response = client.post("/form/primitives_in_form", data=data)
+
+    assert response.status_code == 201
+    assert response.json == {"name": "Alice", "age": 25}
+
+
+@pytest.mark.parametrize("fallback", [None, "before_request", "key_transformer"])
+def test_form_fields_limit(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient, fallback: str | None
+):
+    """GIVEN an app limiting the number of fields of urlencoded forms
+    WHEN hit with a larger form, parsed by the route or read from request.form
+    THEN the request is rejected with a 413
+    """
+    one_shot_app.config["JEROBOAM_MAX_FORM_FIELDS"] = 2
+    if fallback == "before_request":
+        one_shot_app.before_request(lambda: request.form and None)
+    elif fallback == "key_transformer":
+        one_shot_app.query_string_key_transformer = lambda key: key
+
+    @one_shot_app.post("/form/limited")
+    def limited(name: str = Form()):
+        return {"name": name}
+
+    response = one_shot_client.post(
+        "/form/limited", data={"name": "Alice", "a": 1, "b": 2}
+    )
+
+    assert response.status_code == 413
+
+
+def test_already_parsed_form_is_reused(one_shot_app: Jeroboam):
+    """GIVEN a form already parsed before the view, e.g. by a before_request hook
+    WHEN the view's Form params are extracted
+    THEN they are read from request.form
+    """
+
+    @one_shot_app.before_request
+    def parse_form():
+        request.form  # noqa: B018
+
+    @one_shot_app.post("/form/parsed")
+    def parsed(name: str = Form()):
+        return {"name": name}
+
+    response = one_shot_app.test_client().post("/form/parsed", data={"name": "Alice"})
+
+    assert response.json == {"name": "Alice"}
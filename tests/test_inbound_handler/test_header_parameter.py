@@ -1,4 +1,8 @@
 import pytest
+from flask.testing import FlaskClient
+
+from flask_jeroboam import Header
+from flask_jeroboam.jeroboam import Jeroboam
 
 not_a_valid_int = {
     "detail": [
@@ -21,6 +25,24 @@ def _valid(x):
         ("/headers/str", {"test-header": "foobar"}, 200, _valid("foobar")),
         ("/headers/int", {"test-header": "123"}, 200, _valid(123)),
         ("/headers/int", {"test-header": "not_a_valid_int"}, 400, not_a_valid_int),
+        ("/headers/list", {"x-tag": "a, b,c"}, 200, _valid(["a", "b", "c"])),
+        ("/headers/list", [("x-tag", "a"), ("x-tag", "b")], 200, _valid(["a", "b"])),
+        (
+            "/headers/list",
+            {"x-tag": 'a, "b, c"'},
+            200,
+            _valid(["a", "b, c"]),
+        ),
+        ("/headers/optional_list", {}, 200, _valid(None)),
+        ("/headers/optional_list", {"x-tag": "a"}, 200, _valid(["a"])),
+        (
+            "/headers/content_type",
+            {"content-type": "text/csv"},
+            200,
+            _valid("text/csv"),
+        ),
+        ("/headers/alias", {"x-tenant-id": "acme"}, 200, _valid("acme")),
+        ("/headers/no_convert", {"test-header": "foobar"}, 200, _valid("foobar")),
     ],
 )
 def test_get_headers(client, url, header_value, expected_status, expected_response):
@@ -32,3 +54,57 @@ def test_get_headers(client, url, header_value, expected_status, expected_respon
     response = client.get(url, headers=header_value)
     assert response.status_code == expected_status
     assert response.json == expected_response
+
+
+def test_header_names_are_compiled_to_environ_keys(app: Jeroboam):
+    """Header parameters are compiled to their WSGI environ key at registration.
+
+    GIVEN header parameters with and without alias or underscore conversion
+    WHEN the views are registered
+    THEN the header name and environ key are solved once and for all
+    """
+
+    def _header_param(endpoint: str):
+        view = app.view_functions[endpoint].__jeroboam_view__
+        param = view.inbound_handler.header_params[0]
+        return param.alias, param.environ_key
+
+    assert _header_param("headers_params_router.get_header_as_plain_int") == (
+        "Test-Header",
+        "HTTP_TEST_HEADER",
+    )
+    assert _header_param("headers_params_router.get_content_type_header") == (
+        "Content-Type",
+        "CONTENT_TYPE",
+    )
+    assert _header_param("headers_params_router.get_aliased_header") == (
+        "X-Tenant-Id",
+        "HTTP_X_TENANT_ID",
+    )
+    assert _header_param(
+        "headers_params_router.get_header_without_underscore_conversion"
+    ) == ("test_header", "HTTP_TEST_HEADER")
+
+
+def test_missing_headers_get_fresh_defaults(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an endpoint with a mutable default and a default_factory
+    WHEN hit twice without the headers, the view mutating them
+    THEN each request gets its own untouched default
+    """
+
+    @one_shot_app.get("/headers/mutable_defaults")
+    def read_with_mutable_defaults(
+        x_tag: list[str] = Header(["a"]),
+        x_id: list[int] = Header(default_factory=list),
+    ):
+        response = {"tags": list(x_tag), "ids": list(x_id)}
+        x_tag.append("mutated")
+        x_id.append(0)
+        return response
+
+    for _ in range(2):
+        response = one_shot_client.get("/headers/mutable_defaults")
+        assert response.status_code == 200
+        assert response.json == {"tags": ["a"], "ids": []}
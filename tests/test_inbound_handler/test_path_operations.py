@@ -1,6 +1,13 @@
 """Testing path operations."""
 
+from uuid import UUID
+
 import pytest
+from flask.testing import FlaskClient
+
+from flask_jeroboam import Path
+from flask_jeroboam.jeroboam import Jeroboam
+from flask_jeroboam.rule import JeroboamRule
 
 response_not_valid_bool = {
     "detail": [
@@ -353,3 +360,93 @@ def test_path_converter_error_override_jeroboam_validation(
     response = client.get(url)
     assert response.json == expected_response
     assert response.status_code == expected_status
+
+
+a_uuid = "0f4b2c5e-8d36-4c3e-9b55-1c2f3e4d5a6b"
+
+
+@pytest.mark.parametrize(
+    "url,expected_status,expected_response",
+    [
+        ("/path/derived/int/42", 200, valid_42_int),
+        ("/path/derived/int/-3", 200, _valid(-3)),
+        ("/path/derived/int/foobar", 404, not_found),
+        ("/path/derived/int/42.5", 404, not_found),
+        (f"/path/derived/uuid/{a_uuid}", 200, _valid(a_uuid)),
+        ("/path/derived/uuid/foobar", 404, not_found),
+        ("/path/derived/str/foobar", 200, valid_foobar_str),
+        ("/path/derived/explicit/42", 200, valid_42_int),
+        ("/path/derived/explicit/foobar", 400, response_not_valid_int),
+    ],
+)
+def test_get_path_with_derived_converter(
+    client, url, expected_status, expected_response
+):
+    """Test Converters derived from annotations.
+
+    GIVEN a route registered with derive_path_converters
+    WHEN the url is called with a value that does not match the annotation
+    THEN the router rejects it (404) for untyped segments
+    AND explicit converters are left untouched
+    """
+    response = client.get(url)
+    assert response.json == expected_response
+    assert response.status_code == expected_status
+
+
+def test_converted_path_params_skip_validation(one_shot_app: Jeroboam):
+    """Path params already typed by their converter skip pydantic validation.
+
+    GIVEN path params whose converter output matches the annotation
+    WHEN the view is registered
+    THEN only the params needing validation go through the TypeAdapter
+    """
+
+    @one_shot_app.get("/items/<int:item_id>/<uuid:ref>/<int:rank>/<slug>/<other>")
+    def read_item(
+        item_id: int,
+        ref: UUID | None,
+        rank: int = Path(gt=0),
+        slug=None,
+        other: float = 1.0,
+    ):
+        return {}
+
+    view = one_shot_app.view_functions["read_item"].__jeroboam_view__
+    converted = {
+        param.name: param.converted_by_router
+        for param in view.inbound_handler.path_params
+    }
+    assert converted == {
+        "item_id": True,
+        "ref": True,
+        "rank": False,
+        "slug": True,
+        "other": False,
+    }
+
+
+def test_derived_converter_is_registered(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """The derived converter is the one registered on the url map.
+
+    GIVEN a route with an untyped segment and derive_path_converters
+    WHEN it is registered
+    THEN the url rule carries the derived converter
+    AND the OpenAPI path is unaffected
+    """
+
+    @one_shot_app.get("/items/<item_id>", derive_path_converters=True)
+    def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    rule = next(
+        rule
+        for rule in one_shot_app.url_map.iter_rules()
+        if rule.endpoint == "read_item"
+    )
+    assert isinstance(rule, JeroboamRule)
+    assert rule.rule == "/items/<int(signed=True):item_id>"
+    assert rule.openapi_path == "/items/{item_id}"
+    assert one_shot_client.get("/items/-1").json == {"item_id": -1}
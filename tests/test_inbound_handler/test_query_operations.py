@@ -1,6 +1,7 @@
 import pytest
 from flask.testing import FlaskClient
 
+from flask_jeroboam import Query
 from tests.app_test.models.inbound import OptionalModelIn
 
 response_missing = {
@@ -132,3 +133,80 @@ def test_query_optionnal_base_model(
     response = client.get("/query/optional_model")
     assert response.status_code == 200
     assert response.json == OptionalModelIn().model_dump()
+
+
+def _filter(status, tags=(), price=None) -> dict:
+    return {"status": status, "tags": list(tags), "price": price}
+
+
+@pytest.mark.parametrize(
+    "url,expected_status,expected_response",
+    [
+        ("/query/deep_object?filter[status]=open", 200, _filter("open")),
+        (
+            "/query/deep_object?filter[status]=open&filter[tags][]=a&filter[tags][]=b",
+            200,
+            _filter("open", ["a", "b"]),
+        ),
+        (
+            "/query/deep_object?filter[status]=open&filter[tags]=a",
+            200,
+            _filter("open", ["a"]),
+        ),
+        (
+            "/query/deep_object?filter[status]=open&filter[price][min]=10",
+            200,
+            _filter("open", price={"min": 10, "max": None}),
+        ),
+        (
+            "/query/deep_object?status=open",
+            400,
+            {
+                "detail": [
+                    {
+                        "loc": ["query", "filter"],
+                        "msg": "Field required",
+                        "type": "missing",
+                    }
+                ]
+            },
+        ),
+        ("/query/deep_object/optional", 200, {}),
+        ("/query/deep_object/optional?filter[status]=open", 200, _filter("open")),
+        (
+            "/query/deep_object/mapping?sort[name]=asc&sort[age]=desc&other=1",
+            200,
+            {"sort": {"name": "asc", "age": "desc"}},
+        ),
+        ("/query/not_exploded?ids=1,2,3", 200, {"ids": [1, 2, 3]}),
+        ("/query/list/alias?id=1&id=2", 200, {"ids": [1, 2]}),
+        ("/query/list/alias?ids=1&ids=2", 200, {"ids": [1, 2]}),
+        (
+            "/query/not_exploded",
+            400,
+            {
+                "detail": [
+                    {
+                        "loc": ["query", "ids"],
+                        "msg": "Field required",
+                        "type": "missing",
+                    }
+                ]
+            },
+        ),
+    ],
+)
+def test_query_serialization_styles(client, url, expected_status, expected_response):
+    """GIVEN GET endpoints with deepObject and non-exploded query parameters
+    WHEN hit with query strings serialized accordingly
+    THEN the parameters are parsed following their style
+    """
+    response = client.get(url)
+    assert response.json == expected_response
+    assert response.status_code == expected_status
+
+
+def test_unsupported_query_style():
+    """deepObject has no meaning without explode: it is rejected at declaration."""
+    with pytest.raises(ValueError):
+        Query(style="deepObject", explode=False)
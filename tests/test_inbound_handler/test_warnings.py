@@ -1,6 +1,6 @@
 import pytest
 
-from flask_jeroboam import Form
+from flask_jeroboam import Body, Form
 from flask_jeroboam.jeroboam import Jeroboam
 
 
@@ -18,3 +18,19 @@ def test_form_param_on_get_raise_warning():
             return "OK"
 
         app.get("/form_on_get")(form_on_get)
+
+
+def test_body_without_decoder_raise_warning():
+    """A warning is raised when a Body parameter has no decoder for its media type.
+
+    GIVEN a POST view with a Body parameter of an unknown media type
+    WHEN registering the view
+    THEN a warning is raised
+    """
+    with pytest.warns(UserWarning, match="No body decoder"):
+        app = Jeroboam(__name__)
+
+        def unknown_media_type(payload: dict = Body(media_type="application/x-foo")):
+            return "OK"
+
+        app.post("/unknown_media_type")(unknown_media_type)
@@ -0,0 +1,269 @@
+"""Testing Per-Route Concurrency Limits."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+from flask import request
+from flask.testing import FlaskClient
+
+from flask_jeroboam import Body, limits
+from flask_jeroboam.exceptions import RessourceNotFound
+from flask_jeroboam.jeroboam import Jeroboam
+from flask_jeroboam.limits import RateLimitBackend, RateLimiter, SQLiteRateLimitBackend
+
+
+def wait_until(predicate, timeout: float = 1) -> None:
+    """Wait for a condition set by another thread."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_requests_over_the_limit_are_queued(one_shot_app: Jeroboam):
+    """GIVEN a route limited to a single concurrent request
+    WHEN a second request comes in while the first one is served
+    THEN it is queued, then served once the first one is done
+    """
+    release = threading.Event()
+
+    @one_shot_app.get("/limits/report", max_concurrency=1, queue_timeout=1)
+    def report():
+        release.wait(timeout=1)
+        return {"status": "done"}
+
+    responses = []
+
+    def request_report():
+        responses.append(one_shot_app.test_client().get("/limits/report"))
+
+    threads = [threading.Thread(target=request_report) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    wait_until(lambda: one_shot_app.concurrency_gauges["report"]["queued"] == 1)
+
+    gauges = one_shot_app.concurrency_gauges
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert gauges == {"report": {"in_flight": 1, "queued": 1}}
+    assert [response.status_code for response in responses] == [200, 200]
+    assert one_shot_app.concurrency_gauges == {"report": {"in_flight": 0, "queued": 0}}
+
+
+def test_requests_waiting_too_long_are_shed(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a route limited to a single concurrent request, with a queue timeout
+    WHEN a second request waits for longer than the timeout
+    THEN it is rejected with a 503 and a Retry-After header
+    """
+    started, release = threading.Event(), threading.Event()
+
+    @one_shot_app.get("/limits/slow", max_concurrency=1, queue_timeout=0.01)
+    def slow():
+        started.set()
+        release.wait(timeout=1)
+        return {}
+
+    thread = threading.Thread(
+        target=lambda: one_shot_app.test_client().get("/limits/slow")
+    )
+    thread.start()
+    started.wait(timeout=1)
+    response = one_shot_client.get("/limits/slow")
+    release.set()
+    thread.join()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json == {"message": "Service Unavailable"}
+
+
+def test_slots_are_released_when_the_view_raises(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a limited route raising an exception
+    WHEN requested twice
+    THEN its slot is released each time
+    """
+
+    @one_shot_app.get("/limits/missing", max_concurrency=1, queue_timeout=0)
+    def missing():
+        raise RessourceNotFound(msg="Not Found")
+
+    statuses = [one_shot_client.get("/limits/missing").status_code for _ in range(2)]
+
+    assert statuses == [404, 404]
+    assert one_shot_app.concurrency_gauges["missing"] == {"in_flight": 0, "queued": 0}
+
+
+@pytest.mark.parametrize(
+    "options,message",
+    [
+        ({"max_concurrency": 0}, "max_concurrency must be at least 1, not 0."),
+        (
+            {"max_concurrency": 1, "queue_timeout": -1},
+            "queue_timeout must be positive or None, not -1.",
+        ),
+    ],
+)
+def test_invalid_concurrency_limits(one_shot_app: Jeroboam, options, message):
+    """GIVEN invalid concurrency options
+    WHEN registering a route
+    THEN a ValueError is raised
+    """
+    with pytest.raises(ValueError, match=message):
+
+        @one_shot_app.get("/limits/invalid", **options)
+        def invalid():
+            return {}
+
+
+class Clock:
+    """A clock moved forward by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    """Replace the clocks of the rate limit backends."""
+    clock = Clock()
+    monkeypatch.setattr(limits, "monotonic", clock)
+    monkeypatch.setattr(limits, "time", clock)
+    return clock
+
+
+def test_requests_over_the_rate_are_rejected(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient, clock: Clock
+):
+    """GIVEN a route rate limited to two requests a minute
+    WHEN a client sends three requests, then a fourth thirty seconds later
+    THEN the third is rejected with a 429 and a Retry-After header
+    """
+
+    @one_shot_app.get("/limits/search", rate_limit="2/m")
+    def search():
+        return {}
+
+    responses = [one_shot_client.get("/limits/search") for _ in range(3)]
+    clock.now += 30
+    responses.append(one_shot_client.get("/limits/search"))
+
+    assert [response.status_code for response in responses] == [200, 200, 429, 200]
+    assert responses[2].headers["Retry-After"] == "30"
+    assert responses[2].json == {"message": "Too Many Requests"}
+
+
+def test_requests_are_rejected_before_being_parsed(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient, clock: Clock
+):
+    """GIVEN a rate limited route with a body
+    WHEN a client over the rate sends an invalid body
+    THEN the request is rejected for its rate, not its body
+    """
+
+    @one_shot_app.post("/limits/orders", rate_limit="1/h")
+    def create_order(quantity: int = Body()):
+        return {"quantity": quantity}
+
+    one_shot_client.post("/limits/orders", json={"quantity": 1})
+    response = one_shot_client.post("/limits/orders", json={"quantity": "many"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3600"
+
+
+def test_clients_are_told_apart_by_their_key(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient, clock: Clock, monkeypatch
+):
+    """GIVEN a route rate limited per API key, with room for a single client
+    WHEN two clients call it in turn
+    THEN each client has a bucket of its own, forgotten when room is needed
+    """
+    monkeypatch.setattr(limits, "MAX_RATE_LIMITED_CLIENTS", 1)
+
+    @one_shot_app.get(
+        "/limits/keyed",
+        rate_limit="1/d",
+        rate_limit_key=lambda: request.headers["X-Api-Key"],
+    )
+    def keyed():
+        return {}
+
+    statuses = [
+        one_shot_client.get("/limits/keyed", headers={"X-Api-Key": key}).status_code
+        for key in ["alice", "alice", "bob", "alice"]
+    ]
+
+    assert statuses == [200, 429, 200, 200]
+
+
+def test_buckets_can_be_shared_by_worker_processes(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient, clock: Clock, tmp_path
+):
+    """GIVEN a rate limited route, with its buckets kept in a SQLite file
+    WHEN another worker process takes the last token of a client
+    THEN the client is rejected, and its bucket deleted once full again
+    """
+    path = str(tmp_path / "rate_limits.db")
+    one_shot_app.config["JEROBOAM_RATE_LIMIT_STORAGE"] = path
+    other_worker = SQLiteRateLimitBackend(path)
+
+    @one_shot_app.get("/limits/shared", rate_limit="2/s")
+    def shared():
+        return {}
+
+    first = one_shot_client.get("/limits/shared")
+    other_worker.take("shared:127.0.0.1", 2, 2)
+    second = one_shot_client.get("/limits/shared")
+    clock.now += 2
+    other_worker.take("other:127.0.0.1", 2, 2)
+    with sqlite3.connect(path) as connection:
+        keys = connection.execute("SELECT key FROM jeroboam_rate_limits").fetchall()
+
+    assert [first.status_code, second.status_code] == [200, 429]
+    assert keys == [("other:127.0.0.1",)]
+
+
+@pytest.mark.parametrize(
+    "rate,capacity,period",
+    [("100/s", 100, 1), ("5/10m", 5, 600), ("1000 / hour", 1000, 3600)],
+)
+def test_rates(rate: str, capacity: int, period: int):
+    """GIVEN a rate
+    WHEN building a rate limiter
+    THEN its bucket capacity and refill period are read from it
+    """
+    limiter = RateLimiter(rate)
+
+    assert (limiter.capacity, limiter.period) == (capacity, period)
+
+
+@pytest.mark.parametrize("rate", ["100", "0/s", "1/0s", "1/week"])
+def test_invalid_rates(one_shot_app: Jeroboam, rate: str):
+    """GIVEN an invalid rate
+    WHEN registering a route
+    THEN a ValueError is raised
+    """
+    with pytest.raises(ValueError, match="rate_limit must look like"):
+
+        @one_shot_app.get("/limits/invalid", rate_limit=rate)
+        def invalid():
+            return {}
+
+
+def test_backends_must_implement_take():
+    """GIVEN the base rate limit backend
+    WHEN taking a token from it
+    THEN NotImplementedError is raised
+    """
+    with pytest.raises(NotImplementedError):
+        RateLimitBackend().take("key", 1, 1)
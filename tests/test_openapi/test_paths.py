@@ -1219,3 +1219,26 @@ def test_error_schemas(client: FlaskClient):
         return_schema["components"]["schemas"]["ValidationError"]  # type: ignore
         == target_schema["ValidationError"]  # type: ignore
     )
+
+
+def test_query_serialization_styles(client: FlaskClient):
+    """Non-default query styles are documented on their parameters."""
+    response = client.get("/openapi.json")
+    paths = response.json["paths"]
+    deep_object = paths["/query/deep_object"]["get"]["parameters"][0]
+    not_exploded = paths["/query/not_exploded"]["get"]["parameters"][0]
+    default_style = paths["/query/int"]["get"]["parameters"][0]
+    assert (deep_object["style"], deep_object["explode"]) == ("deepObject", True)
+    assert deep_object["schema"]["properties"]["tags"]["type"] == "array"
+    assert (not_exploded["style"], not_exploded["explode"]) == ("form", False)
+    assert "style" not in default_style
+    assert "explode" not in default_style
+
+
+def test_produced_media_types(client: FlaskClient):
+    """Every media type a route produces is documented on its response."""
+    response = client.get("/openapi.json")
+    paths = response.json["paths"]
+    content = paths["/produces/list"]["get"]["responses"]["200"]["content"]
+    assert list(content) == ["application/json", "text/csv", "application/x-ndjson"]
+    assert content["text/csv"] == content["application/json"]
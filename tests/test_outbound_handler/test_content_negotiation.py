@@ -0,0 +1,181 @@
+"""Testing Content Negotiation of Responses.
+
+The endpoints are defined in the app_test.apps.outbound.py module.
+"""
+
+import pytest
+from flask.testing import FlaskClient
+from pydantic import BaseModel
+
+from flask_jeroboam import encoders
+from flask_jeroboam.jeroboam import Jeroboam
+from tests.app_test.models.outbound import UserOut
+
+
+@pytest.mark.parametrize(
+    "accept,mimetype,data",
+    [
+        (None, "application/json", b'[{"username":"alice"},{"username":"bob"}]'),
+        ("*/*", "application/json", b'[{"username":"alice"},{"username":"bob"}]'),
+        ("text/csv", "text/csv", b"username\r\nalice\r\nbob\r\n"),
+        (
+            "text/csv;q=0.5, application/x-ndjson",
+            "application/x-ndjson",
+            b'{"username":"alice"}\n{"username":"bob"}\n',
+        ),
+        ("text/*", "text/csv", b"username\r\nalice\r\nbob\r\n"),
+    ],
+)
+def test_response_is_encoded_in_the_negotiated_media_type(
+    client: FlaskClient, accept: str | None, mimetype: str, data: bytes
+):
+    """GIVEN an endpoint producing several media types
+    WHEN hit with an Accept header
+    THEN the response is encoded in the best matching media type
+    """
+    headers = {"Accept": accept} if accept else {}
+    response = client.get("/produces/list", headers=headers)
+
+    assert response.status_code == 200
+    assert response.mimetype == mimetype
+    assert response.data == data
+    assert response.vary.as_set() == {"accept"}
+
+
+def test_unacceptable_media_type(client: FlaskClient):
+    """GIVEN an endpoint producing several media types
+    WHEN hit with an Accept header matching none of them
+    THEN it returns a 406
+    """
+    response = client.get("/produces/list", headers={"Accept": "application/xml"})
+
+    assert response.status_code == 406
+    assert response.json == {"message": "Not Acceptable"}
+
+
+@pytest.mark.parametrize(
+    "url,data",
+    [
+        ("/produces/single", b"username\r\nalice\r\n"),
+        ("/produces/empty", b""),
+    ],
+)
+def test_csv_of_single_item_and_empty_list(client: FlaskClient, url: str, data: bytes):
+    """GIVEN an endpoint producing CSV only
+    WHEN hit with any Accept header
+    THEN a single item is encoded as one row and an empty list as nothing
+    """
+    response = client.get(url, headers={"Accept": "*/*"})
+
+    assert response.mimetype == "text/csv"
+    assert response.data == data
+    assert "Vary" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "response_model,returned,data",
+    [
+        (list[int], [1, 2], b"value\r\n1\r\n2\r\n"),
+        (list[dict], [{"a": 1}, {"b": "x"}], b"a,b\r\n1,\r\n,x\r\n"),
+    ],
+)
+def test_csv_of_items_that_are_not_models(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    response_model: type,
+    returned: list,
+    data: bytes,
+):
+    """GIVEN an endpoint producing CSV, whose items are scalars or mappings
+    WHEN hit asking for CSV
+    THEN scalars go in a value column, and mappings under the union of their keys
+    """
+
+    @one_shot_app.get(
+        "/produces/items", response_model=response_model, produces=["text/csv"]
+    )
+    def items():
+        return returned
+
+    response = one_shot_client.get("/produces/items", headers={"Accept": "text/csv"})
+
+    assert response.status_code == 200
+    assert response.data == data
+
+
+def test_negotiation_is_memoized_per_accept_header(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """GIVEN an endpoint producing several media types
+    WHEN hit with new Accept headers
+    THEN their outcome is memoized, up to a maximum number of headers
+    """
+
+    @one_shot_app.get(
+        "/produces", response_model=UserOut, produces=["application/json", "text/csv"]
+    )
+    def produces():
+        return {"username": "alice"}
+
+    handler = one_shot_app.view_functions["produces"].__jeroboam_view__.outbound_handler  # type: ignore[attr-defined]
+
+    one_shot_client.get("/produces", headers={"Accept": "text/csv;q=0.9"})
+    assert handler._negotiated["text/csv;q=0.9"] == "text/csv"
+
+    monkeypatch.setattr(
+        "flask_jeroboam._outboundhandler.MAX_NEGOTIATED_ACCEPT_HEADERS", 0
+    )
+    response = one_shot_client.get("/produces", headers={"Accept": "text/csv;q=0.8"})
+    assert response.mimetype == "text/csv"
+    assert "text/csv;q=0.8" not in handler._negotiated
+
+
+def test_register_response_encoder(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """GIVEN a response encoder registered for a custom media type
+    WHEN a route producing it is hit
+    THEN the response is encoded by the registered encoder
+    """
+    monkeypatch.setattr(encoders, "response_encoders", dict(encoders.response_encoders))
+
+    def encode_reversed(validated: BaseModel) -> str:
+        assert isinstance(validated, UserOut)
+        return validated.username[::-1]
+
+    encoders.register_response_encoder("application/x-reversed", encode_reversed)
+
+    @one_shot_app.get(
+        "/reversed", response_model=UserOut, produces=["application/x-reversed"]
+    )
+    def reversed_():
+        return {"username": "alice"}
+
+    response = one_shot_client.get("/reversed")
+
+    assert response.mimetype == "application/x-reversed"
+    assert response.data == b"ecila"
+
+
+@pytest.mark.parametrize(
+    "options,message",
+    [
+        ({"produces": ["text/csv"], "response_model": None}, "requires"),
+        ({"produces": [], "response_model": UserOut}, "at least one"),
+        ({"produces": ["application/xml"], "response_model": UserOut}, "encoder"),
+    ],
+)
+def test_invalid_produces(one_shot_app: Jeroboam, options: dict, message: str):
+    """GIVEN an endpoint with an invalid produces option
+    WHEN registered
+    THEN it raises a ValueError
+    """
+    with pytest.raises(ValueError, match=message):
+
+        @one_shot_app.get("/invalid_produces", **options)
+        def invalid_produces():
+            return {}
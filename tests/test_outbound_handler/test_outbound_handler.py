@@ -8,6 +8,7 @@ from typing import Any
 import pytest
 from flask.testing import FlaskClient
 
+from flask_jeroboam.exceptions import ResponseValidationError
 from flask_jeroboam.jeroboam import Jeroboam
 from tests.app_test.models.outbound import SimpleModelOut
 
@@ -184,6 +185,39 @@ def test_wrong_dict_being_sent(
     assert response.data.startswith(b"InternalServerError")
 
 
+def test_response_validation_error_is_summarized_and_traced_lazily(
+    one_shot_app: Jeroboam,
+    one_shot_client: FlaskClient,
+):
+    """GIVEN an endpoint whose return value fails response validation
+    WHEN the ResponseValidationError reaches an error handler
+    THEN its trace is only formatted when read and a summary is available
+    """
+    caught: list[ResponseValidationError] = []
+
+    @one_shot_app.errorhandler(ResponseValidationError)
+    def record(error: ResponseValidationError):
+        caught.append(error)
+        return error.handle()
+
+    @one_shot_app.get("/invalid_return_value", response_model=SimpleModelOut)
+    def ping():
+        return {"total_count": "not_valid", "items": ["Apple", "Banana"]}
+
+    response = one_shot_client.get("/invalid_return_value")
+
+    assert response.status_code == 500
+    error = caught[0]
+    assert error._trace is None
+    assert error.trace.startswith("Traceback")
+    assert "ValidationError" in error.trace
+    assert error.summary == {
+        "model": "SimpleModelOut",
+        "error_count": 1,
+        "errors": [{"loc": ["total_count"], "type": "int_parsing"}],
+    }
+
+
 @pytest.mark.parametrize(
     "shape,status_code,headers",
     [
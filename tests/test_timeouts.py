@@ -0,0 +1,145 @@
+"""Testing Per-Route Execution Timeouts."""
+
+import asyncio
+import time
+
+import pytest
+from flask.testing import FlaskClient
+
+from flask_jeroboam.jeroboam import Jeroboam
+from flask_jeroboam.timeouts import check_deadline, current_deadline
+
+
+def test_async_views_are_cancelled_past_their_deadline(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an async route with a timeout
+    WHEN its view runs past the timeout
+    THEN it is cancelled and the request fails with a 504
+    """
+    cancelled = []
+
+    @one_shot_app.get("/timeouts/slow", timeout=0.05)
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return {}  # pragma: no cover
+
+    response = one_shot_client.get("/timeouts/slow")
+
+    assert response.status_code == 504
+    assert response.json == {"message": "Gateway Timeout"}
+    assert cancelled == [True]
+    assert one_shot_app.timed_out_requests == {"slow": 1}
+
+
+def test_async_views_within_their_deadline(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an async route with a timeout and a parameter
+    WHEN its view returns in time
+    THEN its response is served
+    """
+
+    @one_shot_app.get("/timeouts/fast", timeout=1)
+    async def fast(name: str):
+        return {"name": name, "deadline": current_deadline() is not None}
+
+    response = one_shot_client.get("/timeouts/fast?name=jeroboam")
+
+    assert response.json == {"name": "jeroboam", "deadline": True}
+    assert one_shot_app.timed_out_requests == {"fast": 0}
+
+
+def test_timeout_errors_of_async_views_are_their_own(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN an async route with a timeout
+    WHEN its view raises a TimeoutError of its own, before the deadline
+    THEN it is raised as is
+    """
+
+    @one_shot_app.get("/timeouts/upstream", timeout=1)
+    async def upstream():
+        raise asyncio.TimeoutError
+
+    with pytest.raises(TimeoutError):
+        one_shot_client.get("/timeouts/upstream")
+
+    assert one_shot_app.timed_out_requests == {"upstream": 0}
+
+
+def test_sync_views_can_check_their_deadline(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a sync route with a timeout, whose view checks its deadline
+    WHEN its view runs past the timeout
+    THEN it stops at the next check and the request fails with a 504
+    """
+    steps = []
+
+    @one_shot_app.get("/timeouts/batch", timeout=0.05)
+    def batch():
+        assert 0 < current_deadline().remaining <= 0.05
+        for step in range(100):
+            check_deadline()
+            steps.append(step)
+            time.sleep(0.01)
+        return {}  # pragma: no cover
+
+    response = one_shot_client.get("/timeouts/batch")
+
+    assert response.status_code == 504
+    assert 0 < len(steps) < 100
+    assert current_deadline() is None
+
+
+def test_sync_views_returning_late_fail(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a sync route with a timeout, whose view never checks its deadline
+    WHEN its view returns after the timeout
+    THEN the request fails with a 504
+    """
+
+    @one_shot_app.get("/timeouts/late", timeout=0.01)
+    def late():
+        time.sleep(0.02)
+        return {}
+
+    response = one_shot_client.get("/timeouts/late")
+
+    assert response.status_code == 504
+    assert one_shot_app.timed_out_requests == {"late": 1}
+
+
+def test_deadlines_are_only_set_on_routes_with_a_timeout(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a route without a timeout
+    WHEN its view checks its deadline
+    THEN there is none to miss
+    """
+
+    @one_shot_app.get("/timeouts/none")
+    def no_timeout():
+        check_deadline()
+        return {"deadline": current_deadline() is not None}
+
+    assert one_shot_client.get("/timeouts/none").json == {"deadline": False}
+    assert one_shot_app.timed_out_requests == {}
+
+
+def test_invalid_timeout(one_shot_app: Jeroboam):
+    """GIVEN a timeout that is not positive
+    WHEN registering a route
+    THEN a ValueError is raised
+    """
+    with pytest.raises(ValueError, match="timeout must be positive, not 0."):
+
+        @one_shot_app.get("/timeouts/invalid", timeout=0)
+        def invalid():
+            return {}
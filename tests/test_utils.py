@@ -7,18 +7,24 @@ import pytest
 from flask.testing import FlaskClient
 from pydantic import BaseModel, ValidationError
 from pydantic_core import PydanticUndefined
+from werkzeug.exceptions import RequestEntityTooLarge
 
 from flask_jeroboam import Body
 from flask_jeroboam._outboundhandler import OutboundHandler
 from flask_jeroboam._utils import (
     _lenient_issubclass,
     _rename_query_params_keys,
+    _solve_default_factory,
     _unwrap_optional,
     get_typed_return_annotation,
     is_sequence_field,
 )
 from flask_jeroboam.datastructures import UploadFile
 from flask_jeroboam.jeroboam import Jeroboam
+from flask_jeroboam.view_arguments._utils import (
+    _compile_subfields_plan,
+    _parse_urlencoded_fields,
+)
 from flask_jeroboam.view_arguments.arguments import (
     ArgumentLocation,
     BodyArgument,
@@ -88,6 +94,44 @@ def test_pascal_case_in_and_out_snake_case_without_transformer(
     assert any("Order must have at least 1 value" in e.get("msg", "") for e in errors)
 
 
+def test_key_transformer_runs_once_per_request(
+    one_shot_app: Jeroboam, one_shot_client: FlaskClient
+):
+    """GIVEN a query model with several sequence fields and a key transformer
+    WHEN a request leaves them all to the transformer
+    THEN the query string is transformed only once for that request
+    """
+    calls = []
+
+    def counting_transformer(app, inbound_dict):
+        calls.append(inbound_dict)
+        return _rename_query_params_keys(app, inbound_dict)
+
+    one_shot_app.query_string_key_transformer = counting_transformer
+
+    @one_shot_app.get("/query/counted", response_model=ModelWithListOut)
+    def read_items(payload: ModelWithListIn):
+        return payload
+
+    for _ in range(2):
+        response = one_shot_client.get(
+            "/query/counted?page=1&perPage=10&order[name]=asc&order[age]=desc"
+        )
+        assert response.status_code == 400  # no id[]
+    assert len(calls) == 2
+
+
+def test_rename_query_params_keys_default_pattern():
+    """Bracketed keys are grouped in a single pass; other keys are kept as is."""
+    assert _rename_query_params_keys(
+        None, {"page": "1", "id[]": "1", "order[name]": "asc", "order[age]": "desc"}
+    ) == {
+        "page": "1",
+        "id[]": "1",
+        "order[]": [{"name": "asc"}, {"age": "desc"}],
+    }
+
+
 def test_view_param_str_repr():
     """Test an internal function of ViewParameter."""
     param = Body("MyDefautValue")
@@ -143,6 +187,50 @@ def test_is_sequence_field_with_no_annotation():
     assert is_sequence_field(field) is False
 
 
+# --- _compile_subfields_plan ---
+
+
+def test_compile_subfields_plan():
+    """Aliases, names and sequence-ness of subfields are solved once."""
+    assert _compile_subfields_plan(ModelWithListIn.model_fields) == (
+        ("page", ("page",), False),
+        ("per_page", ("perPage", "per_page"), False),
+        ("ids", ("id[]", "ids"), True),
+        ("order", ("order[]", "order"), True),
+    )
+
+
+# --- _parse_urlencoded_fields ---
+
+
+def test_parse_urlencoded_fields_only_keeps_given_keys():
+    """Only the given keys are decoded, percent-encoded ones included."""
+    body = b"name=Jean+Val%C3%A9&skip=me&first%20name=Jean&tag=a&tag=b&flag"
+
+    parsed = _parse_urlencoded_fields(
+        body, frozenset({"name", "first name", "tag", "flag"})
+    )
+
+    assert list(parsed.items(multi=True)) == [
+        ("name", "Jean Valé"),
+        ("first name", "Jean"),
+        ("tag", "a"),
+        ("tag", "b"),
+        ("flag", ""),
+    ]
+
+
+def test_parse_urlencoded_fields_of_an_empty_body():
+    """An empty body has no fields."""
+    assert _parse_urlencoded_fields(b"", frozenset({"name"})) == {}
+
+
+def test_parse_urlencoded_fields_limits_field_count():
+    """Bodies with too many fields are rejected with a 413."""
+    with pytest.raises(RequestEntityTooLarge):
+        _parse_urlencoded_fields(b"a=1&b=2&c=3", frozenset({"a"}), max_fields=2)
+
+
 # --- ViewArgument.in_body ---
 
 
@@ -244,3 +332,33 @@ def test_adapt_datastructure_of_list():
 def test_lenient_issubclass_returns_false_on_non_class():
     """_lenient_issubclass returns False when issubclass would raise TypeError."""
     assert _lenient_issubclass(42, int) is False
+
+
+# --- _solve_default_factory ---
+
+
+def test_solve_default_factory_without_default():
+    """No default and no factory means there is nothing to fill in."""
+    assert _solve_default_factory(PydanticUndefined) is None
+
+
+def test_solve_default_factory_shares_immutable_defaults():
+    """Immutable defaults, including tuples of immutables, are shared."""
+    default = (1, "a", None)
+    assert _solve_default_factory(default)() is default
+    assert _solve_default_factory(42)() == 42
+
+
+def test_solve_default_factory_copies_mutable_defaults():
+    """Flat containers are shallow-copied, nested ones deep-copied."""
+    flat = {"a": 1}
+    nested = [[1]]
+    flat_copy = _solve_default_factory(flat)()
+    nested_copy = _solve_default_factory(nested)()
+    assert flat_copy == flat and flat_copy is not flat
+    assert nested_copy == nested and nested_copy[0] is not nested[0]
+
+
+def test_solve_default_factory_prefers_default_factory():
+    """A default_factory takes precedence over the default."""
+    assert _solve_default_factory(PydanticUndefined, list)() == []